@@ -0,0 +1,193 @@
+"""Benchmarks of the data io plugins."""
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import xarray as xr
+
+import glotaran
+from glotaran.io import load_dataset
+from glotaran.io import save_dataset
+
+SDT_DATA_FOLDER = Path(glotaran.__file__).parent / "builtin/io/sdt/test/data_files"
+
+
+class DataIo:
+    """Saving and loading of datasets with all plugins supporting both."""
+
+    params = (["nc", "ascii", "zarr"], [(200, 50), (2000, 500)])
+    param_names = ["format_name", "shape"]
+    timeout = 300
+
+    def setup(self, format_name, shape):
+        if format_name == "zarr" and find_spec("zarr") is None:
+            raise NotImplementedError
+        time_size, spectral_size = shape
+        self.dataset = xr.DataArray(
+            np.random.default_rng(0).normal(size=shape),
+            coords=[
+                ("time", np.linspace(-1, 20, time_size)),
+                ("spectral", np.linspace(400, 700, spectral_size)),
+            ],
+        )
+        if format_name != "ascii":
+            self.dataset = self.dataset.to_dataset(name="data")
+        self.directory = TemporaryDirectory()
+        self.saved_file = Path(self.directory.name) / f"saved.{format_name}"
+        self.file = Path(self.directory.name) / f"dataset.{format_name}"
+        save_dataset(self.dataset, self.file, format_name=format_name)
+
+    def teardown(self, format_name, shape):
+        self.directory.cleanup()
+
+    def time_save(self, format_name, shape):
+        save_dataset(self.dataset, self.saved_file, format_name=format_name, allow_overwrite=True)
+
+    def time_load(self, format_name, shape):
+        load_dataset(self.file, format_name=format_name)
+
+    def peakmem_load(self, format_name, shape):
+        load_dataset(self.file, format_name=format_name)
+
+
+class AsciiCache:
+    """Loading of an ascii file with the binary sidecar cache."""
+
+    params = [(200, 50), (2000, 500)]
+    param_names = ["shape"]
+    timeout = 300
+
+    def setup(self, shape):
+        try:
+            from glotaran.builtin.io.ascii.wavelength_time_explicit_file import (  # noqa: F401
+                read_explicit_file_cached,
+            )
+        except ImportError:
+            raise NotImplementedError
+        time_size, spectral_size = shape
+        dataset = xr.DataArray(
+            np.random.default_rng(0).normal(size=shape),
+            coords=[
+                ("time", np.linspace(-1, 20, time_size)),
+                ("spectral", np.linspace(400, 700, spectral_size)),
+            ],
+        )
+        self.directory = TemporaryDirectory()
+        self.file = Path(self.directory.name) / "dataset.ascii"
+        save_dataset(dataset, self.file)
+        load_dataset(self.file, prepare=False, cache=True)
+
+    def teardown(self, shape):
+        self.directory.cleanup()
+
+    def time_load_cached(self, shape):
+        load_dataset(self.file, prepare=False, cache=True)
+
+
+class AsciiGzip:
+    """Saving and loading of a gzip compressed ascii file."""
+
+    params = [(200, 50), (2000, 500)]
+    param_names = ["shape"]
+    timeout = 300
+
+    def setup(self, shape):
+        try:
+            from glotaran.builtin.io.ascii.wavelength_time_explicit_file import (  # noqa: F401
+                open_explicit_file,
+            )
+        except ImportError:
+            raise NotImplementedError
+        time_size, spectral_size = shape
+        self.dataset = xr.DataArray(
+            np.random.default_rng(0).normal(size=shape),
+            coords=[
+                ("time", np.linspace(-1, 20, time_size)),
+                ("spectral", np.linspace(400, 700, spectral_size)),
+            ],
+        )
+        self.directory = TemporaryDirectory()
+        self.saved_file = Path(self.directory.name) / "saved.ascii.gz"
+        self.file = Path(self.directory.name) / "dataset.ascii.gz"
+        save_dataset(self.dataset, self.file, format_name="ascii")
+
+    def teardown(self, shape):
+        self.directory.cleanup()
+
+    def time_save(self, shape):
+        save_dataset(self.dataset, self.saved_file, format_name="ascii", allow_overwrite=True)
+
+    def time_load(self, shape):
+        load_dataset(self.file, format_name="ascii")
+
+
+class SdtIo:
+    """Loading of data from a Becker & Hickl sdt file."""
+
+    def setup(self):
+        self.temporal_file = SDT_DATA_FOLDER / "temporal.sdt"
+        if not self.temporal_file.is_file():
+            raise NotImplementedError
+        self.index = [1]
+
+    def time_load_temporal(self):
+        load_dataset(self.temporal_file, index=self.index)
+
+
+class FlimIo:
+    """Loading of FLIM data from a Becker & Hickl sdt file."""
+
+    params = [False, True]
+    param_names = ["memory_map"]
+
+    def setup(self, memory_map):
+        self.flim_file = SDT_DATA_FOLDER / "FLIM.sdt"
+        if not self.flim_file.is_file():
+            raise NotImplementedError
+        self.load_kwargs = {"flim": True}
+        if memory_map:
+            self.load_kwargs["memory_map"] = True
+        try:
+            load_dataset(self.flim_file, **self.load_kwargs)
+        except Exception:
+            # Older versions fail to calculate the intensity map or have no memory_map option
+            raise NotImplementedError
+
+    def time_load_flim(self, memory_map):
+        load_dataset(self.flim_file, **self.load_kwargs)
+
+    def peakmem_load_flim(self, memory_map):
+        load_dataset(self.flim_file, **self.load_kwargs)
+
+
+class Svd:
+    """SVD of a low rank 4000x1000 data matrix with the supported methods."""
+
+    params = ["full", "truncated", "randomized"]
+    param_names = ["method"]
+    timeout = 300
+
+    def setup(self, method):
+        try:
+            from glotaran.io.prepare_dataset import calculate_svd
+        except ImportError:
+            raise NotImplementedError
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(size=(4000, 6)) @ rng.normal(size=(6, 1000))
+        self.data += 1e-2 * rng.normal(size=self.data.shape)
+        self.calculate_svd = calculate_svd
+        self.number_of_components = None if method == "full" else 10
+
+    def time_calculate_svd(self, method):
+        self.calculate_svd(
+            self.data,
+            method=method,
+            number_of_components=self.number_of_components,
+            use_cache=False,
+        )
+
+    def time_calculate_svd_cached(self, method):
+        self.calculate_svd(
+            self.data, method=method, number_of_components=self.number_of_components
+        )
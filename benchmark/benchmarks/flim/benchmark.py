@@ -0,0 +1,76 @@
+"""Benchmarks of the pixel-parallel FLIM analysis."""
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from glotaran.io import load_model
+from glotaran.io import load_parameters
+from glotaran.project import Scheme
+from glotaran.simulation import simulate
+
+MODEL = """
+default_megacomplex: decay-parallel
+megacomplex:
+  mc:
+    compartments: [s1, s2]
+    rates: [rates.1, rates.2]
+irf:
+  irf1:
+    type: gaussian
+    center: irf.center
+    width: irf.width
+dataset:
+  flim:
+    megacomplex: [mc]
+    irf: irf1
+"""
+
+PARAMETERS = """
+rates: [0.5, 0.1]
+irf:
+  - [center, 1.0, {vary: false}]
+  - [width, 0.2, {vary: false}]
+"""
+
+
+class Flim:
+    """Amplitudes of all pixels of a simulated square FLIM image with 256 time points."""
+
+    params = [32, 128]
+    param_names = ["image_size"]
+    timeout = 300
+
+    def setup(self, image_size):
+        try:
+            from glotaran.optimization.flim import optimize_flim
+        except ImportError:
+            raise NotImplementedError
+
+        self.optimize_flim = optimize_flim
+        model = load_model(MODEL, format_name="yml_str")
+        parameters = load_parameters(PARAMETERS, format_name="yml_str")
+        time_axis = np.linspace(0, 25, 256)
+        decays = simulate(
+            model,
+            "flim",
+            parameters,
+            {"time": time_axis, "pixel": np.arange(2)},
+            clp=xr.DataArray(np.eye(2), coords=[("pixel", [0, 1]), ("clp_label", ["s1", "s2"])]),
+        ).data.transpose("time", "pixel")
+        amplitudes = np.random.default_rng(0).uniform(10, 100, size=(2, image_size**2))
+        x, y = np.meshgrid(np.arange(image_size), np.arange(image_size), indexing="ij")
+        data = xr.DataArray(
+            decays.values @ amplitudes,
+            coords={
+                "time": time_axis,
+                "pixel": pd.MultiIndex.from_arrays([x.ravel(), y.ravel()], names=["x", "y"]),
+            },
+            dims=("time", "pixel"),
+        )
+        self.scheme = Scheme(model, parameters, {"flim": data.to_dataset(name="data")})
+
+    def time_optimize_flim(self, image_size):
+        self.optimize_flim(self.scheme)
+
+    def peakmem_optimize_flim(self, image_size):
+        self.optimize_flim(self.scheme)
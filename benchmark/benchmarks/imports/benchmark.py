@@ -0,0 +1,20 @@
+"""Benchmarks of the import time of the public entry points."""
+
+
+class ImportTime:
+    """Import time in a fresh interpreter."""
+
+    params = [
+        "import glotaran",
+        "import glotaran.io",
+        "import glotaran.project",
+        "from glotaran.parameter import Parameters",
+        "from glotaran.simulation import simulate",
+        "from glotaran.optimization import optimize",
+        "from glotaran.cli.main import main",
+    ]
+    param_names = ["statement"]
+    timeout = 120
+
+    def timeraw_import(self, statement):
+        return statement
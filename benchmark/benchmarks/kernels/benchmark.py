@@ -0,0 +1,214 @@
+"""Benchmarks of the matrix kernels of the builtin megacomplexes."""
+import numpy as np
+
+try:
+    from glotaran.builtin.megacomplexes.coherent_artifact.coherent_artifact_megacomplex import (
+        calculate_coherent_artifact_matrix,
+    )
+    from glotaran.builtin.megacomplexes.damped_oscillation.damped_oscillation_megacomplex import (
+        calculate_damped_oscillation_matrix_gaussian_irf,
+    )
+    from glotaran.builtin.megacomplexes.damped_oscillation.damped_oscillation_megacomplex import (
+        calculate_damped_oscillation_matrix_no_irf,
+    )
+    from glotaran.builtin.megacomplexes.decay.decay_matrix_gaussian_irf import (
+        calculate_decay_matrix_gaussian_irf,
+    )
+    from glotaran.builtin.megacomplexes.decay.k_matrix import KMatrix
+    from glotaran.builtin.megacomplexes.decay.util import calculate_decay_matrix_no_irf
+    from glotaran.builtin.megacomplexes.spectral.shape import SpectralShapeGaussian
+    from glotaran.builtin.megacomplexes.spectral.shape import SpectralShapeSkewedGaussian
+    from glotaran.parameter import Parameter
+
+    KERNELS_AVAILABLE = True
+except ImportError:
+    # The kernel signatures changed in 0.8.0
+    KERNELS_AVAILABLE = False
+
+MODEL_SIZES = [200, 2000]
+GLOBAL_SIZES = [1, 100, 500]
+
+
+def _require_kernels():
+    if not KERNELS_AVAILABLE:
+        raise NotImplementedError
+
+
+class DecayKernels:
+    """Decay matrix without irf and with an (index dependent) gaussian irf."""
+
+    params = (MODEL_SIZES, GLOBAL_SIZES, [3, 10])
+    param_names = ["model_size", "global_size", "nr_rates"]
+
+    def setup(self, model_size, global_size, nr_rates):
+        _require_kernels()
+        self.rates = np.geomspace(5, 0.01, nr_rates)
+        self.times = np.linspace(-1, 100, model_size)
+        self.centers = np.linspace(0.2, 0.4, global_size)[:, np.newaxis].copy()
+        self.widths = np.full((global_size, 1), 0.1)
+        self.scales = np.ones(1)
+        self.matrix = np.zeros((global_size, model_size, nr_rates))
+        self.matrix_no_irf = np.zeros((model_size, nr_rates))
+        self.time_gaussian_irf(model_size, global_size, nr_rates)
+        self.time_no_irf(model_size, global_size, nr_rates)
+
+    def time_no_irf(self, model_size, global_size, nr_rates):
+        calculate_decay_matrix_no_irf(self.matrix_no_irf, self.rates, self.times)
+
+    def time_gaussian_irf(self, model_size, global_size, nr_rates):
+        calculate_decay_matrix_gaussian_irf(
+            self.matrix,
+            self.rates,
+            self.times,
+            self.centers,
+            self.widths,
+            self.scales,
+            False,
+            0.0,
+            False,
+        )
+
+    def time_gaussian_irf_fast_erfcx(self, model_size, global_size, nr_rates):
+        calculate_decay_matrix_gaussian_irf(
+            self.matrix,
+            self.rates,
+            self.times,
+            self.centers,
+            self.widths,
+            self.scales,
+            False,
+            0.0,
+            True,
+        )
+
+    def peakmem_gaussian_irf(self, model_size, global_size, nr_rates):
+        self.time_gaussian_irf(model_size, global_size, nr_rates)
+
+
+class DampedOscillationKernels:
+    """Damped oscillation matrix without irf and with a gaussian irf."""
+
+    params = (MODEL_SIZES, GLOBAL_SIZES, [2, 10])
+    param_names = ["model_size", "global_size", "nr_oscillations"]
+
+    def setup(self, model_size, global_size, nr_oscillations):
+        _require_kernels()
+        self.frequencies = np.linspace(10, 300, nr_oscillations) * 0.03 * 2 * np.pi
+        self.rates = np.linspace(0.5, 2, nr_oscillations)
+        self.times = np.linspace(-1, 10, model_size)
+        self.centers = np.linspace(0.2, 0.4, global_size)[:, np.newaxis].copy()
+        self.widths = np.full((global_size, 1), 0.1)
+        self.scales = np.ones(1)
+        self.matrix = np.ones((global_size, model_size, 2 * nr_oscillations))
+        self.time_gaussian_irf(model_size, global_size, nr_oscillations)
+        self.time_no_irf(model_size, global_size, nr_oscillations)
+
+    def time_no_irf(self, model_size, global_size, nr_oscillations):
+        calculate_damped_oscillation_matrix_no_irf(
+            self.matrix[0], self.frequencies, self.rates, self.times
+        )
+
+    def time_gaussian_irf(self, model_size, global_size, nr_oscillations):
+        calculate_damped_oscillation_matrix_gaussian_irf(
+            self.matrix,
+            self.frequencies,
+            self.rates,
+            self.times,
+            self.centers,
+            self.widths,
+            self.scales,
+        )
+
+    def peakmem_gaussian_irf(self, model_size, global_size, nr_oscillations):
+        self.time_gaussian_irf(model_size, global_size, nr_oscillations)
+
+
+class CoherentArtifactKernel:
+    """Coherent artifact matrix with derivatives of the irf."""
+
+    params = (MODEL_SIZES, GLOBAL_SIZES, [1, 3])
+    param_names = ["model_size", "global_size", "order"]
+
+    def setup(self, model_size, global_size, order):
+        _require_kernels()
+        self.times = np.linspace(-1, 10, model_size)
+        self.centers = np.linspace(0.2, 0.4, global_size)
+        self.widths = np.full(global_size, 0.1)
+        self.matrix = np.zeros((global_size, model_size, order))
+        self.time_coherent_artifact(model_size, global_size, order)
+
+    def time_coherent_artifact(self, model_size, global_size, order):
+        calculate_coherent_artifact_matrix(
+            self.matrix, self.centers, self.widths, self.times, order
+        )
+
+
+class SpectralShapes:
+    """Batched evaluation of spectral shapes."""
+
+    params = ([100, 1000, 10000], [3, 50])
+    param_names = ["spectral_size", "nr_shapes"]
+
+    def setup(self, spectral_size, nr_shapes):
+        _require_kernels()
+        self.axis = np.linspace(400, 700, spectral_size)
+        locations = np.linspace(450, 650, nr_shapes)
+        self.gaussians = [
+            SpectralShapeGaussian(
+                label=f"shape_{i}",
+                amplitude=Parameter(label="amplitude", value=1.0),
+                location=Parameter(label="location", value=location),
+                width=Parameter(label="width", value=40.0),
+            )
+            for i, location in enumerate(locations)
+        ]
+        self.skewed_gaussians = [
+            SpectralShapeSkewedGaussian(
+                label=f"shape_{i}",
+                location=Parameter(label="location", value=location),
+                width=Parameter(label="width", value=40.0),
+                skewness=Parameter(label="skewness", value=0.3),
+            )
+            for i, location in enumerate(locations)
+        ]
+
+    def time_gaussian(self, spectral_size, nr_shapes):
+        SpectralShapeGaussian.calculate_batch(self.gaussians, self.axis)
+
+    def time_skewed_gaussian(self, spectral_size, nr_shapes):
+        SpectralShapeSkewedGaussian.calculate_batch(self.skewed_gaussians, self.axis)
+
+
+class KMatrixDecomposition:
+    """Eigen decomposition and A-matrix of K-matrices."""
+
+    params = [3, 10, 30]
+    param_names = ["nr_compartments"]
+
+    def setup(self, nr_compartments):
+        _require_kernels()
+        self.compartments = [f"s{i}" for i in range(nr_compartments)]
+        self.rates = np.geomspace(5, 0.01, nr_compartments)
+        self.k_matrix = self._create_k_matrix(0)
+
+    def _create_k_matrix(self, offset):
+        matrix = {
+            (self.compartments[i + 1], self.compartments[i]): Parameter(
+                label=f"k{i}", value=rate + offset
+            )
+            for i, rate in enumerate(self.rates[:-1])
+        }
+        matrix[(self.compartments[-1], self.compartments[-1])] = Parameter(
+            label="k_last", value=self.rates[-1] + offset
+        )
+        return KMatrix(label="k", matrix=matrix)
+
+    def time_a_matrix_general(self, nr_compartments):
+        # new parameter values every call, to not only measure the memoization
+        k_matrix = self._create_k_matrix(np.random.uniform(0, 1e-3))
+        initial_concentration = np.zeros(nr_compartments)
+        initial_concentration[0] = 1
+        k_matrix.a_matrix_general(self.compartments, initial_concentration)
+
+    def time_a_matrix_sequential(self, nr_compartments):
+        self.k_matrix.a_matrix_sequential(self.compartments)
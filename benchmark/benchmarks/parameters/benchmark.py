@@ -0,0 +1,58 @@
+"""Benchmarks of the parameter handling."""
+import numpy as np
+
+from glotaran.parameter import Parameters
+
+
+class ParameterAccess:
+    """Getting and setting parameters as done in every function evaluation."""
+
+    params = [10, 100, 1000]
+    param_names = ["nr_parameters"]
+
+    def setup(self, nr_parameters):
+        self.parameters = Parameters.from_dict(
+            {"group": [[f"p{i}", float(i + 1)] for i in range(nr_parameters)]}
+        )
+        self.labels, self.values, _, _ = self.parameters.get_label_value_and_bounds_arrays(
+            exclude_non_vary=True
+        )
+
+    def time_get(self, nr_parameters):
+        for label in self.labels:
+            self.parameters.get(label)
+
+    def time_get_label_value_and_bounds_arrays(self, nr_parameters):
+        self.parameters.get_label_value_and_bounds_arrays(exclude_non_vary=True)
+
+    def time_set_from_label_and_value_arrays(self, nr_parameters):
+        self.parameters.set_from_label_and_value_arrays(self.labels, self.values)
+
+    def time_copy(self, nr_parameters):
+        self.parameters.copy()
+
+
+class ParameterExpressions:
+    """Updating parameters defined by expressions."""
+
+    params = [10, 100, 1000]
+    param_names = ["nr_expressions"]
+
+    def setup(self, nr_expressions):
+        self.parameters = Parameters.from_dict(
+            {
+                "base": [["a", 2.0], ["b", 3.0]],
+                "derived": [
+                    [f"p{i}", {"expr": f"$base.a * {i} + exp(-$base.b)"}]
+                    for i in range(nr_expressions)
+                ],
+            }
+        )
+        self.labels, self.values, _, _ = self.parameters.get_label_value_and_bounds_arrays(
+            exclude_non_vary=True
+        )
+
+    def time_update_parameter_expression(self, nr_expressions):
+        self.parameters.set_from_label_and_value_arrays(
+            self.labels, self.values * np.random.uniform(0.9, 1.1)
+        )
@@ -0,0 +1,34 @@
+"""Benchmarks of the matrix and estimation providers."""
+from benchmarks.schemes import SCHEME_KINDS
+from benchmarks.schemes import create_scheme
+
+from glotaran.optimization.optimization_group import OptimizationGroup
+
+
+class Providers:
+    """Matrix and estimation providers for linked, unlinked and full model dataset groups."""
+
+    params = (SCHEME_KINDS, [200, 2000], [50, 500])
+    param_names = ["kind", "time_size", "spectral_size"]
+    timeout = 300
+
+    def setup(self, kind, time_size, spectral_size):
+        scheme = create_scheme(kind, time_size, spectral_size)
+        scheme.add_svd = False
+        self.parameters = scheme.parameters
+        self.optimization_group = OptimizationGroup(
+            scheme, scheme.model.get_dataset_groups()["default"]
+        )
+        self.optimization_group.calculate(self.parameters)
+
+    def time_matrix_provider(self, kind, time_size, spectral_size):
+        self.optimization_group._matrix_provider.calculate()
+
+    def time_estimation_provider(self, kind, time_size, spectral_size):
+        self.optimization_group._estimation_provider.estimate()
+
+    def time_calculate(self, kind, time_size, spectral_size):
+        self.optimization_group.calculate(self.parameters)
+
+    def peakmem_calculate(self, kind, time_size, spectral_size):
+        self.optimization_group.calculate(self.parameters)
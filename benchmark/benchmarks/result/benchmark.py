@@ -0,0 +1,122 @@
+"""Benchmarks of the result creation."""
+from benchmarks.schemes import SCHEME_KINDS
+from benchmarks.schemes import create_scheme
+
+from glotaran.optimization.optimizer import Optimizer
+
+
+class ResultCreation:
+    """Creation of the result after an optimization."""
+
+    params = (SCHEME_KINDS, [200, 2000], [50, 500])
+    param_names = ["kind", "time_size", "spectral_size"]
+    timeout = 300
+
+    def setup(self, kind, time_size, spectral_size):
+        scheme = create_scheme(kind, time_size, spectral_size)
+        scheme.maximum_number_function_evaluations = 1
+        self.optimizer = Optimizer(scheme, verbose=False)
+        self.optimizer.optimize()
+
+    def time_create_result(self, kind, time_size, spectral_size):
+        self.optimizer.create_result()
+
+    def peakmem_create_result(self, kind, time_size, spectral_size):
+        self.optimizer.create_result()
+
+
+class LazyResultCreation(ResultCreation):
+    """Creation of the result with derived variables calculated on first access."""
+
+    def setup(self, kind, time_size, spectral_size):
+        scheme = create_scheme(kind, time_size, spectral_size)
+        scheme.maximum_number_function_evaluations = 1
+        try:
+            self.optimizer = Optimizer(scheme, verbose=False, lazy_result_data=True)
+        except TypeError:
+            # Versions without lazy result data
+            raise NotImplementedError
+        self.optimizer.optimize()
+
+
+class ResultSaving:
+    """Saving of a result with many datasets."""
+
+    params = ([1, None], [None, 4])
+    param_names = ["number_of_threads", "data_compression_level"]
+    timeout = 300
+
+    def setup(self, number_of_threads, data_compression_level):
+        import tempfile
+
+        from glotaran.io import SavingOptions
+        from glotaran.testing.simulated_data.synthetic_scheme import generate_synthetic_scheme
+
+        try:
+            self.saving_options = SavingOptions(
+                number_of_threads=number_of_threads,
+                data_compression_level=data_compression_level,
+            )
+        except TypeError:
+            # Versions without parallel and compressed saving
+            raise NotImplementedError
+        scheme = generate_synthetic_scheme(
+            time_size=200, spectral_size=50, nr_datasets=40, link_clp=False
+        ).scheme
+        scheme.maximum_number_function_evaluations = 1
+        optimizer = Optimizer(scheme, verbose=False)
+        optimizer.optimize()
+        self.result = optimizer.create_result()
+        self.result_folder = tempfile.TemporaryDirectory()
+
+    def teardown(self, number_of_threads, data_compression_level):
+        self.result_folder.cleanup()
+
+    def time_save_result(self, number_of_threads, data_compression_level):
+        from glotaran.io import save_result
+
+        save_result(
+            self.result,
+            f"{self.result_folder.name}/result.yml",
+            saving_options=self.saving_options,
+            allow_overwrite=True,
+        )
+
+
+class ResultLoading:
+    """Loading the metadata and parameters of a saved result with many datasets."""
+
+    params = [True, False]
+    param_names = ["lazy"]
+    timeout = 300
+
+    def setup(self, lazy):
+        import tempfile
+
+        from glotaran.io import load_result
+        from glotaran.io import save_result
+        from glotaran.testing.simulated_data.synthetic_scheme import generate_synthetic_scheme
+
+        scheme = generate_synthetic_scheme(
+            time_size=200, spectral_size=50, nr_datasets=40, link_clp=False
+        ).scheme
+        scheme.maximum_number_function_evaluations = 1
+        optimizer = Optimizer(scheme, verbose=False)
+        optimizer.optimize()
+        self.result_folder = tempfile.TemporaryDirectory()
+        self.result_path = f"{self.result_folder.name}/result.yml"
+        save_result(optimizer.create_result(), self.result_path)
+        try:
+            load_result(self.result_path, lazy=lazy)
+        except TypeError:
+            # Versions without lazy result loading
+            raise NotImplementedError
+
+    def teardown(self, lazy):
+        self.result_folder.cleanup()
+
+    def time_load_result(self, lazy):
+        from glotaran.io import load_result
+
+        result = load_result(self.result_path, lazy=lazy)
+        result.chi_square, result.optimized_parameters.to_dataframe()
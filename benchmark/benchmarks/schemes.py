@@ -0,0 +1,59 @@
+"""Schemes of configurable size shared by the benchmarks."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from glotaran.project import Scheme
+
+SCHEME_KINDS = ["linked", "unlinked", "full_model"]
+
+
+def create_scheme(kind: str, time_size: int, spectral_size: int) -> Scheme:
+    """Create a scheme with two datasets for the benchmarks.
+
+    Raises ``NotImplementedError`` for glotaran versions without the synthetic scheme
+    generator, so asv skips the benchmark instead of failing.
+    """
+    try:
+        from glotaran.testing.simulated_data.synthetic_scheme import generate_synthetic_scheme
+    except ImportError as error:
+        raise NotImplementedError from error
+
+    if kind == "full_model":
+        return _create_full_model_scheme(time_size, spectral_size)
+    return generate_synthetic_scheme(
+        time_size=time_size,
+        spectral_size=spectral_size,
+        nr_datasets=2,
+        link_clp=kind == "linked",
+    ).scheme
+
+
+def _create_full_model_scheme(time_size: int, spectral_size: int) -> Scheme:
+    """Create a scheme with a spectral global model."""
+    import numpy as np
+
+    from glotaran.project import Scheme
+    from glotaran.project.generators import generate_model
+    from glotaran.simulation import simulate
+    from glotaran.testing.simulated_data.shared_decay import SIMULATION_PARAMETERS
+
+    model = generate_model(
+        generator_name="spectral_decay_sequential",
+        generator_arguments={"nr_compartments": 3, "irf": True},
+    )
+    coordinates = {
+        "time": np.linspace(-1, 20, time_size),
+        "spectral": np.linspace(600, 700, spectral_size),
+    }
+    dataset = simulate(
+        model,
+        "dataset_1",
+        SIMULATION_PARAMETERS,
+        coordinates,
+        noise=True,
+        noise_std_dev=1e-2,
+        noise_seed=0,
+    )
+    return Scheme(model=model, parameters=SIMULATION_PARAMETERS, data={"dataset_1": dataset})
@@ -0,0 +1,20 @@
+"""Pytest configuration shared by all tests."""
+from __future__ import annotations
+
+import os
+from tempfile import TemporaryDirectory
+
+_plugin_cache_dir: TemporaryDirectory | None = None
+
+
+def pytest_configure():
+    """Keep the plugin metadata cache of the test session out of the users cache folder."""
+    global _plugin_cache_dir
+    _plugin_cache_dir = TemporaryDirectory(prefix="glotaran-plugin-cache-")
+    os.environ["GLOTARAN_PLUGIN_CACHE"] = os.path.join(_plugin_cache_dir.name, "plugin_cache.json")
+
+
+def pytest_unconfigure():
+    """Remove the plugin metadata cache of the test session."""
+    if _plugin_cache_dir is not None:
+        _plugin_cache_dir.cleanup()
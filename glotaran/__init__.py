@@ -1,8 +1,5 @@
 """Glotaran package root."""
 from glotaran.deprecation.deprecation_utils import deprecate_submodule
-from glotaran.plugin_system.base_registry import load_plugins
-
-load_plugins()
 
 __version__ = "0.8.0.dev0"
 
@@ -1,9 +1,19 @@
+import io
+import shutil
 from pathlib import Path
 
 import numpy as np
+import pytest
 import xarray as xr
 
+from glotaran.builtin.io.ascii import wavelength_time_explicit_file as explicit_file_module
+from glotaran.builtin.io.ascii.wavelength_time_explicit_file import DataFileType
 from glotaran.builtin.io.ascii.wavelength_time_explicit_file import ExplicitFile
+from glotaran.builtin.io.ascii.wavelength_time_explicit_file import explicit_file_cache_path
+from glotaran.builtin.io.ascii.wavelength_time_explicit_file import format_data_rows
+from glotaran.builtin.io.ascii.wavelength_time_explicit_file import parse_data_block
+from glotaran.io import load_dataset
+from glotaran.io import save_dataset
 
 DATA_DIR = Path(__file__).parent
 TEST_FILE_ASCII = DATA_DIR.joinpath("data.ascii")
@@ -38,3 +48,113 @@ def test_write_explicit_file(tmp_path):
     test_data_file_write.write(comment="written \n in \n test.", overwrite=True)
     test_dataarray_reread = test_data_file_write.read(prepare=False)
     assert np.array_equal(test_dataarray_read.values, test_dataarray_reread.values)
+
+
+def test_read_explicit_file_in_blocks(monkeypatch: pytest.MonkeyPatch):
+    """Reading in small blocks gives the same result as reading at once."""
+    expected = ExplicitFile(TEST_FILE_ASCII).read(prepare=False)
+    monkeypatch.setattr(explicit_file_module, "ASCII_READ_BLOCK_SIZE", 1000)
+
+    result = ExplicitFile(TEST_FILE_ASCII).read(prepare=False)
+
+    assert result.equals(expected)
+    assert result.values.flags.owndata is False
+
+
+def test_read_explicit_file_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Cache is used as long as the file content doesn't change."""
+    file_path = tmp_path / "data.ascii"
+    shutil.copy(TEST_FILE_ASCII, file_path)
+    cache_path = explicit_file_cache_path(file_path)
+    expected = load_dataset(file_path)
+
+    assert load_dataset(file_path, cache=True).equals(expected)
+    assert cache_path.is_file()
+
+    with monkeypatch.context() as context:
+        context.setattr(explicit_file_module, "read_explicit_file", None)
+        assert load_dataset(file_path, cache=True).equals(expected)
+
+    content = file_path.read_text().splitlines(keepends=True)
+    file_path.write_text("".join(content[:-1]))
+    changed = load_dataset(file_path, cache=True)
+
+    assert changed.data.shape == (expected.data.shape[0], expected.data.shape[1] - 1)
+    assert changed.equals(load_dataset(file_path))
+
+
+@pytest.mark.parametrize(
+    "block, error_message",
+    (
+        (b"1 2\n3\n", "Each data row needs to contain 2 values"),
+        (b"1 2 3\n4\n", "Each data row needs to contain 2 values"),
+        (b"1 2\n3 4 5\n6\n", "Each data row needs to contain 2 values"),
+        (b"1 2\nfoo 4\n", "Data contain values which are not numbers"),
+    ),
+)
+def test_parse_data_block_errors(block: bytes, error_message: str):
+    """Raise error on rows with the wrong number of values or text."""
+    with pytest.raises(ValueError, match=error_message):
+        parse_data_block(block, 2)
+
+
+def test_parse_data_block_blank_lines():
+    """Blank lines are skipped."""
+    assert parse_data_block(b"\n1 2\n\n3 4", 2).tolist() == [[1, 2], [3, 4]]
+    assert parse_data_block(b" \n", 2).shape == (0, 2)
+
+
+SPECIAL_VALUES = [
+    0.0,
+    -0.0,
+    np.nan,
+    np.inf,
+    -np.inf,
+    5e-324,
+    2.2250738585072014e-308,
+    1.7976931348623157e308,
+    1e22,
+    1e23,
+    0.5,
+    9.99999999995,
+    9.999999999949999,
+    -123456789012.5,
+    0.1,
+    0.3,
+]
+
+
+@pytest.mark.parametrize("number_format", ("%.10e", "%.0e", "%.3e", "%.11e", "%.13e", "%.4f"))
+def test_format_data_rows(number_format: str):
+    """Formatted rows are the same as with np.savetxt."""
+    rng = np.random.default_rng(0)
+    rows = np.concatenate(
+        [
+            rng.normal(size=(20, 8)),
+            (rng.normal(size=(20, 8)) * 10.0 ** rng.integers(-300, 300, size=(20, 8))),
+            np.reshape(SPECIAL_VALUES, (2, 8)),
+        ]
+    )
+    expected = io.BytesIO()
+    np.savetxt(expected, rows, fmt=number_format, delimiter="\t", newline="\n")
+
+    assert format_data_rows(rows, number_format) == expected.getvalue()
+
+
+@pytest.mark.parametrize("file_format", DataFileType)
+@pytest.mark.parametrize("file_name", ("test.ascii", "test.ascii.gz"))
+def test_write_explicit_file_in_blocks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, file_format: DataFileType, file_name: str
+):
+    """Writing in small blocks and with gzip compression gives the same data."""
+    expected = load_dataset(TEST_FILE_ASCII, prepare=False).data
+    monkeypatch.setattr(explicit_file_module, "ASCII_WRITE_BLOCK_SIZE", 1000)
+    file_path = tmp_path / file_name
+
+    save_dataset(expected, file_path, format_name="ascii", file_format=file_format)
+    monkeypatch.setattr(explicit_file_module, "ASCII_READ_BLOCK_SIZE", 1000)
+    result = load_dataset(file_path, format_name="ascii", prepare=False).data
+
+    assert result.equals(expected)
+    if file_name.endswith(".gz"):
+        assert file_path.read_bytes()[:2] == b"\x1f\x8b"
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import math
 import os.path
 import re
 from enum import Enum
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from warnings import catch_warnings
+from warnings import simplefilter
 from warnings import warn
 
 import numpy as np
-import pandas as pd
 import xarray as xr
 
 from glotaran.io import DataIoInterface
 from glotaran.io import register_data_io
 from glotaran.io.prepare_dataset import prepare_time_trace_dataset
+from glotaran.utils.jit import jit_kernel
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
+    from glotaran.typing.types import StrOrPath
+
+ASCII_READ_BLOCK_SIZE = 2**24
+"""Number of bytes of an ascii file which are parsed at once."""
+ASCII_CACHE_VERSION = 1
+"""Version of the binary cache format of ascii files."""
+ASCII_WRITE_BLOCK_SIZE = 2**20
+"""Number of values which are formatted at once when writing an ascii file."""
+FAST_FORMAT_MAX_PRECISION = 11
+"""Largest precision of ``%.<precision>e`` number formats supported by the fast formatter."""
 
 
 class DataFileType(Enum):
@@ -34,7 +56,7 @@ class ExplicitFile:
         self._comment = ""
         absfilepath = os.path.realpath(filepath)
         if dataset is not None:
-            self._observations = np.array(dataset.values).T
+            self._observations = np.asarray(dataset.values).T
             self._times = np.array(dataset.coords["time"])
             self._spectral_indices = np.array(dataset.coords["spectral"])
             self._file = filepath
@@ -69,9 +91,14 @@ class ExplicitFile:
         comment="",
         file_format=DataFileType.time_explicit,
         number_format="%.10e",
+        compression_level=1,
     ):
-        # TODO: write a more elegant method
+        """Write the data to ``self._file``, which is gzip compressed if it ends with ``.gz``.
 
+        The rows are formatted and written in blocks of ``ASCII_WRITE_BLOCK_SIZE`` values
+        (see :func:`format_data_rows`), so the text of the whole file is never in memory.
+        The content is the same as with :func:`numpy.savetxt`.
+        """
         if os.path.isfile(self._file) and not overwrite:
             raise FileExistsError(f"File already exist:\n{self._file}")
         comment = f"{self._comment} {comment}"
@@ -83,52 +110,37 @@ class ExplicitFile:
             header = (
                 f"{comments}Wavelength explicit\nIntervalnr {len(self._spectral_indices)}\n{wav}"
             )
-            raw_data = np.vstack((self._times.T, self._observations)).T
+            secondary_axis = np.asarray(self._times)
+            observations = self._observations.T
         elif file_format == DataFileType.time_explicit:
             tim = "\t".join(repr(num) for num in self._times)
             header = f"{comments}Time explicit\nIntervalnr {len(self._times)}\n{tim}"
-            raw_data = np.vstack((self._spectral_indices.T, self._observations.T)).T
+            secondary_axis = np.asarray(self._spectral_indices)
+            observations = self._observations
         else:
             raise NotImplementedError
 
-        np.savetxt(
-            self._file,
-            raw_data,
-            fmt=number_format,
-            delimiter="\t",
-            newline="\n",
-            header=header,
-            footer="",
-            comments="",
-        )
+        with open_explicit_file(self._file, "wb", compression_level=compression_level) as file:
+            file.write(f"{header}\n".encode())
+            write_data_rows(file, secondary_axis, observations, number_format)
 
-    def read(self, prepare: bool = True):
+    def read(self, prepare: bool = True, cache: bool = False):
         if not os.path.isfile(self._file):
             raise FileNotFoundError("File does not exist.")
-        with open(self._file) as f:
-            f.readline()  # The first two lines are comments
-            f.readline()
-            # The third line defines the ExplicitFileFormat (Time or Wavelength explicit)
-            self._file_data_format = get_data_file_format(f.readline())
-            # The fourth line define the number of elements on the explicit axis, which
-            # we can ignore because pandas is intelligent enough to read it
-        # read the first line (explicit_axis) separately
-        explicit_axis = pd.read_csv(
-            self._file, skiprows=4, delimiter=r"\s+", header=None, nrows=1
-        ).values
-        explicit_axis = explicit_axis[0, :]  # reshape to (n,)
-        # then the rest of the data:
-        rest_of_data = pd.read_csv(self._file, skiprows=5, delimiter=r"\s+", header=None).values
-        secondary_axis = rest_of_data[:, 0]
-        observations = rest_of_data[:, 1:]
+        (
+            self._file_data_format,
+            explicit_axis,
+            secondary_axis,
+            self._observations,
+        ) = (
+            read_explicit_file_cached(self._file) if cache else read_explicit_file(self._file)
+        )
         if self._file_data_format == DataFileType.time_explicit:
-            self._times = explicit_axis  # (501,)
-            self._spectral_indices = secondary_axis  # (51,)
-            self._observations = observations  # len(observation)=51 . (51, 501)
+            self._times = explicit_axis
+            self._spectral_indices = secondary_axis
         elif self._file_data_format == DataFileType.wavelength_explicit:
             self._spectral_indices = explicit_axis
             self._times = secondary_axis
-            self._observations = observations
         else:
             raise NotImplementedError()
         return self.dataset(prepare=prepare)
@@ -234,10 +246,404 @@ def get_data_file_format(line):
     return data_file_format
 
 
+def parse_data_block(block: bytes, row_size: int) -> np.ndarray:
+    """Parse a block of whitespace separated numbers with ``row_size`` numbers per line.
+
+    Parameters
+    ----------
+    block : bytes
+        Complete lines of the data block.
+    row_size : int
+        Number of values per line.
+
+    Returns
+    -------
+    np.ndarray
+        The values with shape ``(number_of_lines, row_size)``.
+
+    Raises
+    ------
+    ValueError
+        If the block contains something else than numbers or a line has not
+        ``row_size`` values.
+    """
+    if not block.strip():
+        # numpy parses whitespace only strings as [-1.0]
+        return np.empty((0, row_size))
+    with catch_warnings():
+        # numpy warns instead of raising if it fails to parse the whole string
+        simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(block, sep=" ")  # type:ignore[call-overload]
+        except DeprecationWarning as error:
+            raise ValueError(f"Data contain values which are not numbers:\n{error}") from None
+    # Count the values of each line from the positions where values and lines start,
+    # other control characters than whitespace already failed to parse.
+    characters = np.frombuffer(block, dtype=np.uint8)
+    is_whitespace = characters <= ord(" ")
+    is_value_start = ~is_whitespace
+    is_value_start[1:] &= is_whitespace[:-1]
+    value_starts = np.flatnonzero(is_value_start)
+    line_ends = np.flatnonzero(characters == ord("\n"))
+    values_per_line = np.diff(
+        np.searchsorted(value_starts, line_ends), prepend=0, append=value_starts.size
+    )
+    # Blank lines are skipped by the parser
+    values_per_line = values_per_line[values_per_line > 0]
+    number_of_lines = values_per_line.size
+    if np.any(values_per_line != row_size) or values.size != number_of_lines * row_size:
+        raise ValueError(
+            f"Each data row needs to contain {row_size} values "
+            "(the secondary axis value and a value for each explicit axis value)."
+        )
+    return values.reshape(number_of_lines, row_size)
+
+
+@jit_kernel("float64(float64, int64)", nogil=True)
+def scale_by_power_of_ten(value: float, exponent: int) -> float:
+    """Multiply ``value`` with ``10**exponent`` without overflow of the power of ten."""
+    half_exponent = exponent // 2
+    return value * 10.0**half_exponent * 10.0 ** (exponent - half_exponent)
+
+
+@jit_kernel("UniTuple(int64, 2)(float64[::1], int64, int64, int64, uint8[::1], int64)", nogil=True)
+def format_scientific(
+    values: np.ndarray, start: int, precision: int, row_size: int, out: np.ndarray, position: int
+) -> tuple[int, int]:
+    """Format values like ``"%.<precision>e"`` into a buffer of ascii characters.
+
+    The values are separated by tabs and every ``row_size`` values by a newline.
+    Formatting stops at values which can't be formatted exactly, i.e. non-finite and
+    subnormal values and values where the rounding of the last digit can't be decided
+    in double precision. Those are formatted by the caller, which then continues after
+    the returned index.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The values to format.
+    start: int
+        Index of the first value to format.
+    precision: int
+        Number of digits after the decimal point.
+    row_size: int
+        Number of values per line.
+    out: np.ndarray
+        Buffer for the characters, which needs to have space for ``precision + 10``
+        characters per value.
+    position: int
+        Position in ``out`` where the first value is written.
+
+    Returns
+    -------
+    tuple[int, int]
+        Index of the first value which was not formatted and the position after
+        the last written character.
+    """
+    upper = 10.0 ** (precision + 1)
+    lower = 10.0**precision
+    # Bound of the relative error of the scaling plus a safety margin
+    tolerance = 16 * 2.220446049250313e-16 * upper
+    digits = np.empty(precision + 1, dtype=np.uint8)
+    for index in range(start, values.size):
+        value = values[index]
+        magnitude = abs(value)
+        if not math.isfinite(value) or (magnitude != 0 and magnitude < 1e-300):
+            return index, position
+        exponent = 0
+        mantissa = 0
+        if magnitude != 0:
+            exponent = int(math.floor(math.log10(magnitude)))
+            scaled = scale_by_power_of_ten(magnitude, precision - exponent)
+            if abs(scaled - math.floor(scaled) - 0.5) < tolerance:
+                return index, position
+            # log10 can be off by one close to powers of ten
+            if scaled >= upper - 0.5:
+                exponent += 1
+                scaled = scale_by_power_of_ten(magnitude, precision - exponent)
+            elif scaled < lower - 0.5:
+                exponent -= 1
+                scaled = scale_by_power_of_ten(magnitude, precision - exponent)
+            if abs(scaled - math.floor(scaled) - 0.5) < tolerance:
+                return index, position
+            mantissa = int(np.rint(scaled))
+            if mantissa >= upper:
+                mantissa //= 10
+                exponent += 1
+        if math.copysign(1.0, value) < 0:
+            out[position] = 45  # "-"
+            position += 1
+        for digit_index in range(precision, -1, -1):
+            digits[digit_index] = 48 + mantissa % 10
+            mantissa //= 10
+        out[position] = digits[0]
+        position += 1
+        if precision > 0:
+            out[position] = 46  # "."
+            position += 1
+            for digit_index in range(1, precision + 1):
+                out[position] = digits[digit_index]
+                position += 1
+        out[position] = 101  # "e"
+        out[position + 1] = 45 if exponent < 0 else 43  # "-" or "+"
+        position += 2
+        exponent = abs(exponent)
+        if exponent >= 100:
+            out[position] = 48 + exponent // 100
+            position += 1
+        out[position] = 48 + exponent // 10 % 10
+        out[position + 1] = 48 + exponent % 10
+        out[position + 2] = 10 if (index + 1) % row_size == 0 else 9  # "\n" or "\t"
+        position += 3
+    return values.size, position
+
+
+def format_data_rows(rows: np.ndarray, number_format: str) -> bytes:
+    """Format rows of values as tab separated lines like :func:`numpy.savetxt`.
+
+    Number formats ``"%.<precision>e"`` with a precision up to ``FAST_FORMAT_MAX_PRECISION``
+    are formatted with :func:`format_scientific`, which is several times faster than
+    formatting with python and gives the same result.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Two dimensional array of the values.
+    number_format : str
+        ``%`` format of a single value or of a whole row.
+
+    Returns
+    -------
+    bytes
+        The formatted lines.
+    """
+    row_size = rows.shape[1]
+    values = np.ascontiguousarray(rows, dtype=np.float64).reshape(-1)
+    match = re.fullmatch(r"%\.(\d+)e", number_format)
+    if match is None or int(match[1]) > FAST_FORMAT_MAX_PRECISION:
+        row_format = (
+            number_format
+            if number_format.count("%") > 1
+            else "\t".join([number_format] * row_size)
+        )
+        return ((f"{row_format}\n" * rows.shape[0]) % tuple(values.tolist())).encode()
+
+    precision = int(match[1])
+    out = np.empty(values.size * (precision + 10), dtype=np.uint8)
+    index, position = 0, 0
+    while index < values.size:
+        index, position = format_scientific(values, index, precision, row_size, out, position)
+        if index < values.size:
+            separator = "\n" if (index + 1) % row_size == 0 else "\t"
+            text = f"{number_format % values[index]}{separator}".encode()
+            out[position : position + len(text)] = np.frombuffer(text, dtype=np.uint8)
+            position += len(text)
+            index += 1
+    return out[:position].tobytes()
+
+
+def write_data_rows(
+    file: IO[bytes], secondary_axis: np.ndarray, observations: np.ndarray, number_format: str
+):
+    """Write the data rows of an ascii file in blocks of ``ASCII_WRITE_BLOCK_SIZE`` values.
+
+    Parameters
+    ----------
+    file : IO[bytes]
+        File opened in binary mode.
+    secondary_axis : np.ndarray
+        Values of the first column.
+    observations : np.ndarray
+        Values of the other columns with shape ``(secondary axis size, explicit axis size)``.
+    number_format : str
+        ``%`` format of the values.
+    """
+    row_size = observations.shape[1] + 1
+    block_rows = max(ASCII_WRITE_BLOCK_SIZE // row_size, 1)
+    block = np.empty((min(block_rows, secondary_axis.size), row_size))
+    for start in range(0, secondary_axis.size, block_rows):
+        rows = block[: min(block_rows, secondary_axis.size - start)]
+        rows[:, 0] = secondary_axis[start : start + block_rows]
+        rows[:, 1:] = observations[start : start + block_rows]
+        file.write(format_data_rows(rows, number_format))
+
+
+def open_explicit_file(
+    file_name: StrOrPath, mode: str = "rb", *, compression_level: int = 1
+) -> IO[bytes]:
+    """Open an ascii file in binary mode, using gzip if the file name ends with ``.gz``.
+
+    Parameters
+    ----------
+    file_name : StrOrPath
+        Path of the ascii file.
+    mode : str
+        Binary mode to open the file with. Defaults to ``"rb"``.
+    compression_level : int
+        Compression level of gzip between 0 and 9 when writing. Defaults to 1.
+
+    Returns
+    -------
+    IO[bytes]
+        The opened file.
+    """
+    if str(file_name).endswith(".gz"):
+        return gzip.open(  # type:ignore[return-value]
+            file_name, mode, compresslevel=compression_level
+        )
+    return open(file_name, mode)
+
+
+def read_explicit_file(
+    file_name: StrOrPath, *, hasher: _Hash | None = None
+) -> tuple[DataFileType, np.ndarray, np.ndarray, np.ndarray]:
+    """Read a wavelength- or time-explicit file in a single pass.
+
+    The data are parsed in blocks of ``ASCII_READ_BLOCK_SIZE`` bytes, which are
+    copied into a preallocated array. Files ending with ``.gz`` are decompressed
+    with gzip.
+
+    Parameters
+    ----------
+    file_name : StrOrPath
+        Path of the ascii file.
+    hasher : _Hash | None
+        ``hashlib`` hash object which gets updated with the (decompressed) content of the file.
+        Defaults to None.
+
+    Returns
+    -------
+    tuple[DataFileType, np.ndarray, np.ndarray, np.ndarray]
+        Format of the file, explicit axis, secondary axis and observations with shape
+        ``(secondary axis size, explicit axis size)``.
+    """
+    with open_explicit_file(file_name) as file:
+        # Two comment lines, the format, the interval number and the explicit axis
+        header = [file.readline() for _ in range(5)]
+        file_data_format = get_data_file_format(header[2].decode(errors="replace"))
+        explicit_axis = parse_data_block(header[4], len(header[4].split()))[0]
+        row_size = explicit_axis.size + 1
+        # Only used to estimate the number of rows, for gzip files this is an underestimate
+        remaining_size = max(os.fstat(file.fileno()).st_size - file.tell(), 0)
+        if hasher is not None:
+            for line in header:
+                hasher.update(line)
+
+        data = np.empty((0, row_size))
+        number_of_rows = 0
+        parsed_size = 0
+        remainder = b""
+        while block := file.read(ASCII_READ_BLOCK_SIZE):
+            if hasher is not None:
+                hasher.update(block)
+            block = remainder + block
+            end = block.rfind(b"\n") + 1
+            block, remainder = block[:end], block[end:]
+            rows = parse_data_block(block, row_size)
+            parsed_size += len(block)
+            required_rows = number_of_rows + rows.shape[0]
+            if required_rows > data.shape[0]:
+                # Estimate the number of rows from the average length of the parsed lines
+                estimated_rows = int(1.05 * remaining_size * required_rows / max(parsed_size, 1))
+                data.resize(
+                    (max(estimated_rows, required_rows, int(1.5 * data.shape[0])), row_size),
+                    refcheck=False,
+                )
+            data[number_of_rows:required_rows] = rows
+            number_of_rows = required_rows
+        rows = parse_data_block(remainder, row_size)
+        data.resize((number_of_rows + rows.shape[0], row_size), refcheck=False)
+        data[number_of_rows:] = rows
+
+    return file_data_format, explicit_axis, data[:, 0].copy(), data[:, 1:]
+
+
+def explicit_file_cache_path(file_name: StrOrPath) -> Path:
+    """Path of the binary cache of an ascii file.
+
+    Parameters
+    ----------
+    file_name : StrOrPath
+        Path of the ascii file.
+
+    Returns
+    -------
+    Path
+        Path of the cache, which is next to the ascii file.
+    """
+    file_path = Path(file_name)
+    return file_path.with_name(f".{file_path.name}.glotaran_cache.npz")
+
+
+def read_explicit_file_cached(
+    file_name: StrOrPath,
+) -> tuple[DataFileType, np.ndarray, np.ndarray, np.ndarray]:
+    """Read a wavelength- or time-explicit file using a binary cache.
+
+    The cache is stored next to the file (see :func:`explicit_file_cache_path`)
+    together with a hash of the file content. If the hash matches, the parsed data
+    are loaded from the cache, otherwise the file is parsed and the cache is updated.
+    Failing to write the cache is silently ignored.
+
+    Parameters
+    ----------
+    file_name : StrOrPath
+        Path of the ascii file.
+
+    Returns
+    -------
+    tuple[DataFileType, np.ndarray, np.ndarray, np.ndarray]
+        Format of the file, explicit axis, secondary axis and observations with shape
+        ``(secondary axis size, explicit axis size)``.
+    """
+    cache_path = explicit_file_cache_path(file_name)
+    if cache_path.is_file():
+        hasher = hashlib.blake2b()
+        with open_explicit_file(file_name) as file:
+            while block := file.read(ASCII_READ_BLOCK_SIZE):
+                hasher.update(block)
+        try:
+            with np.load(cache_path, allow_pickle=False) as cache:
+                if (
+                    cache["version"] == ASCII_CACHE_VERSION
+                    and cache["content_hash"] == hasher.hexdigest()
+                ):
+                    return (
+                        DataFileType(str(cache["file_data_format"])),
+                        cache["explicit_axis"],
+                        cache["secondary_axis"],
+                        cache["observations"],
+                    )
+        except (OSError, ValueError, KeyError):
+            pass
+
+    hasher = hashlib.blake2b()
+    data = read_explicit_file(file_name, hasher=hasher)
+    file_data_format, explicit_axis, secondary_axis, observations = data
+    temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary_path, "wb") as cache_file:
+            np.savez(
+                cache_file,
+                version=ASCII_CACHE_VERSION,
+                content_hash=hasher.hexdigest(),
+                file_data_format=file_data_format.value,
+                explicit_axis=explicit_axis,
+                secondary_axis=secondary_axis,
+                observations=observations,
+            )
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        temporary_path.unlink(missing_ok=True)
+    return data
+
+
 #  @file_reader(extension="ascii", name="Wavelength-/Time-Explicit ASCII")
 @register_data_io("ascii")
 class AsciiDataIo(DataIoInterface):
-    def load_dataset(self, file_name: str, *, prepare: bool = True) -> xr.Dataset | xr.DataArray:
+    def load_dataset(
+        self, file_name: str, *, prepare: bool = True, cache: bool = False
+    ) -> xr.Dataset | xr.DataArray:
         """Reads an ascii file in wavelength- or time-explicit format.
 
         See [1]_ for documentation of this format.
@@ -246,6 +652,12 @@ class AsciiDataIo(DataIoInterface):
         ----------
         fname : str
             Name of the ascii file.
+        prepare : bool
+            Whether to prepare the dataset with ``prepare_time_trace_dataset``.
+        cache : bool
+            Whether to cache the parsed data in a binary file next to the ascii file,
+            which is used instead of parsing the file again as long as its content
+            doesn't change. See :func:`read_explicit_file_cached`.
 
         Returns
         -------
@@ -256,18 +668,7 @@ class AsciiDataIo(DataIoInterface):
         .. [1] https://glotaran.github.io/legacy/file_formats
         """
 
-        with open(file_name) as f:
-            f.readline()  # Read first line with comments (and discard for now)
-            f.readline()  # Read second line with comments (and discard for now)
-            data_file_format = get_data_file_format(f.readline())
-
-        data_file = (
-            WavelengthExplicitFile(filepath=file_name)
-            if data_file_format is DataFileType.wavelength_explicit
-            else TimeExplicitFile(file_name)
-        )
-
-        return data_file.read(prepare=prepare)
+        return ExplicitFile(filepath=file_name).read(prepare=prepare, cache=cache)
 
     def save_dataset(
         self,
@@ -277,7 +678,32 @@ class AsciiDataIo(DataIoInterface):
         comment: str = "",
         file_format: DataFileType = DataFileType.time_explicit,
         number_format: str = "%.10e",
+        compression_level: int = 1,
     ):
+        """Write a dataset to an ascii file in wavelength- or time-explicit format.
+
+        The file is gzip compressed if ``file_name`` ends with ``.gz``, such files
+        can be loaded with ``format_name="ascii"``.
+
+        Parameters
+        ----------
+        dataset : xr.DataArray | xr.Dataset
+            Data to write, the ``data`` variable is used for datasets.
+        file_name : str
+            Path of the ascii file.
+        comment : str
+            Comment which is written to the header of the file.
+        file_format : DataFileType
+            Whether to write a time- or wavelength-explicit file.
+            Defaults to ``DataFileType.time_explicit``.
+        number_format : str
+            ``%`` format of the values. Defaults to ``"%.10e"``, which is formatted by
+            a fast formatter (see :func:`format_data_rows`).
+        compression_level : int
+            Compression level of gzip between 0 and 9 for files ending with ``.gz``.
+            Defaults to 1, higher levels compress the text of measured data only slightly
+            better but are several times slower.
+        """
         if isinstance(dataset, xr.Dataset) and "data" in dataset:
             dataset = dataset.data
             warn(
@@ -295,5 +721,9 @@ class AsciiDataIo(DataIoInterface):
             else WavelengthExplicitFile(filepath=file_name, dataset=dataset)
         )
         data_file.write(
-            overwrite=True, comment=comment, file_format=file_format, number_format=number_format
+            overwrite=True,
+            comment=comment,
+            file_format=file_format,
+            number_format=number_format,
+            compression_level=compression_level,
         )
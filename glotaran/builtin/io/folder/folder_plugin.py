@@ -6,8 +6,10 @@ worked in glotaran 0.3.x and meant as an compatibility function.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 from warnings import warn
 
 from glotaran.deprecation import warn_deprecated
@@ -15,10 +17,17 @@ from glotaran.io import save_dataset
 from glotaran.io import save_parameters
 from glotaran.io import save_result
 from glotaran.io.interface import ProjectIoInterface
+from glotaran.optimization.matrix_storage import compact_index_dependent_matrices
 from glotaran.plugin_system.project_io_registration import SAVING_OPTIONS_DEFAULT
 from glotaran.plugin_system.project_io_registration import register_project_io
+from glotaran.utils.io import atomic_write_path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import xarray as xr
+
+    from glotaran.parameter import Parameters
     from glotaran.plugin_system.project_io_registration import SavingOptions
     from glotaran.project import Result
 
@@ -111,6 +120,10 @@ class FolderProjectIo(ProjectIoInterface):
         * ``parameter_history.csv``: Parameter changes over the optimization
         * ``{dataset_label}.nc``: The result data for each dataset as NetCDF file.
 
+        The files are written concurrently by ``saving_options.number_of_threads`` threads.
+        Each file is written to a temporary path first and renamed when it is complete,
+        so other processes never read partially written files.
+
         Note
         ----
         As a side effect it populates the file path properties of ``result`` which can be
@@ -153,48 +166,90 @@ class FolderProjectIo(ProjectIoInterface):
             raise ValueError(f"The path '{result_folder}' is not a directory.")
         result_folder.mkdir(parents=True, exist_ok=True)
 
-        paths = []
+        def save_report(path: Path):
+            path.write_text(str(result.markdown()))
+
+        def save_parameter_file(parameters: Parameters) -> Callable[[Path], None]:
+            return lambda path: save_parameters(
+                parameters,
+                path,
+                format_name=saving_options.parameter_format,
+                allow_overwrite=True,
+            )
+
+        def save_data_file(dataset: xr.Dataset) -> Callable[[Path], None]:
+            def save_data(path: Path):
+                data_to_save = (
+                    dataset
+                    if saving_options.data_filter is None
+                    else dataset[saving_options.data_filter]
+                )
+                data_to_save = compact_index_dependent_matrices(
+                    data_to_save, saving_options.matrix_format
+                )
+                data_options: dict[str, Any] = {}
+                if saving_options.data_compression_level is not None:
+                    data_options["compression_level"] = saving_options.data_compression_level
+                if saving_options.data_encoding is not None:
+                    data_options["encoding"] = {
+                        name: options
+                        for name, options in saving_options.data_encoding.items()
+                        if name in data_to_save.variables
+                    }
+                save_dataset(
+                    data_to_save,
+                    path,
+                    format_name=saving_options.data_format,
+                    allow_overwrite=True,
+                    **data_options,
+                )
+
+            return save_data
+
+        files: dict[Path, Callable[[Path], None]] = {}
         if saving_options.report:
-            report_path = result_folder / "result.md"
-            report_path.write_text(str(result.markdown()))
-            paths.append(report_path.as_posix())
-
-        initial_parameters_path = f"initial_parameters.{saving_options.parameter_format}"
-        save_parameters(
-            result.scheme.parameters,
-            result_folder / initial_parameters_path,
-            format_name=saving_options.parameter_format,
-            allow_overwrite=True,
+            files[result_folder / "result.md"] = save_report
+        initial_parameters_path = (
+            result_folder / f"initial_parameters.{saving_options.parameter_format}"
         )
-        paths.append((result_folder / initial_parameters_path).as_posix())
-
-        optimized_parameters_path = f"optimized_parameters.{saving_options.parameter_format}"
-        save_parameters(
-            result.optimized_parameters,
-            result_folder / optimized_parameters_path,
-            format_name=saving_options.parameter_format,
-            allow_overwrite=True,
+        files[initial_parameters_path] = save_parameter_file(result.scheme.parameters)
+        optimized_parameters_path = (
+            result_folder / f"optimized_parameters.{saving_options.parameter_format}"
         )
-        paths.append((result_folder / optimized_parameters_path).as_posix())
-
+        files[optimized_parameters_path] = save_parameter_file(result.optimized_parameters)
         parameter_history_path = result_folder / "parameter_history.csv"
-        result.parameter_history.to_csv(parameter_history_path)
-        paths.append(parameter_history_path.as_posix())
-
+        files[parameter_history_path] = result.parameter_history.to_csv
         optimization_history_path = result_folder / "optimization_history.csv"
-        result.optimization_history.to_csv(optimization_history_path)
-        paths.append(optimization_history_path.as_posix())
-
+        files[optimization_history_path] = result.optimization_history.to_csv
+        profile_path = result_folder / "optimization_profile.csv"
+        if result.profile is not None:
+            files[profile_path] = result.profile.to_csv
+        data_paths = {}
         for label, dataset in result.data.items():
             data_path = result_folder / f"{label}.{saving_options.data_format}"
-            if saving_options.data_filter is not None:
-                dataset = dataset[saving_options.data_filter]
-            save_dataset(
-                dataset,
-                data_path,
-                format_name=saving_options.data_format,
-                allow_overwrite=True,
-            )
-            paths.append(data_path.as_posix())
-
-        return paths
+            files[data_path] = save_data_file(dataset)
+            data_paths[label] = data_path
+
+        def save_file(path: Path):
+            # Files are written to a temporary path and renamed when they are complete,
+            # so other processes reading the result never see partially written files.
+            with atomic_write_path(path) as temporary_path:
+                files[path](temporary_path)
+
+        # Writing NetCDF files is serialized by a lock of xarray, but the report, the csv
+        # files and the preparation and encoding of the datasets run concurrently.
+        with ThreadPoolExecutor(saving_options.number_of_threads) as executor:
+            list(executor.map(save_file, files))
+
+        # The saved items have the temporary paths as source paths,
+        # but the yml plugin needs the final paths
+        result.scheme.parameters.source_path = initial_parameters_path.as_posix()
+        result.optimized_parameters.source_path = optimized_parameters_path.as_posix()
+        result.parameter_history.source_path = parameter_history_path.as_posix()
+        result.optimization_history.source_path = optimization_history_path.as_posix()
+        if result.profile is not None:
+            result.profile.source_path = profile_path.as_posix()
+        for label, data_path in data_paths.items():
+            result.data[label].attrs["source_path"] = data_path.as_posix()
+
+        return [path.as_posix() for path in files]
@@ -6,6 +6,8 @@ from typing import Literal
 import pytest
 
 from glotaran.deprecation import GlotaranApiDeprecationWarning
+from glotaran.io import SavingOptions
+from glotaran.io import load_dataset
 from glotaran.io import save_result
 from glotaran.optimization.optimize import optimize
 from glotaran.project.result import Result
@@ -55,6 +57,55 @@ def test_save_result_folder(
         assert (result_dir / wanted).as_posix() in save_paths
 
 
+def test_save_result_folder_zarr(tmp_path: Path, dummy_result: Result):
+    """Save datasets in the zarr format."""
+    pytest.importorskip("zarr")
+    result_dir = tmp_path / "testresult"
+    with pytest.warns(UserWarning):
+        save_paths = save_result(
+            result_path=result_dir,
+            format_name="folder",
+            result=dummy_result,
+            saving_options=SavingOptions(data_format="zarr"),
+        )
+
+    assert (result_dir / "dataset_1.zarr").as_posix() in save_paths
+    assert load_dataset(result_dir / "dataset_1.zarr").equals(dummy_result.data["dataset_1"])
+
+
+@pytest.mark.parametrize("number_of_threads", (1, 4))
+def test_save_result_folder_compressed(
+    tmp_path: Path, dummy_result: Result, number_of_threads: int
+):
+    """Compress all data variables, chunk single ones and leave no temporary files."""
+    result_dir = tmp_path / "testresult"
+    saving_options = SavingOptions(
+        data_compression_level=4,
+        data_encoding={"fitted_data": {"chunksizes": (100, 72)}, "not_saved": {"zlib": False}},
+        number_of_threads=number_of_threads,
+    )
+    for _ in range(2):
+        with pytest.warns(UserWarning):
+            save_paths = save_result(
+                result_path=result_dir,
+                format_name="folder",
+                result=dummy_result,
+                saving_options=saving_options,
+                allow_overwrite=True,
+            )
+
+    assert sorted(path.name for path in result_dir.iterdir()) == sorted(
+        Path(path).name for path in save_paths
+    )
+    dataset = dummy_result.data["dataset_1"]
+    assert dataset.source_path == (result_dir / "dataset_1.nc").as_posix()
+    loaded = load_dataset(result_dir / "dataset_1.nc")
+    assert loaded.data.encoding["zlib"] is True
+    assert loaded.data.encoding["complevel"] == 4
+    assert loaded.fitted_data.encoding["chunksizes"] == (100, 72)
+    assert loaded.equals(dataset)
+
+
 @pytest.mark.parametrize("format_name", ("folder", "legacy"))
 def test_save_result_folder_error_path_is_file(
     tmp_path: Path,
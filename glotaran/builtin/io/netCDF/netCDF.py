@@ -1,6 +1,9 @@
 """Module containing the NetCDF4 Data IO plugin."""
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from typing import Any
+
 # Needed to prevent a netCDF4 RuntimeWarning at import time
 # Ref.: https://github.com/pydata/xarray/issues/7259
 import netCDF4  # noqa: F401
@@ -9,23 +12,37 @@ import xarray as xr
 from glotaran.io import DataIoInterface
 from glotaran.io import register_data_io
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 @register_data_io("nc")
 class NetCDFDataIo(DataIoInterface):
     """Plugin for NetCDF4 data io."""
 
-    def load_dataset(self, file_name: str) -> xr.Dataset | xr.DataArray:
+    def load_dataset(self, file_name: str, *, lazy: bool = False) -> xr.Dataset | xr.DataArray:
         """Load a ``*.nc`` file into a :xarraydoc:`Dataset` or :xarraydoc:`DataArray`.
 
         Parameters
         ----------
         file_name: str
             Path to the ``*.nc`` file that should be loaded.
+        lazy: bool
+            Whether to read the data variables from file on access instead of loading them
+            into memory. The values are not cached, so accessing a variable reads it again.
+            Since the optimization reads unweighted data only once, this halves the memory
+            needed to optimize large files. The SVD of weighted data reads them again, use
+            ``Scheme(..., add_svd=False)`` to avoid this. The file stays open until the
+            dataset is closed with ``dataset.close()``, which is the responsibility of the
+            caller. Close it before overwriting or deleting the file (required on Windows).
+            Defaults to False.
 
         Returns
         -------
         xr.Dataset | xr.DataArray
         """
+        if lazy:
+            return xr.open_dataset(file_name, cache=False)
         with xr.open_dataset(file_name) as ds:
             return ds.load()
 
@@ -35,6 +52,8 @@ class NetCDFDataIo(DataIoInterface):
         file_name: str,
         *,
         data_filters: list[str] | None = None,
+        compression_level: int | None = None,
+        encoding: Mapping[str, Mapping[str, Any]] | None = None,
     ):
         """Write a :xarraydoc:`Dataset` to the ``*.nc`` at path ``file_name``.
 
@@ -46,6 +65,22 @@ class NetCDFDataIo(DataIoInterface):
             Path of the file to write ``dataset`` to.
         data_filters: list[str] | None
             List of data variable names that should be written to file. Defaults to None.
+        compression_level: int | None
+            Level between 1 and 9 to compress all numeric data variables with zlib and
+            byte shuffling. Defaults to None, which writes them uncompressed.
+        encoding: Mapping[str, Mapping[str, Any]] | None
+            NetCDF4 encoding of single variables (e.g. ``{"fitted_data": {"zlib": True,
+            "complevel": 4, "chunksizes": (100, 1)}}``), which takes precedence over
+            ``compression_level``. Defaults to None.
         """
         data_to_save = dataset if data_filters is None else dataset[data_filters]
-        data_to_save.to_netcdf(file_name, mode="w")
+        variable_encoding: dict[str, dict[str, Any]] = {}
+        if compression_level is not None:
+            variable_encoding = {
+                str(name): {"zlib": True, "complevel": compression_level, "shuffle": True}
+                for name, data_array in data_to_save.data_vars.items()
+                if data_array.ndim > 0 and data_array.dtype.kind in "biuf"
+            }
+        for name, options in (encoding or {}).items():
+            variable_encoding[name] = variable_encoding.get(name, {}) | dict(options)
+        data_to_save.to_netcdf(file_name, mode="w", encoding=variable_encoding or None)
@@ -1,17 +1,202 @@
 """Module containing the SDT Data IO plugin."""
 from __future__ import annotations
 
+import io
 import warnings
+import zipfile
 
 import numpy as np
+import pandas as pd
 import xarray as xr
 from sdtfile import SdtFile
+from sdtfile import sdtfile
 
 from glotaran.io import DataIoInterface
 from glotaran.io import register_data_io
 from glotaran.io.prepare_dataset import prepare_time_trace_dataset
 
 
+def memory_map_sdt_file(file_name: str) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """Memory map the data blocks of a `*.sdt` file.
+
+    The file headers are parsed like :class:`sdtfile.SdtFile` does, but the data blocks
+    are memory mapped instead of being read, so only the parts of the data which are
+    accessed get read from disk. Compressed data blocks are read into memory.
+
+    Parameters
+    ----------
+    file_name: str
+        Path to the sdt file.
+
+    Returns
+    -------
+    tuple[list[np.ndarray], list[np.ndarray]]
+        Time axes and read-only data arrays of the data blocks, with the same shapes as
+        :attr:`sdtfile.SdtFile.times` and :attr:`sdtfile.SdtFile.data`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a sdt file.
+    """
+    times: list[np.ndarray] = []
+    data: list[np.ndarray] = []
+    with open(file_name, "rb") as file:
+        header = np.rec.fromfile(file, dtype=sdtfile.FILE_HEADER, shape=1, byteorder="<")[0]
+        if header.header_valid != 0x5555:
+            raise ValueError(f"The file {file_name!r} is not a sdt file.")
+        number_of_blocks = int(header.no_of_data_blocks)
+        if number_of_blocks == 0x7FFF:
+            number_of_blocks = int(header.reserved1)
+
+        measure_info_dtype = np.dtype(sdtfile.MEASURE_INFO)
+        measure_infos = []
+        for block_index in range(header.no_of_meas_desc_blocks):
+            file.seek(header.meas_desc_block_offset + block_index * header.meas_desc_block_length)
+            measure_infos.append(
+                np.rec.fromfile(file, dtype=measure_info_dtype, shape=1, byteorder="<")
+            )
+
+        block_header_dtype = (
+            sdtfile.BLOCK_HEADER
+            if sdtfile.FileRevision(header.revision).revision < 15
+            else sdtfile.BLOCK_HEADER_15
+        )
+        offset = int(header.data_block_offset)
+        for _ in range(number_of_blocks):
+            file.seek(offset)
+            block_header = np.rec.fromfile(file, dtype=block_header_dtype, shape=1, byteorder="<")[
+                0
+            ]
+            measure_info = measure_infos[block_header.meas_desc_block_no]
+            block_type = sdtfile.BlockType(block_header.block_type)
+            size = int(block_header.block_length) // block_type.dtype.itemsize
+            if block_type.compress:
+                file.seek(block_header.data_offs)
+                compressed = io.BytesIO(
+                    file.read(block_header.next_block_offs - block_header.data_offs)
+                )
+                with zipfile.ZipFile(compressed) as zip_file:
+                    block_data = np.frombuffer(
+                        zip_file.read(zip_file.filelist[0].filename),
+                        dtype=block_type.dtype,
+                        count=size,
+                    )
+            else:
+                block_data = np.memmap(
+                    file_name,
+                    dtype=block_type.dtype,
+                    mode="r",
+                    offset=int(block_header.data_offs),
+                    shape=(size,),
+                )
+
+            adc_resolution = int(measure_info.adc_re)
+            if size == int(measure_info.scan_x) * int(measure_info.scan_y) * adc_resolution:
+                block_data = block_data.reshape(
+                    int(measure_info.scan_y), int(measure_info.scan_x), adc_resolution
+                )
+            elif size == int(measure_info.image_x) * int(measure_info.image_y) * adc_resolution:
+                block_data = block_data.reshape(
+                    int(measure_info.image_y), int(measure_info.image_x), adc_resolution
+                )
+            elif size == measure_info.MeasHISTInfo.mcs_points[0]:
+                block_data = block_data.reshape(-1, size)
+            else:
+                block_data = block_data.reshape(-1, adc_resolution)
+            data.append(block_data)
+
+            if block_type.contents == "MCS_BLOCK":
+                times.append(
+                    np.arange(size, dtype=np.float64)
+                    * float(measure_info.MeasHISTInfo.mcs_time[0])
+                )
+            else:
+                times.append(
+                    np.arange(adc_resolution, dtype=np.float64)
+                    * float(measure_info.tac_r / (float(measure_info.tac_g) * adc_resolution))
+                )
+            offset = int(block_header.next_block_offs)
+    return times, data
+
+
+def create_flim_dataset(
+    raw_data: np.ndarray,
+    times: np.ndarray,
+    *,
+    binning: int = 1,
+    pixel_mask: np.ndarray | None = None,
+    min_intensity: float | None = None,
+) -> xr.Dataset:
+    """Create a dataset from the data of a FLIM measurement.
+
+    The ``data`` variable is a view of the pixels in ``full_data``, unless pixels are
+    masked out, so the counts are not copied.
+
+    Parameters
+    ----------
+    raw_data: np.ndarray
+        Counts with the shape ``(x, y, time)``.
+    times: np.ndarray
+        The time axis.
+    binning: int
+        Number of neighbouring pixels along x and y which are summed up. Pixels at the
+        borders which don't fill a whole bin are dropped. Defaults to 1.
+    pixel_mask: np.ndarray | None
+        Boolean array with the shape ``(x, y)`` of the (binned) pixel map, which is
+        True for pixels which are kept in ``data``. Defaults to None.
+    min_intensity: float | None
+        Smallest summed up count of a pixel which is kept in ``data``. Defaults to None.
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset with the pixels as ``data`` with the dimensions ``("time", "pixel")``,
+        the binned counts as ``full_data`` and their sum over time as
+        ``data_intensity_map``.
+
+    Raises
+    ------
+    ValueError
+        If ``binning`` is smaller than 1 or ``pixel_mask`` has the wrong shape.
+    """
+    if binning < 1:
+        raise ValueError(f"The binning needs to be a positive integer, got {binning}.")
+    if binning > 1:
+        size_x, size_y = raw_data.shape[0] // binning, raw_data.shape[1] // binning
+        raw_data = (
+            raw_data[: size_x * binning, : size_y * binning]
+            .reshape(size_x, binning, size_y, binning, raw_data.shape[2])
+            .sum(axis=(1, 3))
+        )
+    intensity_map = raw_data.sum(axis=2)
+
+    kept_pixels = np.ones(intensity_map.shape, dtype=bool)
+    if pixel_mask is not None:
+        if np.shape(pixel_mask) != intensity_map.shape:
+            raise ValueError(
+                f"The pixel mask needs to have the shape {intensity_map.shape} of the "
+                f"pixel map, got {np.shape(pixel_mask)}."
+            )
+        kept_pixels &= np.asarray(pixel_mask, dtype=bool)
+    if min_intensity is not None:
+        kept_pixels &= intensity_map >= min_intensity
+
+    pixel_data = raw_data.reshape(-1, raw_data.shape[2])
+    if not kept_pixels.all():
+        pixel_data = pixel_data[kept_pixels.reshape(-1)]
+    pixel_index = pd.MultiIndex.from_arrays(np.nonzero(kept_pixels), names=["x", "y"])
+
+    data = xr.DataArray(
+        pixel_data, coords={"pixel": pixel_index, "time": times}, dims=("pixel", "time")
+    ).T.to_dataset(name="data")
+    data["full_data"] = xr.DataArray(
+        raw_data, coords={"time": times}, dims=("pixel_x", "pixel_y", "time")
+    )
+    data["data_intensity_map"] = xr.DataArray(intensity_map, dims=("pixel_x", "pixel_y"))
+    return data
+
+
 @register_data_io("sdt")
 class SdtDataIo(DataIoInterface):
     """Plugin for SDT data io."""
@@ -25,6 +210,10 @@ class SdtDataIo(DataIoInterface):
         dataset_index: int | None = None,
         swap_axis: bool = False,
         orig_time_axis_index: int = 2,
+        memory_map: bool = False,
+        binning: int = 1,
+        pixel_mask: np.ndarray | None = None,
+        min_intensity: float | None = None,
     ) -> xr.Dataset:
         """Read a `*.sdt` file and returns a :xarraydoc:`Dataset` containing its data.
 
@@ -54,6 +243,22 @@ class SdtDataIo(DataIoInterface):
             I.e. for data of shape (64, 64, 256), which are a 64x64 pixel map
             with 256 time steps, orig_time_axis_index=2.
 
+        memory_map: bool
+            Whether to memory map the data instead of reading the whole file,
+            see :func:`memory_map_sdt_file`. Defaults to False.
+
+        binning: int
+            Number of neighbouring pixels along x and y of FLIM data which are summed up.
+            Defaults to 1.
+
+        pixel_mask: np.ndarray | None
+            Boolean array with the shape of the (binned) pixel map of FLIM data,
+            which is True for pixels which are kept. Defaults to None.
+
+        min_intensity: float | None
+            Smallest summed up count of a pixel of FLIM data which is kept.
+            Defaults to None.
+
         Returns
         -------
         xr.Dataset
@@ -63,11 +268,15 @@ class SdtDataIo(DataIoInterface):
         IndexError
             If the length of the index array is incompatible with the data.
         """
-        sdt_parser = SdtFile(file_name)
+        if memory_map:
+            all_times, all_data = memory_map_sdt_file(file_name)
+        else:
+            sdt_parser = SdtFile(file_name)
+            all_times, all_data = sdt_parser.times, sdt_parser.data
         if not dataset_index:
             # looking at the source code of SdtFile, times and data
             # always have the same len, so only one needs to be checked
-            nr_of_datasets = len(sdt_parser.times)
+            nr_of_datasets = len(all_times)
             if nr_of_datasets > 1:
                 warnings.warn(
                     UserWarning(
@@ -79,8 +288,8 @@ class SdtDataIo(DataIoInterface):
                     stacklevel=4,
                 )
             dataset_index = 0
-        times: np.ndarray = sdt_parser.times[dataset_index]
-        raw_data: np.ndarray = sdt_parser.data[dataset_index]
+        times: np.ndarray = all_times[dataset_index]
+        raw_data: np.ndarray = all_data[dataset_index]
 
         if index and len(index) != raw_data.shape[0]:
             raise IndexError(
@@ -100,13 +309,13 @@ class SdtDataIo(DataIoInterface):
 
         if flim:
             if orig_time_axis_index != 2:
-                np.swapaxes(raw_data, 2, orig_time_axis_index)
-
-            full_data = xr.DataArray(raw_data, coords={"time": times}, dims=["x", "y", "time"])
-            data = full_data.stack(pixel=("x", "y")).to_dataset(name="data")
-            data["full_data"] = full_data.rename({"x": "pixel_x", "y": "pixel_y"})
-            data["data_intensity_map"] = (
-                data.data.groupby("pixel").sum().unstack().rename({"x": "pixel_x", "y": "pixel_y"})
+                raw_data = np.moveaxis(raw_data, orig_time_axis_index, 2)
+            data = create_flim_dataset(
+                raw_data,
+                times,
+                binning=binning,
+                pixel_mask=pixel_mask,
+                min_intensity=min_intensity,
             )
         else:
             if swap_axis:
@@ -2,8 +2,12 @@ import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+from sdtfile import SdtFile
 
 from glotaran.builtin.io.sdt.sdt_file_reader import SdtDataIo
+from glotaran.builtin.io.sdt.sdt_file_reader import memory_map_sdt_file
+from glotaran.builtin.io.sdt.test import FLIM_DATA
+from glotaran.builtin.io.sdt.test import LEGACY_FILES
 from glotaran.builtin.io.sdt.test import TEMPORAL_DATA
 
 
@@ -28,3 +32,61 @@ def test_read_sdt(test_file_path, result_file_path, index):
 
     assert test_dataset.data.T.shape == result_traces.values.shape
     assert np.allclose(test_dataset.time, np.array(result_traces.columns))
+
+
+@pytest.mark.parametrize("file_path", (FLIM_DATA["sdt"], TEMPORAL_DATA["sdt"]))
+def test_memory_map_sdt_file(file_path: str):
+    """Memory mapped data are the same as read by SdtFile."""
+    sdt_file = SdtFile(file_path)
+    times, data = memory_map_sdt_file(file_path)
+
+    assert len(times) == len(data) == len(sdt_file.data)
+    for block_times, expected_times in zip(times, sdt_file.times):
+        assert np.array_equal(block_times, expected_times)
+    for block_data, expected_data in zip(data, sdt_file.data):
+        assert isinstance(block_data, np.memmap)
+        assert block_data.shape == expected_data.shape
+        assert np.array_equal(block_data, expected_data)
+
+
+@pytest.mark.parametrize("memory_map", (False, True))
+def test_read_sdt_flim(memory_map: bool):
+    """Pixels are a view of the full data and the intensity map is the legacy sum map."""
+    test_dataset = SdtDataIo("sdt").load_dataset(
+        FLIM_DATA["sdt"], flim=True, memory_map=memory_map
+    )
+    expected_map = np.loadtxt(LEGACY_FILES["flim_map"])
+
+    assert test_dataset.data.dims == ("time", "pixel")
+    assert test_dataset.data.shape == (256, 64 * 64)
+    assert np.shares_memory(test_dataset.data.values, test_dataset.full_data.values)
+    assert test_dataset.data.equals(
+        test_dataset.full_data.rename(pixel_x="x", pixel_y="y").stack(pixel=("x", "y"))
+    )
+    assert np.array_equal(test_dataset.data_intensity_map, expected_map)
+
+
+def test_read_sdt_flim_binning_and_masking():
+    """Binned pixels are summed up and masked pixels are dropped."""
+    sdt_reader = SdtDataIo("sdt")
+    full_dataset = sdt_reader.load_dataset(FLIM_DATA["sdt"], flim=True)
+    pixel_mask = np.zeros((21, 21), dtype=bool)
+    pixel_mask[:10] = True
+
+    test_dataset = sdt_reader.load_dataset(
+        FLIM_DATA["sdt"], flim=True, binning=3, pixel_mask=pixel_mask, min_intensity=1000
+    )
+    expected_map = full_dataset.data_intensity_map.values[:63, :63].reshape(21, 3, 21, 3)
+
+    assert test_dataset.full_data.shape == (21, 21, 256)
+    assert np.array_equal(test_dataset.data_intensity_map, expected_map.sum(axis=(1, 3)))
+    kept_pixels = pixel_mask & (test_dataset.data_intensity_map.values >= 1000)
+    assert test_dataset.data.shape == (256, kept_pixels.sum())
+    assert np.array_equal(test_dataset.x, np.nonzero(kept_pixels)[0])
+    x, y = np.argwhere(kept_pixels)[-1]
+    assert np.array_equal(
+        test_dataset.data.sel(x=x, y=y), test_dataset.full_data.isel(pixel_x=x, pixel_y=y)
+    )
+
+    with pytest.raises(ValueError, match=r"pixel mask needs to have the shape \(21, 21\)"):
+        sdt_reader.load_dataset(FLIM_DATA["sdt"], flim=True, binning=3, pixel_mask=[[True]])
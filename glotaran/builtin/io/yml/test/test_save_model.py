@@ -41,6 +41,7 @@ irf:
     normalize: true
     backsweep: false
     backsweep_period: null
+    fast_erfcx: false
     type: gaussian
     center: irf.center
     width: irf.width
@@ -13,6 +13,7 @@ from glotaran.io import load_result
 from glotaran.io import save_dataset
 from glotaran.io import save_result
 from glotaran.optimization.optimize import optimize
+from glotaran.project.dataclass_helpers import is_loaded
 from glotaran.project.result import Result
 from glotaran.testing.simulated_data.sequential_spectral_decay import SCHEME
 from glotaran.utils.io import chdir_context
@@ -66,6 +67,8 @@ def test_save_result_yml(tmp_path: Path, dummy_result: Result, path_is_absolute:
         clp_link_method: nearest
         maximum_number_function_evaluations: 1
         add_svd: true
+        svd_method: full
+        svd_components: null
         ftol: 1e-08
         gtol: 1e-08
         xtol: 1e-08
@@ -149,3 +152,49 @@ def test_save_result_yml_roundtrip(tmp_path: Path, dummy_result: Result, path_is
         assert_frame_equal(
             dummy_result.optimization_history.data, result_round_tripped.optimization_history.data
         )
+        assert result_round_tripped.profile is None
+
+
+def test_save_result_yml_roundtrip_profile(tmp_path: Path):
+    """The profile of a profiled optimization is saved and reloaded."""
+    scheme = replace(SCHEME, maximum_number_function_evaluations=1)
+    result = optimize(scheme, raise_exception=True, profile=True)
+    result_path = tmp_path / "testresult" / "result.yml"
+    save_result(result_path=result_path, result=result)
+
+    assert "profile: optimization_profile.csv" in result_path.read_text()
+    assert_frame_equal(load_result(result_path).profile.data, result.profile.data)
+
+
+def test_load_result_lazy(tmp_path: Path, dummy_result: Result):
+    """Only the result file is read until the other files are accessed."""
+    result_path = tmp_path / "testresult" / "result.yml"
+    save_result(result_path=result_path, result=dummy_result)
+    file_fields = (
+        "scheme",
+        "initial_parameters",
+        "optimized_parameters",
+        "parameter_history",
+        "optimization_history",
+        "data",
+    )
+
+    result = load_result(result_path)
+
+    assert not any(is_loaded(result, name) for name in file_fields)
+    assert result.cost == dummy_result.cost
+    assert result.chi_square == dummy_result.chi_square
+    assert result.root_mean_square_error == dummy_result.root_mean_square_error
+    assert_frame_equal(
+        result.optimized_parameters.to_dataframe(),
+        dummy_result.optimized_parameters.to_dataframe(),
+    )
+    assert not is_loaded(result, "data")
+    assert result.data["dataset_1"].equals(dummy_result.data["dataset_1"])
+    assert result.data.source_path == {
+        "dataset_1": (result_path.parent / "dataset_1.nc").as_posix()
+    }
+
+    eager_result = load_result(result_path, lazy=False)
+
+    assert all(is_loaded(eager_result, name) for name in file_fields)
@@ -25,6 +25,8 @@ clp_link_tolerance: 0.0
 clp_link_method: nearest
 maximum_number_function_evaluations: null
 add_svd: true
+svd_method: full
+svd_components: null
 ftol: 1e-08
 gtol: 1e-08
 xtol: 1e-08
@@ -16,8 +16,11 @@ from glotaran.io import save_model
 from glotaran.io import save_result
 from glotaran.io import save_scheme
 from glotaran.model import Model
+from glotaran.optimization.matrix_storage import MATRIX_RECIPE_ATTRIBUTE
+from glotaran.optimization.matrix_storage import restore_index_dependent_matrices
 from glotaran.parameter import Parameters
 from glotaran.plugin_system.megacomplex_registration import get_megacomplex
+from glotaran.project.dataclass_helpers import add_load_callback
 from glotaran.project.dataclass_helpers import asdict
 from glotaran.project.dataclass_helpers import fromdict
 from glotaran.project.project import Result
@@ -25,8 +28,11 @@ from glotaran.project.scheme import Scheme
 from glotaran.utils.sanitize import sanitize_yaml
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any
 
+    import xarray as xr
+
 
 @register_project_io(["yml", "yaml", "yml_str"])
 class YmlProjectIo(ProjectIoInterface):
@@ -149,13 +155,18 @@ class YmlProjectIo(ProjectIoInterface):
         scheme_dict = asdict(scheme, folder=Path(file_name).parent)
         write_dict(scheme_dict, file_name=file_name)
 
-    def load_result(self, result_path: str) -> Result:
+    def load_result(self, result_path: str, *, lazy: bool = True) -> Result:
         """Create a :class:`Result` instance from the specs defined in a file.
 
         Parameters
         ----------
         result_path : str
             Path containing the result data.
+        lazy : bool
+            Whether to load the scheme, parameters, histories and data on first access
+            instead of immediately. The values saved in the ``result.yml`` (e.g. ``cost``,
+            ``chi_square`` or ``root_mean_square_error``) are available without reading
+            any other file. Defaults to True.
 
         Returns
         -------
@@ -170,7 +181,19 @@ class YmlProjectIo(ProjectIoInterface):
             spec["number_of_residuals"] = spec.pop("number_of_data_points")
         if "number_of_parameters" in spec:
             spec["number_of_free_parameters"] = spec.pop("number_of_parameters")
-        return fromdict(Result, spec, folder=result_file_path.parent)
+        # Lazily loaded files are found even if the working directory changes
+        result_folder = result_file_path.parent.resolve()
+        result = fromdict(Result, spec, folder=result_folder, lazy=lazy)
+
+        def restore_matrices(data: Mapping[str, xr.Dataset]):
+            for label, dataset in data.items():
+                if MATRIX_RECIPE_ATTRIBUTE in dataset.attrs:
+                    restore_index_dependent_matrices(
+                        dataset, label, result.scheme.model, result.optimized_parameters
+                    )
+
+        add_load_callback(result, "data", restore_matrices)
+        return result
 
     def save_result(
         self,
@@ -0,0 +1 @@
+"""Package containing the Zarr Data IO plugin."""
@@ -0,0 +1,113 @@
+"""Tests for the zarr data io plugin."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from glotaran.builtin.io.zarr.zarr_data_io import ZarrDataIo
+from glotaran.builtin.io.zarr.zarr_data_io import create_compressor
+from glotaran.builtin.io.zarr.zarr_data_io import infer_global_dimension
+from glotaran.io import load_dataset
+from glotaran.io import save_dataset
+
+zarr = pytest.importorskip("zarr")
+
+
+@pytest.fixture
+def dataset() -> xr.Dataset:
+    """Dataset with a float, int and string variable along the global dimension."""
+    dataset = xr.DataArray(
+        np.random.default_rng(0).normal(size=(50, 30)),
+        coords=[("time", np.linspace(-1, 10, 50)), ("spectral", np.linspace(400, 700, 30))],
+    ).to_dataset(name="data")
+    dataset["weight"] = xr.ones_like(dataset.data)
+    dataset["counts"] = ("spectral", np.arange(30))
+    dataset["labels"] = ("spectral", np.array([f"label_{i}" for i in range(30)]))
+    dataset["irf_center"] = 0.3
+    dataset.attrs["root_mean_square_error"] = 0.1
+    return dataset
+
+
+@pytest.mark.parametrize("global_chunk_size", (None, 1, 7, 30, 100))
+@pytest.mark.parametrize("compressor", ("lz4", "zstd", None))
+def test_save_load_round_trip(
+    tmp_path: Path, dataset: xr.Dataset, global_chunk_size: int | None, compressor: str | None
+):
+    """Saved and loaded dataset are equal."""
+    file_path = tmp_path / "dataset.zarr"
+    save_dataset(dataset, file_path, global_chunk_size=global_chunk_size, compressor=compressor)
+
+    loaded = load_dataset(file_path, number_of_threads=2)
+
+    assert loaded.equals(dataset)
+    assert loaded.attrs["root_mean_square_error"] == 0.1
+    assert loaded.source_path == file_path.as_posix()
+    assert isinstance(loaded.data.variable._data, np.ndarray)
+
+    chunks = zarr.open_group(file_path.as_posix())["data"].chunks
+    assert chunks == (50, min(global_chunk_size or 30, 30))
+
+
+def test_load_dataset_lazy(tmp_path: Path, dataset: xr.Dataset):
+    """Ranges of the global axis can be loaded without loading the whole dataset."""
+    file_path = tmp_path / "dataset.zarr"
+    save_dataset(dataset, file_path, global_chunk_size=5)
+
+    loaded = load_dataset(file_path, lazy=True)
+
+    assert not loaded.data.variable._in_memory
+    assert loaded.data.sel(spectral=slice(500, 600)).equals(
+        dataset.data.sel(spectral=slice(500, 600))
+    )
+
+
+def test_save_dataset_data_filters(tmp_path: Path, dataset: xr.Dataset):
+    """Only save filtered variables."""
+    file_path = tmp_path / "dataset.zarr"
+    ZarrDataIo("zarr").save_dataset(dataset, file_path.as_posix(), data_filters=["data"])
+
+    assert list(load_dataset(file_path).data_vars) == ["data"]
+
+
+def test_save_dataset_result_global_dimension(tmp_path: Path, dataset: xr.Dataset):
+    """Chunk along the ``global_dimension`` attribute of result datasets."""
+    dataset = dataset.transpose("spectral", "time")
+    dataset.attrs["global_dimension"] = "spectral"
+    file_path = tmp_path / "dataset.zarr"
+    save_dataset(dataset, file_path, global_chunk_size=4)
+
+    assert zarr.open_group(file_path.as_posix())["data"].chunks == (4, 50)
+    assert load_dataset(file_path).equals(dataset)
+
+
+def test_save_dataset_encoding(tmp_path: Path, dataset: xr.Dataset):
+    """Custom chunks are used instead of the chunks along the global dimension."""
+    file_path = tmp_path / "dataset.zarr"
+    save_dataset(
+        dataset, file_path, global_chunk_size=4, encoding={"weight": {"chunks": (10, 30)}}
+    )
+
+    group = zarr.open_group(file_path.as_posix())
+    assert group["data"].chunks == (50, 4)
+    assert group["weight"].chunks == (10, 30)
+    assert load_dataset(file_path).equals(dataset)
+
+
+def test_infer_global_dimension(dataset: xr.Dataset):
+    """Infer from attribute and data variable."""
+    assert infer_global_dimension(dataset) == "spectral"
+    dataset.attrs["global_dimension"] = "time"
+    assert infer_global_dimension(dataset) == "time"
+    assert infer_global_dimension(xr.Dataset()) is None
+
+
+def test_create_compressor():
+    """Create blosc compressor from name and raise for unknown names."""
+    assert create_compressor("zstd", 3).cname == "zstd"
+    assert create_compressor(None, 3) is None
+
+    with pytest.raises(ValueError, match="Unknown compressor 'foo'"):
+        create_compressor("foo", 3)
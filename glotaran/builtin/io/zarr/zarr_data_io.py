@@ -0,0 +1,282 @@
+"""Module containing the Zarr Data IO plugin.
+
+The data variables are stored in chunks along the global dimension, so ranges of the
+global axis (e.g. wavelength ranges) can be loaded without reading the whole file.
+The chunks are compressed, written and read by a pool of threads.
+
+This plugin requires the optional dependency ``zarr``
+(``pip install pyglotaran[zarr]``).
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+import xarray as xr
+
+from glotaran.io import DataIoInterface
+from glotaran.io import register_data_io
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from numcodecs.abc import Codec
+
+CHUNK_TARGET_SIZE = 2**22
+"""Number of bytes a chunk of the largest data variable should have by default."""
+
+
+def infer_global_dimension(dataset: xr.Dataset) -> str | None:
+    """Infer the name of the global dimension of a dataset.
+
+    Parameters
+    ----------
+    dataset: xr.Dataset
+        Dataset to infer the global dimension for.
+
+    Returns
+    -------
+    str | None
+        The ``global_dimension`` attribute of result datasets, the last dimension
+        of the ``data`` variable or None if neither exists.
+    """
+    if "global_dimension" in dataset.attrs:
+        return str(dataset.attrs["global_dimension"])
+    if "data" in dataset and dataset["data"].ndim > 0:
+        return str(dataset["data"].dims[-1])
+    return None
+
+
+def create_compressor(compressor: str | Codec | None, compression_level: int) -> Codec | None:
+    """Create the compressor of the chunks.
+
+    Parameters
+    ----------
+    compressor: str | Codec | None
+        Name of a blosc compressor (e.g. ``"zstd"`` or ``"lz4"``), a ``numcodecs``
+        codec instance or None to store the chunks uncompressed.
+    compression_level: int
+        Compression level of a blosc compressor between 0 and 9.
+
+    Returns
+    -------
+    Codec | None
+        The compressor.
+
+    Raises
+    ------
+    ValueError
+        If ``compressor`` is not the name of a blosc compressor.
+    """
+    if not isinstance(compressor, str):
+        return compressor
+
+    from numcodecs import Blosc
+    from numcodecs.blosc import list_compressors
+
+    if compressor not in list_compressors():
+        raise ValueError(
+            f"Unknown compressor {compressor!r}, supported compressors are: "
+            f"{list_compressors()}."
+        )
+    return Blosc(cname=compressor, clevel=compression_level, shuffle=Blosc.SHUFFLE)
+
+
+def iterate_blocks(
+    variable: xr.Variable, dimension: str, block_size: int
+) -> Iterator[tuple[slice, ...]]:
+    """Iterate over the indices of the blocks of a variable along a dimension.
+
+    Parameters
+    ----------
+    variable: xr.Variable
+        The variable to split into blocks.
+    dimension: str
+        The dimension to split along.
+    block_size: int
+        The size of the blocks along ``dimension``.
+
+    Yields
+    ------
+    tuple[slice, ...]
+        Index of a block.
+    """
+    axis = variable.get_axis_num(dimension)
+    for start in range(0, variable.shape[axis], block_size):
+        index = [slice(None)] * variable.ndim
+        index[axis] = slice(start, start + block_size)
+        yield tuple(index)
+
+
+@register_data_io("zarr")
+class ZarrDataIo(DataIoInterface):
+    """Plugin for Zarr data io."""
+
+    def load_dataset(
+        self, file_name: str, *, lazy: bool = False, number_of_threads: int | None = None
+    ) -> xr.Dataset:
+        """Load a ``*.zarr`` store into a :xarraydoc:`Dataset`.
+
+        Parameters
+        ----------
+        file_name: str
+            Path to the ``*.zarr`` store that should be loaded.
+        lazy: bool
+            Whether to read the data variables on access instead of loading them into memory.
+            Selecting a range of the global axis of a lazily loaded dataset only reads the
+            chunks of this range. Defaults to False.
+        number_of_threads: int | None
+            Number of threads reading the chunks. Defaults to None, which uses the default
+            of :class:`concurrent.futures.ThreadPoolExecutor`.
+
+        Returns
+        -------
+        xr.Dataset
+        """
+        dataset = xr.open_zarr(file_name, chunks=None)
+        if lazy:
+            return dataset
+
+        global_dimension = infer_global_dimension(dataset)
+        arrays = {
+            name: np.empty(variable.shape, dtype=variable.dtype)
+            for name, variable in dataset.data_vars.items()
+        }
+        tasks: list[tuple[Hashable, tuple[slice, ...]]] = []
+        for name, data_array in dataset.data_vars.items():
+            variable = data_array.variable
+            if global_dimension in variable.dims:
+                block_size = variable.encoding["preferred_chunks"][global_dimension]
+                tasks += [
+                    (name, index)
+                    for index in iterate_blocks(variable, global_dimension, block_size)
+                ]
+            else:
+                tasks.append((name, tuple(slice(None) for _ in variable.dims)))
+
+        def read_block(task: tuple[Hashable, tuple[slice, ...]]):
+            name, index = task
+            arrays[name][index] = dataset[name].variable[index].values
+
+        with ThreadPoolExecutor(number_of_threads) as executor:
+            list(executor.map(read_block, tasks))
+
+        for name, array in arrays.items():
+            dataset[name] = dataset[name].variable.copy(data=array)
+        return dataset.load()
+
+    def save_dataset(
+        self,
+        dataset: xr.Dataset,
+        file_name: str,
+        *,
+        data_filters: list[str] | None = None,
+        global_dimension: str | None = None,
+        global_chunk_size: int | None = None,
+        compressor: str | Codec | None = "lz4",
+        compression_level: int = 5,
+        number_of_threads: int | None = None,
+        encoding: Mapping[str, Mapping[str, Any]] | None = None,
+    ):
+        """Write a :xarraydoc:`Dataset` to the ``*.zarr`` store at path ``file_name``.
+
+        Parameters
+        ----------
+        dataset: xr.Dataset
+            :xarraydoc:`Dataset` that should be written to file.
+        file_name: str
+            Path of the store to write ``dataset`` to.
+        data_filters: list[str] | None
+            List of data variable names that should be written to file. Defaults to None.
+        global_dimension: str | None
+            Dimension the data variables are chunked along. Defaults to None, which infers it
+            with :func:`infer_global_dimension`.
+        global_chunk_size: int | None
+            Size of the chunks along the global dimension. Defaults to None, which chooses
+            the size so the chunks of the largest data variable have about 4 MiB.
+        compressor: str | Codec | None
+            Name of a blosc compressor, a ``numcodecs`` codec or None to disable compression.
+            Defaults to ``"lz4"``, which compresses measured data about as well as ``"zstd"``
+            but is several times faster.
+        compression_level: int
+            Compression level of a blosc compressor between 0 and 9. Defaults to 5.
+        number_of_threads: int | None
+            Number of threads writing the chunks. Defaults to None, which uses the default
+            of :class:`concurrent.futures.ThreadPoolExecutor`.
+        encoding: Mapping[str, Mapping[str, Any]] | None
+            Zarr encoding of single variables (e.g. ``{"fitted_data": {"chunks": (100, 1)}}``),
+            which takes precedence over the chunking and compression options.
+            Variables with custom ``"chunks"`` are written in a single block.
+            Defaults to None.
+        """
+        import zarr
+
+        data_to_save = dataset if data_filters is None else dataset[data_filters]
+        global_dimension = global_dimension or infer_global_dimension(data_to_save)
+        codec = create_compressor(compressor, compression_level)
+
+        custom_encoding = {name: dict(options) for name, options in (encoding or {}).items()}
+        template = data_to_save.copy()
+        for variable in template.variables.values():
+            variable.encoding = {}
+        variable_encoding = {name: {"compressor": codec} for name in template.data_vars}
+        # Float variables along the global dimension are written in parallel,
+        # the template only contains their metadata since empty chunks are not written.
+        chunked_variables = [
+            name
+            for name, data_array in data_to_save.data_vars.items()
+            if global_dimension in data_array.dims
+            and data_array.dtype.kind == "f"
+            and "chunks" not in custom_encoding.get(str(name), {})
+        ]
+        if chunked_variables:
+            if global_chunk_size is None:
+                largest_variable = max(
+                    (data_to_save[name].variable for name in chunked_variables),
+                    key=lambda variable: variable.nbytes,
+                )
+                column_size = largest_variable.nbytes // max(
+                    largest_variable.sizes[global_dimension], 1
+                )
+                global_chunk_size = CHUNK_TARGET_SIZE // max(column_size, 1)
+            global_chunk_size = max(
+                min(global_chunk_size, data_to_save.sizes[global_dimension]), 1
+            )
+            for name in chunked_variables:
+                variable = data_to_save[name].variable
+                template[name] = variable.copy(
+                    data=np.broadcast_to(np.array(np.nan, dtype=variable.dtype), variable.shape)
+                )
+                variable_encoding[name] |= {
+                    "chunks": tuple(
+                        global_chunk_size if dimension == global_dimension else size
+                        for dimension, size in variable.sizes.items()
+                    ),
+                    "write_empty_chunks": False,
+                }
+
+        for name, options in custom_encoding.items():
+            variable_encoding[name] = variable_encoding.get(name, {}) | options
+        template.to_zarr(file_name, mode="w", encoding=variable_encoding)
+        if not chunked_variables:
+            return
+
+        group = zarr.open_group(file_name, mode="r+")
+
+        def write_block(task: tuple[Hashable, tuple[slice, ...]]):
+            name, index = task
+            group[name][index] = data_to_save[name].variable[index].values
+
+        tasks = [
+            (name, index)
+            for name in chunked_variables
+            for index in iterate_blocks(
+                data_to_save[name].variable, global_dimension, global_chunk_size
+            )
+        ]
+        with ThreadPoolExecutor(number_of_threads) as executor:
+            list(executor.map(write_block, tasks))
@@ -16,6 +16,7 @@ from glotaran.model import Megacomplex
 from glotaran.model import ModelError
 from glotaran.model import ParameterType
 from glotaran.model import megacomplex
+from glotaran.utils.jit import jit_kernel
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
@@ -51,36 +52,26 @@ class CoherentArtifactMegacomplex(Megacomplex):
             else (model_axis.size, self.order)
         )
         matrix = np.zeros(matrix_shape, dtype=np.float64)
-        if index_dependent(dataset_model):
-            centers, widths = [], []
-            for global_index in range(global_axis.size):
-                center, width = self.get_irf_parameter(irf, global_index, global_axis)
-                centers.append(center)
-                widths.append(width)
-            _calculate_coherent_artifact_matrix(
-                matrix,
-                np.asarray(centers),
-                np.asarray(widths),
-                global_axis.size,
-                model_axis,
-                self.order,
-            )
-
-        else:
-            center, width = self.get_irf_parameter(irf, None, global_axis)
-            _calculate_coherent_artifact_matrix_on_index(
-                matrix, center, width, model_axis, self.order
-            )
+        centers, widths = self.get_irf_parameter(irf, global_axis, index_dependent(dataset_model))
+        calculate_coherent_artifact_matrix(
+            matrix if index_dependent(dataset_model) else matrix[np.newaxis],
+            centers,
+            widths,
+            model_axis,
+            self.order,
+        )
 
         return self.compartments(), matrix
 
     def get_irf_parameter(
-        self, irf: IrfMultiGaussian, global_index: int | None, global_axis: ArrayLike
-    ) -> tuple[float, float]:
-        center, width, _, shift, _, _ = irf.parameter(global_index, global_axis)
-        center = center[0] - shift
-        width = self.width.value if self.width is not None else width[0]
-        return center, width
+        self, irf: IrfMultiGaussian, global_axis: ArrayLike, index_dependent: bool
+    ) -> tuple[ArrayLike, ArrayLike]:
+        centers, widths, _, shifts, _, _ = irf.parameter_arrays(global_axis, index_dependent)
+        centers = centers[:, 0] - shifts
+        widths = (
+            np.full(centers.shape, self.width.value) if self.width is not None else widths[:, 0]
+        )
+        return centers, np.ascontiguousarray(widths)
 
     def compartments(self):
         return [f"coherent_artifact_{i}_{self.label}" for i in range(1, self.order + 1)]
@@ -110,23 +101,38 @@ class CoherentArtifactMegacomplex(Megacomplex):
         retrieve_irf(dataset_model, dataset, global_dimension)
 
 
-@nb.jit(nopython=True, parallel=False)
-def _calculate_coherent_artifact_matrix(
-    matrix, centers, widths, global_axis_size, model_axis, order
-):
-    for i in nb.prange(global_axis_size):
-        _calculate_coherent_artifact_matrix_on_index(
-            matrix[i], centers[i], widths[i], model_axis, order
-        )
-
-
-@nb.jit(nopython=True, parallel=True)
-def _calculate_coherent_artifact_matrix_on_index(matrix, center, width, axis, order):
-    matrix[:, 0] = np.exp(-1 * (axis - center) ** 2 / (2 * width**2))
-    if order > 1:
-        matrix[:, 1] = matrix[:, 0] * (center - axis) / width**2
-
-    if order > 2:
-        matrix[:, 2] = (
-            matrix[:, 0] * (center**2 - width**2 - 2 * center * axis + axis**2) / width**4
-        )
+@jit_kernel(
+    "void(float64[:, :, ::1], float64[::1], float64[::1], float64[::1], int64)", parallel=True
+)
+def calculate_coherent_artifact_matrix(matrix, centers, widths, model_axis, order):
+    """Calculate the coherent artifact matrix for all indices on the global axis.
+
+    The columns are the gaussian of the irf and its first and second derivative with respect
+    to the center. The work is parallelized over the flattened (global index, model axis) domain.
+
+    Parameters
+    ----------
+    matrix: ArrayLike
+        The matrix of shape ``(global, model, order)``.
+    centers: ArrayLike
+        The irf center for each index on the global axis.
+    widths: ArrayLike
+        The irf width for each index on the global axis.
+    model_axis: ArrayLike
+        The model axis.
+    order: int
+        The order of the coherent artifact.
+    """
+    n_model = model_axis.size
+    for n_gm in nb.prange(centers.size * n_model):
+        n_g, n_m = n_gm // n_model, n_gm % n_model
+        inverse_variance = 1 / (widths[n_g] * widths[n_g])
+        distance = model_axis[n_m] - centers[n_g]
+        gaussian = np.exp(-0.5 * distance * distance * inverse_variance)
+        matrix[n_g, n_m, 0] = gaussian
+        if order > 1:
+            matrix[n_g, n_m, 1] = -gaussian * distance * inverse_variance
+        if order > 2:
+            matrix[n_g, n_m, 2] = (
+                gaussian * (distance * distance * inverse_variance - 1) * inverse_variance
+            )
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 import numba as nb
 import numpy as np
 import xarray as xr
-from scipy.special import erf
 
 from glotaran.builtin.megacomplexes.decay.decay_parallel_megacomplex import DecayDatasetModel
 from glotaran.builtin.megacomplexes.decay.irf import IrfMultiGaussian
@@ -18,10 +17,28 @@ from glotaran.model import ParameterType
 from glotaran.model import attribute
 from glotaran.model import megacomplex
 from glotaran.parameter import Parameters
+from glotaran.utils.jit import jit_kernel
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
 
+SQRT2 = np.sqrt(2)
+SQRT_PI = np.sqrt(np.pi)
+_EPSILON = np.finfo(np.float64).eps
+
+
+def _faddeeva_coefficients(n_coefficients: int) -> tuple[float, np.ndarray]:
+    """Calculate the parameter and polynomial coefficients of :func:`faddeeva`."""
+    m = 2 * n_coefficients
+    length = np.sqrt(n_coefficients / np.sqrt(2))
+    t = length * np.tan(np.arange(-m + 1, m) * np.pi / (2 * m))
+    f = np.concatenate(([0], np.exp(-(t**2)) * (length**2 + t**2)))
+    coefficients = np.real(np.fft.fft(np.fft.fftshift(f))) / (2 * m)
+    return length, coefficients[n_coefficients:0:-1].copy()
+
+
+_FADDEEVA_L, _FADDEEVA_COEFFICIENTS = _faddeeva_coefficients(40)
+
 
 class OscillationParameterIssue(ItemIssue):
     def __init__(self, label: str, len_labels: int, len_frequencies: int, len_rates: int):
@@ -103,15 +120,19 @@ class DampedOscillationMegacomplex(Megacomplex):
         if irf is None:
             calculate_damped_oscillation_matrix_no_irf(matrix, frequencies, rates, model_axis)
         elif isinstance(irf, IrfMultiGaussian):
-            if index_dependent(dataset_model):
-                for i in range(global_axis.size):
-                    calculate_damped_oscillation_matrix_gaussian_irf_on_index(
-                        matrix[i], frequencies, rates, irf, i, global_axis, model_axis
-                    )
-            else:
-                calculate_damped_oscillation_matrix_gaussian_irf_on_index(
-                    matrix, frequencies, rates, irf, None, global_axis, model_axis
-                )
+            centers, widths, scales, shifts, _, _ = irf.parameter_arrays(
+                global_axis, index_dependent(dataset_model)
+            )
+            calculate_damped_oscillation_matrix_gaussian_irf(
+                matrix if index_dependent(dataset_model) else matrix[np.newaxis],
+                frequencies,
+                rates,
+                model_axis,
+                centers + shifts[:, np.newaxis],
+                widths,
+                scales,
+            )
+            matrix /= np.sum(scales)
 
         return clp_label, matrix
 
@@ -188,7 +209,7 @@ class DampedOscillationMegacomplex(Megacomplex):
             )
 
 
-@nb.jit(nopython=True, parallel=True)
+@jit_kernel("void(float64[:, ::1], float64[::1], float64[::1], float64[::1])", parallel=True)
 def calculate_damped_oscillation_matrix_no_irf(matrix, frequencies, rates, axis):
     idx = 0
     for frequency, rate in zip(frequencies, rates):
@@ -198,100 +219,101 @@ def calculate_damped_oscillation_matrix_no_irf(matrix, frequencies, rates, axis)
         idx += 2
 
 
-def calculate_damped_oscillation_matrix_gaussian_irf_on_index(
+@jit_kernel("complex128(complex128)", nogil=True)
+def faddeeva(z: complex) -> complex:
+    """Evaluate the Faddeeva function ``w(z) = exp(-z**2) * erfc(-i * z)`` for ``Im(z) >= 0``.
+
+    Uses the rational approximation by J. A. C. Weideman (SIAM J. Numer. Anal., 1994)
+    with a relative error below 1e-13.
+
+    Parameters
+    ----------
+    z: complex
+        Argument in the upper half of the complex plane.
+
+    Returns
+    -------
+    complex
+        Value of the Faddeeva function.
+    """
+    denominator = _FADDEEVA_L - 1j * z
+    argument = (_FADDEEVA_L + 1j * z) / denominator
+    polynomial = 0j
+    for coefficient in _FADDEEVA_COEFFICIENTS:
+        polynomial = polynomial * argument + coefficient
+    return 2 * polynomial / (denominator * denominator) + 1 / SQRT_PI / denominator
+
+
+@jit_kernel(
+    "void(float64[:, :, ::1], float64[::1], float64[::1], float64[::1], float64[:, ::1], "
+    "float64[:, ::1], float64[::1])",
+    parallel=True,
+)
+def calculate_damped_oscillation_matrix_gaussian_irf(
     matrix: ArrayLike,
     frequencies: ArrayLike,
     rates: ArrayLike,
-    irf: IrfMultiGaussian,
-    global_index: int | None,
-    global_axis: ArrayLike,
     model_axis: ArrayLike,
+    all_centers: ArrayLike,
+    all_widths: ArrayLike,
+    scales: ArrayLike,
 ):
-    centers, widths, scales, shift, _, _ = irf.parameter(global_index, global_axis)
-    for center, width, scale in zip(centers, widths, scales):
-        matrix += calculate_damped_oscillation_matrix_gaussian_irf(
-            frequencies,
-            rates,
-            model_axis,
-            center,
-            width,
-            shift,
-            scale,
-        )
-    matrix /= np.sum(scales)
+    """Calculate the damped oscillation matrix taking into account a gaussian irf
 
+    The oscillations of all indices on the global axis, all oscillations and all irf
+    components are evaluated in a single pass, parallelized over the flattened
+    (global index, oscillation) domain. The real part of an oscillation is added to
+    the column of the oscillation and the imaginary part to the column ``len(frequencies)``
+    places after it.
 
-def calculate_damped_oscillation_matrix_gaussian_irf(
-    frequencies: np.ndarray,
-    rates: np.ndarray,
-    model_axis: np.ndarray,
-    center: float,
-    width: float,
-    shift: float,
-    scale: float,
-):
-    """Calculate the damped oscillation matrix taking into account a gaussian irf
+    With ``k = rate + i * frequency``, ``s = t - center`` and ``u = (s - k * width**2) /
+    (sqrt(2) * width)`` the oscillation is ``exp(-k * s + k**2 * width**2 / 2) * (1 + erf(u))``,
+    which is evaluated with the Faddeeva function to avoid the complex error function.
 
     Parameters
     ----------
-    frequencies : np.ndarray
+    matrix : ArrayLike
+        The matrix of shape ``(global, model, 2 * oscillations)`` the oscillations are added to.
+    frequencies : ArrayLike
         an array of frequencies in THz, one per oscillation
-    rates : np.ndarray
+    rates : ArrayLike
         an array of rates, one per oscillation
-    model_axis : np.ndarray
+    model_axis : ArrayLike
         the model axis (time)
-    center : float
-        the center of the gaussian IRF
-    width : float
-        the width (σ) parameter of the the IRF
-    shift : float
-        a shift parameter per item on the global axis
-    scale : float
-        the scale parameter to scale the matrix by
-
-    Returns
-    -------
-    np.ndarray
-        An array of the real and imaginary part of the oscillation matrix,
-        the shape being (len(model_axis), 2*len(frequencies)), with the first
-        half of the second dimension representing the real part,
-        and the other the imagine part of the oscillation
+    all_centers : ArrayLike
+        The irf centers of shape ``(global, irf components)`` with the shift applied.
+    all_widths : ArrayLike
+        The irf widths (σ) of shape ``(global, irf components)``.
+    scales : ArrayLike
+        the scale parameters of the irf components
     """
-    shifted_axis = model_axis - center - shift
-    # For calculations using the negative rates we use the time axis
-    # from the beginning up to 5 σ from the irf center
-    left_shifted_axis_indices = np.where(shifted_axis < 5 * width)[0]
-    left_shifted_axis = shifted_axis[left_shifted_axis_indices]
-    neg_idx = np.where(rates < 0)[0]
-    # For calculations using the positive rates axis we use the time axis
-    # from 5 σ before the irf center until the end
-    right_shifted_axis_indices = np.where(shifted_axis > -5 * width)[0]
-    right_shifted_axis = shifted_axis[right_shifted_axis_indices]
-    pos_idx = np.where(rates >= 0)[0]
-
-    d = width**2
-    k = rates + 1j * frequencies
-    dk = k * d
-    sqwidth = np.sqrt(2) * width
-
-    a = np.zeros((len(model_axis), len(rates)), dtype=np.complex128)
-    a[np.ix_(right_shifted_axis_indices, pos_idx)] = np.exp(
-        (-1 * right_shifted_axis[:, None] + 0.5 * dk[pos_idx]) * k[pos_idx]
-    )
-
-    a[np.ix_(left_shifted_axis_indices, neg_idx)] = np.exp(
-        (-1 * left_shifted_axis[:, None] + 0.5 * dk[neg_idx]) * k[neg_idx]
-    )
-
-    b = np.zeros((len(model_axis), len(rates)), dtype=np.complex128)
-    b[np.ix_(right_shifted_axis_indices, pos_idx)] = 1 + erf(
-        (right_shifted_axis[:, None] - dk[pos_idx]) / sqwidth
-    )
-    # For negative rates we flip the sign of the `erf` by using `-sqwidth` in lieu of `sqwidth`
-    b[np.ix_(left_shifted_axis_indices, neg_idx)] = 1 + erf(
-        (left_shifted_axis[:, None] - dk[neg_idx]) / -sqwidth
-    )
-
-    osc = a * b * scale
-
-    return np.concatenate((osc.real, osc.imag), axis=1)
+    n_global, n_oscillations, n_irf = all_centers.shape[0], frequencies.size, all_centers.shape[1]
+    for n_wo in nb.prange(n_global * n_oscillations):
+        n_w, n_o = n_wo // n_oscillations, n_wo % n_oscillations
+        rate = rates[n_o]
+        k = rate + 1j * frequencies[n_o]
+        for n_i in range(n_irf):
+            center, width, scale = all_centers[n_w, n_i], all_widths[n_w, n_i], scales[n_i]
+            dk = k * width * width
+            sqwidth = SQRT2 * width
+            for n_t in range(model_axis.size):
+                shifted = model_axis[n_t] - center
+                # For positive rates we use the time axis from 5 σ before the irf center
+                # until the end and for negative rates from the beginning up to 5 σ after it
+                if (rate >= 0 and shifted <= -5 * width) or (rate < 0 and shifted >= 5 * width):
+                    continue
+                a = np.exp((-1 * shifted + 0.5 * dk) * k)
+                u = (shifted - dk) / sqwidth
+                gaussian = np.exp(-shifted * shifted / (2 * width * width))
+                # ``a * exp(-u**2)`` equals ``gaussian``, the sign of ``Re(u)`` determines which
+                # representation of ``erfc`` keeps the Faddeeva function in the upper half plane.
+                # For negative rates the sign of the ``erf`` is flipped.
+                # Far from the irf center ``1 + erf(u)`` is 2 to machine precision (``|w| <= 1``).
+                if (u.real <= 0) == (rate >= 0):
+                    osc = gaussian * faddeeva(-1j * u if rate >= 0 else 1j * u)
+                elif gaussian <= _EPSILON * abs(a):
+                    osc = 2 * a
+                else:
+                    osc = 2 * a - gaussian * faddeeva(1j * u if rate >= 0 else -1j * u)
+                matrix[n_w, n_t, n_o] += scale * osc.real
+                matrix[n_w, n_t, n_oscillations + n_o] += scale * osc.imag
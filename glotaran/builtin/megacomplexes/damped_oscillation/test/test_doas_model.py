@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from scipy.special import erf
 
 from glotaran.builtin.megacomplexes.damped_oscillation import DampedOscillationMegacomplex
+from glotaran.builtin.megacomplexes.damped_oscillation.damped_oscillation_megacomplex import (
+    calculate_damped_oscillation_matrix_gaussian_irf,
+)
+from glotaran.builtin.megacomplexes.damped_oscillation.damped_oscillation_megacomplex import (
+    faddeeva,
+)
 from glotaran.builtin.megacomplexes.decay import DecayMegacomplex
 from glotaran.builtin.megacomplexes.spectral import SpectralMegacomplex
 from glotaran.model import Model
@@ -386,3 +393,37 @@ def test_doas_model(suite):
     assert "damped_oscillation_sin" in resultdata
     assert "damped_oscillation_associated_spectra" in resultdata
     assert "damped_oscillation_phase" in resultdata
+
+
+def test_faddeeva():
+    """Faddeeva function matches its definition via the complex error function."""
+    for z in (0.5 + 0.1j, -3 + 2j, 10 + 0.01j, 1j):
+        assert np.isclose(faddeeva(z), np.exp(-(z**2)) * (1 - erf(-1j * z)), rtol=1e-12)
+
+
+def test_damped_oscillation_matrix_gaussian_irf():
+    """Kernel matches the direct evaluation with the complex error function."""
+    frequencies = np.array([0.5, 3.0, 12.0])
+    rates = np.array([0.1, 1.5, -0.3])
+    model_axis = np.linspace(-1, 10, 300)
+    centers = np.array([[0.3], [0.5]])
+    widths = np.array([[0.1], [0.15]])
+    matrix = np.zeros((2, model_axis.size, 2 * frequencies.size))
+
+    calculate_damped_oscillation_matrix_gaussian_irf(
+        matrix, frequencies, rates, model_axis, centers, widths, np.array([1.0])
+    )
+
+    for index, (center, width) in enumerate(zip(centers[:, 0], widths[:, 0])):
+        shifted = model_axis[:, None] - center
+        k = rates + 1j * frequencies
+        sign = np.where(rates >= 0, 1, -1)
+        window = sign * shifted > -5 * width
+        oscillation = np.where(
+            window,
+            np.exp((-shifted + 0.5 * k * width**2) * k)
+            * (1 + erf((shifted - k * width**2) / (sign * np.sqrt(2) * width))),
+            0,
+        )
+        assert np.allclose(matrix[index, :, :3], oscillation.real)
+        assert np.allclose(matrix[index, :, 3:], oscillation.imag)
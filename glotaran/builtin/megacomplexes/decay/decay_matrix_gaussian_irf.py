@@ -1,82 +1,246 @@
 from __future__ import annotations
 
-import ctypes
+import math
 from typing import TYPE_CHECKING
 
 import numba as nb
 import numpy as np
-from numba.extending import get_cython_function_address
+from scipy.special import erfcx as _scipy_erfcx
+
+from glotaran.utils.jit import jit_kernel
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
-# This is a work around to use scipy.special function with numba
-_dble = ctypes.c_double
 
-functype = ctypes.CFUNCTYPE(_dble, _dble)
+SQRT2 = np.sqrt(2)
+SQRT_PI = np.sqrt(np.pi)
 
-erf_addr = get_cython_function_address("scipy.special.cython_special", "__pyx_fuse_1erf")
-erfcx_addr = get_cython_function_address("scipy.special.cython_special", "__pyx_fuse_1erfcx")
+# The erfcx branch of the kernel is only taken for arguments > 1, so the table starts there.
+# Between the table nodes erfcx is interpolated with cubic hermite polynomials using the
+# analytic derivative ``erfcx'(x) = 2 x erfcx(x) - 2 / sqrt(pi)``, beyond the table the
+# asymptotic expansion is used. Both keep the relative error below ``FAST_ERFCX_MAX_REL_ERROR``.
+FAST_ERFCX_TABLE_START = 1.0
+FAST_ERFCX_TABLE_STOP = 32.0
+FAST_ERFCX_TABLE_STEP = 1 / 64
+FAST_ERFCX_MAX_REL_ERROR = 1e-9
+_FAST_ERFCX_X = np.arange(
+    FAST_ERFCX_TABLE_START,
+    FAST_ERFCX_TABLE_STOP + FAST_ERFCX_TABLE_STEP,
+    FAST_ERFCX_TABLE_STEP,
+)
+FAST_ERFCX_VALUES = _scipy_erfcx(_FAST_ERFCX_X)
+FAST_ERFCX_DERIVATIVES = 2 * _FAST_ERFCX_X * FAST_ERFCX_VALUES - 2 / SQRT_PI
 
-erf = functype(erf_addr)
-erfcx = functype(erfcx_addr)
+# Above this value ``exp(x**2)`` loses precision and erfcx is evaluated asymptotically.
+_ERFCX_ASYMPTOTIC_START = 26.0
 
-SQRT2 = np.sqrt(2)
+# Upper bound for the exponents of the factors used for the shared exponentials,
+# above it the exponential is evaluated directly to avoid overflows.
+_MAX_SHARED_EXPONENT = 600.0
 
 
-@nb.jit(nopython=True, parallel=False)
-def calculate_decay_matrix_gaussian_irf_on_index(
+@jit_kernel("float64(float64)", nogil=True)
+def _erfcx_asymptotic(x: float) -> float:
+    """Evaluate erfcx for large ``x`` with its asymptotic expansion."""
+    inv_x2 = 1 / (x * x)
+    return (
+        (1 - inv_x2 * (0.5 - inv_x2 * (0.75 - inv_x2 * (1.875 - inv_x2 * 6.5625)))) / x / SQRT_PI
+    )
+
+
+@jit_kernel("float64(float64)", nogil=True)
+def erfcx(x: float) -> float:
+    """Evaluate the scaled complementary error function ``exp(x**2) * erfc(x)``.
+
+    Unlike the scipy implementation, this can be cached by numba.
+
+    Parameters
+    ----------
+    x: float
+        Argument.
+
+    Returns
+    -------
+    float
+        ``erfcx(x)`` with a relative error of about 1e-13.
+    """
+    if x < _ERFCX_ASYMPTOTIC_START:
+        return math.exp(x * x) * math.erfc(x)
+    return _erfcx_asymptotic(x)
+
+
+@jit_kernel("float64(float64)", nogil=True)
+def fast_erfcx(x: float) -> float:
+    """Evaluate the scaled complementary error function for ``x >= 1`` from a table.
+
+    Parameters
+    ----------
+    x: float
+        Argument, needs to be larger or equal than ``FAST_ERFCX_TABLE_START``.
+
+    Returns
+    -------
+    float
+        Approximation of ``erfcx(x)`` with a relative error below ``FAST_ERFCX_MAX_REL_ERROR``.
+    """
+    if x >= FAST_ERFCX_TABLE_STOP:
+        return _erfcx_asymptotic(x)
+    position = (x - FAST_ERFCX_TABLE_START) / FAST_ERFCX_TABLE_STEP
+    index = int(position)
+    u = position - index
+    u2 = u * u
+    u3 = u2 * u
+    return (
+        (2 * u3 - 3 * u2 + 1) * FAST_ERFCX_VALUES[index]
+        + (u3 - 2 * u2 + u) * FAST_ERFCX_TABLE_STEP * FAST_ERFCX_DERIVATIVES[index]
+        + (-2 * u3 + 3 * u2) * FAST_ERFCX_VALUES[index + 1]
+        + (u3 - u2) * FAST_ERFCX_TABLE_STEP * FAST_ERFCX_DERIVATIVES[index + 1]
+    )
+
+
+@jit_kernel("float64[:, :, ::1](float64[::1], float64[::1], float64[::1])", parallel=True)
+def calculate_shared_exponentials(
+    rates: ArrayLike, times: ArrayLike, reference_centers: ArrayLike
+) -> ArrayLike:
+    """Calculate ``exp(-rate * (time - reference_center))`` for all irf components.
+
+    Parameters
+    ----------
+    rates: ArrayLike
+        The decay rates.
+    times: ArrayLike
+        The time axis.
+    reference_centers: ArrayLike
+        One reference center per irf component.
+
+    Returns
+    -------
+    ArrayLike
+        Array of shape ``(irf components, times, rates)``.
+    """
+    exponentials = np.empty((reference_centers.size, times.size, rates.size))
+    for n_ir in nb.prange(reference_centers.size * rates.size):
+        n_i, n_r = n_ir // rates.size, n_ir % rates.size
+        r_n = rates[n_r]
+        for n_t in range(times.size):
+            exponentials[n_i, n_t, n_r] = np.exp(-r_n * (times[n_t] - reference_centers[n_i]))
+    return exponentials
+
+
+@jit_kernel(
+    "void(float64[:, :, ::1], float64[::1], float64[::1], float64[:, ::1], float64[:, ::1], "
+    "float64[::1], boolean, float64, boolean)",
+    parallel=True,
+)
+def calculate_decay_matrix_gaussian_irf(
     matrix: ArrayLike,
     rates: ArrayLike,
     times: ArrayLike,
-    centers: ArrayLike,
-    widths: ArrayLike,
+    all_centers: ArrayLike,
+    all_widths: ArrayLike,
     scales: ArrayLike,
     backsweep: bool,
     backsweep_period: float | None,
+    use_fast_erfcx: bool = False,
 ):
-    """Calculates a decay matrix with a gaussian irf."""
-    for n_i in nb.prange(centers.size):
-        center, width, scale = centers[n_i], widths[n_i], scales[n_i]
-        for n_r in nb.prange(rates.size):
-            r_n = rates[n_r]
-            backsweep_valid = backsweep and abs(r_n) * backsweep_period > 0.001
+    """Calculates a decay matrix with a gaussian irf for all indices of the global axis.
+
+    The term ``exp(alpha * (alpha - 2 * beta))`` is factored into
+    ``exp(alpha**2 + rate * (center - reference_center))`` and the shared exponentials
+    ``exp(-rate * (time - reference_center))`` which only depend on the rate,
+    so they are calculated once for all indices.
+    The work is parallelized over the flattened (global index, rate) domain.
+
+    Parameters
+    ----------
+    matrix: ArrayLike
+        The matrix of shape ``(global, times, rates)`` the result gets added to.
+    rates: ArrayLike
+        The decay rates.
+    times: ArrayLike
+        The time axis.
+    all_centers: ArrayLike
+        The irf centers of shape ``(global, irf components)``.
+    all_widths: ArrayLike
+        The irf widths of shape ``(global, irf components)``.
+    scales: ArrayLike
+        The scales of the irf components.
+    backsweep: bool
+        Whether to add the backsweep.
+    backsweep_period: float | None
+        The backsweep period.
+    use_fast_erfcx: bool
+        Whether to use the tabulated :func:`fast_erfcx` instead of :func:`erfcx`.
+    """
+    n_global, n_rates, n_irf = all_centers.shape[0], rates.size, all_centers.shape[1]
+    reference_centers = np.empty(n_irf)
+    max_center_deviations = np.empty(n_irf)
+    for n_i in range(n_irf):
+        reference_centers[n_i] = np.mean(all_centers[:, n_i])
+        max_center_deviations[n_i] = np.max(np.abs(all_centers[:, n_i] - reference_centers[n_i]))
+    exponentials = calculate_shared_exponentials(rates, times, reference_centers)
+
+    for n_wr in nb.prange(n_global * n_rates):
+        n_w, n_r = n_wr // n_rates, n_wr % n_rates
+        r_n = rates[n_r]
+        backsweep_valid = backsweep and abs(r_n) * backsweep_period > 0.001
+        for n_i in range(n_irf):
+            center, width, scale = all_centers[n_w, n_i], all_widths[n_w, n_i], scales[n_i]
             alpha = (r_n * width) / SQRT2
-            for n_t in nb.prange(times.size):
+            use_shared = (
+                alpha * alpha + abs(r_n) * max_center_deviations[n_i] < _MAX_SHARED_EXPONENT
+            )
+            shared_factor = (
+                np.exp(alpha * alpha + r_n * (center - reference_centers[n_i]))
+                if use_shared
+                else 0.0
+            )
+            for n_t in range(times.size):
                 t_n = times[n_t]
                 beta = (t_n - center) / (width * SQRT2)
                 thresh = beta - alpha
                 if thresh < -1:
-                    matrix[n_t, n_r] += scale * 0.5 * erfcx(-thresh) * np.exp(-beta * beta)
+                    erfcx_value = fast_erfcx(-thresh) if use_fast_erfcx else erfcx(-thresh)
+                    matrix[n_w, n_t, n_r] += scale * 0.5 * erfcx_value * np.exp(-beta * beta)
+                elif use_shared:
+                    matrix[n_w, n_t, n_r] += (
+                        scale
+                        * 0.5
+                        * math.erfc(-thresh)
+                        * shared_factor
+                        * exponentials[n_i, n_t, n_r]
+                    )
                 else:
-                    matrix[n_t, n_r] += (
-                        scale * 0.5 * (1 + erf(thresh)) * np.exp(alpha * (alpha - 2 * beta))
+                    matrix[n_w, n_t, n_r] += (
+                        scale * 0.5 * math.erfc(-thresh) * np.exp(alpha * (alpha - 2 * beta))
                     )
-                if backsweep and backsweep_valid:
+                if backsweep_valid:
                     x1 = np.exp(-r_n * (t_n - center + backsweep_period))
                     x2 = np.exp(-r_n * ((backsweep_period / 2) - (t_n - center)))
                     x3 = np.exp(-r_n * backsweep_period)
-                    matrix[n_t, n_r] += scale * (x1 + x2) / (1 - x3)
+                    matrix[n_w, n_t, n_r] += scale * (x1 + x2) / (1 - x3)
 
 
-@nb.jit(nopython=True, parallel=True)
-def calculate_decay_matrix_gaussian_irf(
+def calculate_decay_matrix_gaussian_irf_on_index(
     matrix: ArrayLike,
     rates: ArrayLike,
     times: ArrayLike,
-    all_centers: ArrayLike,
-    all_widths: ArrayLike,
+    centers: ArrayLike,
+    widths: ArrayLike,
     scales: ArrayLike,
     backsweep: bool,
     backsweep_period: float | None,
+    use_fast_erfcx: bool = False,
 ):
-    for n_w in nb.prange(all_centers.shape[0]):
-        calculate_decay_matrix_gaussian_irf_on_index(
-            matrix[n_w],
-            rates,
-            times,
-            all_centers[n_w],
-            all_widths[n_w],
-            scales,
-            backsweep,
-            backsweep_period,
-        )
+    """Calculates a decay matrix with a gaussian irf for a single index."""
+    calculate_decay_matrix_gaussian_irf(
+        matrix[np.newaxis],
+        rates,
+        times,
+        np.asarray(centers, dtype=np.float64)[np.newaxis],
+        np.asarray(widths, dtype=np.float64)[np.newaxis],
+        np.asarray(scales, dtype=np.float64),
+        backsweep,
+        backsweep_period,
+        use_fast_erfcx,
+    )
@@ -1,7 +1,8 @@
 """This package contains irf items."""
-
+from __future__ import annotations
 
 import numpy as np
+from attrs import fields
 
 from glotaran.model import ModelError
 from glotaran.model import ModelItemTyped
@@ -41,6 +42,9 @@ class IrfMultiGaussian(Irf):
     width_dispersion_coefficients:
         polynomial coefficients for the dispersion of the
         width as parameter indices. None for no dispersion.
+    fast_erfcx:
+        use a tabulated approximation of erfcx with a relative error below 1e-9
+        to speed up the calculation of the decay matrix.
 
     """
 
@@ -53,6 +57,7 @@ class IrfMultiGaussian(Irf):
     normalize: bool = True
     backsweep: bool = False
     backsweep_period: ParameterType | None = None
+    fast_erfcx: bool = False
 
     def parameter(
         self, global_index: int, global_axis: np.ndarray
@@ -83,7 +88,7 @@ class IrfMultiGaussian(Irf):
         scales = np.asarray(scales)
 
         shift = 0
-        if self.shift is not None:
+        if self.shift is not None and global_index is not None:
             if global_index >= len(self.shift):
                 raise ModelError(
                     f"No shift parameter for index {global_index} "
@@ -93,10 +98,75 @@ class IrfMultiGaussian(Irf):
 
         backsweep = self.backsweep
 
-        backsweep_period = self.backsweep_period.value if self.backsweep else 0
+        backsweep_period = self.backsweep_period.value if self.backsweep else 0.0
 
         return centers, widths, scales, shift, backsweep, backsweep_period
 
+    def parameter_arrays(
+        self, global_axis: np.ndarray, index_dependent: bool
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool, float]:
+        """Returns the properties of the irf for all indices on the global axis at once.
+
+        The result is memoized on the global axis and the parameter values, so megacomplexes
+        sharing the irf in an evaluation only calculate it once. The returned arrays are shared
+        and must not be modified.
+
+        Parameters
+        ----------
+        global_axis: np.ndarray
+            The global axis.
+        index_dependent: bool
+            Whether to calculate the properties for each index on the global axis or only once.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool, float]
+            The centers and widths of shape ``(global, irf components)`` without the shift
+            applied, the scales, the shifts of shape ``(global,)``, backsweep and backsweep period.
+            If ``index_dependent`` is ``False`` the global dimension has size 1.
+        """
+        key = (index_dependent, np.asarray(global_axis).tobytes(), self._parameter_values())
+        cache = getattr(self, "_parameter_arrays_cache", None)
+        if cache is None or cache[0] != key:
+            cache = (key, self._calculate_parameter_arrays(global_axis, index_dependent))
+            self._parameter_arrays_cache = cache
+        return cache[1]
+
+    def _calculate_parameter_arrays(
+        self, global_axis: np.ndarray, index_dependent: bool
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool, float]:
+        """Calculate the properties of the irf for all indices on the global axis."""
+        size = global_axis.size if index_dependent else 1
+        centers, widths, scales, _, backsweep, backsweep_period = IrfMultiGaussian.parameter(
+            self, None, global_axis
+        )
+        shifts = np.zeros(size, dtype=np.float64)
+        if self.shift is not None and index_dependent:
+            if len(self.shift) < size:
+                raise ModelError(
+                    f"No shift parameter for index {len(self.shift)} "
+                    f"({global_axis[len(self.shift)]}) in irf {self.label}"
+                )
+            shifts = np.array([shift.value for shift in self.shift[:size]], dtype=np.float64)
+        return (
+            np.repeat(centers[np.newaxis, :], size, axis=0).astype(np.float64),
+            np.repeat(widths[np.newaxis, :], size, axis=0).astype(np.float64),
+            scales.astype(np.float64),
+            shifts,
+            backsweep,
+            backsweep_period,
+        )
+
+    def _parameter_values(self) -> tuple:
+        """The values of all attributes with parameters resolved to their values."""
+
+        def value_of(value):
+            if isinstance(value, list):
+                return tuple(value_of(v) for v in value)
+            return getattr(value, "value", value)
+
+        return tuple(value_of(getattr(self, field.name)) for field in fields(type(self)))
+
     def calculate(self, index: int, global_axis: np.ndarray, model_axis: np.ndarray) -> np.ndarray:
         centers, widths, scales, _, _, _ = self.parameter(index, global_axis)
         return sum(
@@ -179,12 +249,44 @@ class IrfSpectralMultiGaussian(IrfMultiGaussian):
 
         return centers, widths, scale, shift, backsweep, backsweep_period
 
+    def _calculate_parameter_arrays(
+        self, global_axis: np.ndarray, index_dependent: bool
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, bool, float]:
+        """Calculate the properties of the irf with dispersion for the global axis at once."""
+        (
+            centers,
+            widths,
+            scales,
+            shifts,
+            backsweep,
+            backsweep_period,
+        ) = super()._calculate_parameter_arrays(global_axis, index_dependent)
+        if not index_dependent:
+            return centers, widths, scales, shifts, backsweep, backsweep_period
+
+        if (
+            len(self.center_dispersion_coefficients) != 0
+            or len(self.width_dispersion_coefficients) != 0
+        ) and self.dispersion_center is None:
+            raise ModelError(f"No dispersion center defined for irf '{self.label}'")
+
+        if self.dispersion_center is not None:
+            dist = (
+                (1e3 / global_axis - 1e3 / self.dispersion_center)
+                if self.model_dispersion_with_wavenumber
+                else (global_axis - self.dispersion_center) / 100
+            )[:, np.newaxis]
+
+        for i, disp in enumerate(self.center_dispersion_coefficients):
+            centers += disp * np.power(dist, i + 1)
+
+        for i, disp in enumerate(self.width_dispersion_coefficients):
+            widths = widths + disp * np.power(dist, i + 1)
+
+        return centers, widths, scales, shifts, backsweep, backsweep_period
+
     def calculate_dispersion(self, axis):
-        dispersion = []
-        for index, _ in enumerate(axis):
-            center, _, _, _, _, _ = self.parameter(index, axis)
-            dispersion.append(center)
-        return np.asarray(dispersion).T
+        return self.parameter_arrays(axis, True)[0].T.copy()
 
     def is_index_dependent(self):
         return super().is_index_dependent() or self.dispersion_center is not None
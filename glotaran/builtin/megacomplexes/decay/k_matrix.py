@@ -1,8 +1,8 @@
 """ K-Matrix """
 from __future__ import annotations
 
-import itertools
 from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
 from scipy.linalg import eig
@@ -18,6 +18,55 @@ def calculate_gamma(eigenvectors: np.ndarray, initial_concentration: np.ndarray)
     return np.diag(solve(eigenvectors, initial_concentration))
 
 
+@lru_cache(maxsize=None)
+def _scatter_indices(
+    entries: tuple[tuple[str, str], ...], compartments: tuple[str, ...]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the (to, from) compartment indices of the entries of a K-Matrix.
+
+    The indices only depend on the structure of the K-Matrix, so they are computed once.
+    """
+    to_indices = np.array([compartments.index(to_comp) for to_comp, _ in entries], dtype=int)
+    from_indices = np.array([compartments.index(from_comp) for _, from_comp in entries], dtype=int)
+    return to_indices, from_indices
+
+
+def _full_matrix(
+    entries: tuple[tuple[str, str], ...],
+    compartments: tuple[str, ...],
+    rate_constants: np.ndarray,
+) -> np.ndarray:
+    """Scatter the rate constants into the full representation of a K-Matrix."""
+    to_indices, from_indices = _scatter_indices(entries, compartments)
+    transfer = to_indices != from_indices
+    matrix = np.zeros((len(compartments), len(compartments)), dtype=np.float64)
+    # Each rate constant depletes its source compartment, transfers also fill their target
+    np.subtract.at(matrix, (from_indices, from_indices), rate_constants)
+    np.add.at(matrix, (to_indices[transfer], from_indices[transfer]), rate_constants[transfer])
+    return matrix
+
+
+@lru_cache(maxsize=128)
+def _eigen(
+    entries: tuple[tuple[str, str], ...],
+    compartments: tuple[str, ...],
+    rate_constants: tuple[float, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate the eigendecomposition memoized on the rate constants.
+
+    The returned arrays are read-only since they are shared between calls.
+    """
+    # We take the transpose to be consistent with timp
+    matrix = _full_matrix(entries, compartments, np.asarray(rate_constants)).T
+    # get the eigenvectors and values, we take the left ones to have
+    # computation consistent with TIMP
+    eigenvalues, eigenvectors = eig(matrix, left=True, right=False)
+    eigenvalues, eigenvectors = eigenvalues.real.copy(), eigenvectors.real.copy()
+    eigenvalues.flags.writeable = False
+    eigenvectors.flags.writeable = False
+    return eigenvalues, eigenvectors
+
+
 @item
 class KMatrix(ModelItem):
     """A K-Matrix represents a first order differental system."""
@@ -155,13 +204,9 @@ class KMatrix(ModelItem):
             The compartment order.
         """
 
-        size = len(compartments)
-        array = np.zeros((size, size), dtype=np.float64)
-        # Matrix is a dict
-        for index in self.matrix:
-            i = compartments.index(index[0])
-            j = compartments.index(index[1])
-            array[i, j] = self.matrix[index]
+        to_indices, from_indices = _scatter_indices(tuple(self.matrix), tuple(compartments))
+        array = np.zeros((len(compartments), len(compartments)), dtype=np.float64)
+        array[to_indices, from_indices] = self._rate_constants()
         return array
 
     def full(self, compartments: list[str]) -> np.ndarray:
@@ -172,33 +217,22 @@ class KMatrix(ModelItem):
         compartments :
             The compartment order.
         """
-        size = len(compartments)
-        mat = np.zeros((size, size), np.float64)
-        for (to_comp, from_comp), param in self.matrix.items():
-            to_idx = compartments.index(to_comp)
-            fr_idx = compartments.index(from_comp)
-
-            if to_idx == fr_idx:
-                mat[to_idx, fr_idx] -= param
-            else:
-                mat[to_idx, fr_idx] += param
-                mat[fr_idx, fr_idx] -= param
-        return mat
+        return _full_matrix(tuple(self.matrix), tuple(compartments), self._rate_constants())
 
     def eigen(self, compartments: list[str]) -> tuple[np.ndarray, np.ndarray]:
         """Returns the eigenvalues and eigenvectors of the k matrix.
 
+        The decomposition is memoized on the rate constants, so :meth:`rates` and
+        :meth:`a_matrix` share it. The returned arrays are read-only.
+
         Parameters
         ----------
         compartments :
             The compartment order.
         """
-        # We take the transpose to be consistent with timp
-        matrix = self.full(compartments).T
-        # get the eigenvectors and values, we take the left ones to have
-        # computation consistent with TIMP
-        eigenvalues, eigenvectors = eig(matrix, left=True, right=False)
-        return (eigenvalues.real, eigenvectors.real)
+        return _eigen(
+            tuple(self.matrix), tuple(compartments), tuple(self._rate_constants().tolist())
+        )
 
     def rates(self, compartments: list[str], initial_concentration: np.ndarray) -> np.ndarray:
         """The resulting rates of the matrix.
@@ -215,7 +249,7 @@ class KMatrix(ModelItem):
             The initial concentration.
         """
         if self.is_sequential(compartments, initial_concentration):
-            return -np.diag(self.full(compartments)).copy()
+            return -np.diag(self.full(compartments))
         eigenvalues, _ = self.eigen(compartments)
         return -eigenvalues
 
@@ -259,18 +293,15 @@ class KMatrix(ModelItem):
         initial_concentration :
             The initial concentration.
         """
-        matrix = self.full(compartments).T
-        rates = np.diag(matrix)
-
-        a_matrix = np.zeros(matrix.shape, dtype=np.float64)
-        a_matrix[0, 0] = 1.0
-        for i, j in itertools.product(range(rates.size), range(1, rates.size)):
-            if i > j:
-                continue
-            a_matrix[i, j] = np.prod([rates[m] for m in range(j)]) / np.prod(
-                [rates[m] - rates[i] for m in range(j + 1) if i != m]
-            )
-
+        rates = np.diag(self.full(compartments))
+        differences = rates[np.newaxis, :] - rates[:, np.newaxis]
+        np.fill_diagonal(differences, 1)
+        # a_matrix[i, j] = prod(rates[:j]) / prod(rates[m] - rates[i] for m <= j if m != i)
+        numerators = np.concatenate(([1.0], np.cumprod(rates[:-1])))
+        denominators = np.cumprod(differences, axis=1)
+        upper = np.triu(np.ones(denominators.shape, dtype=bool))
+        a_matrix = np.zeros(denominators.shape, dtype=np.float64)
+        np.divide(numerators, denominators, out=a_matrix, where=upper)
         return a_matrix
 
     def is_sequential(self, compartments: list[str], initial_concentration: np.ndarray) -> bool:
@@ -284,7 +315,10 @@ class KMatrix(ModelItem):
         if np.sum(initial_concentration) != 1:
             return False
         matrix = self.reduced(compartments)
-        return not any(
-            np.nonzero(matrix[:, i])[0].size != 1 or i != 0 and matrix[i, i - 1] == 0
-            for i in range(matrix.shape[1])
+        return bool(
+            np.all(np.count_nonzero(matrix, axis=0) == 1) and np.all(np.diag(matrix, k=-1) != 0)
         )
+
+    def _rate_constants(self) -> np.ndarray:
+        """The values of the rate constants in the order of the matrix entries."""
+        return np.array([float(rate_constant) for rate_constant in self.matrix.values()])
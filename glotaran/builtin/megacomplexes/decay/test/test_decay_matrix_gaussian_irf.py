@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from scipy.special import erf
+from scipy.special import erfcx
+
+from glotaran.builtin.megacomplexes.decay.decay_matrix_gaussian_irf import FAST_ERFCX_MAX_REL_ERROR
+from glotaran.builtin.megacomplexes.decay.decay_matrix_gaussian_irf import (
+    calculate_decay_matrix_gaussian_irf,
+)
+from glotaran.builtin.megacomplexes.decay.decay_matrix_gaussian_irf import (
+    calculate_decay_matrix_gaussian_irf_on_index,
+)
+from glotaran.builtin.megacomplexes.decay.decay_matrix_gaussian_irf import fast_erfcx
+
+
+def reference_decay_matrix(rates, times, center, width):
+    alpha = rates[np.newaxis, :] * width / np.sqrt(2)
+    beta = (times[:, np.newaxis] - center) / (width * np.sqrt(2))
+    return 0.5 * (1 + erf(beta - alpha)) * np.exp(alpha * (alpha - 2 * beta))
+
+
+def test_fast_erfcx():
+    x = np.linspace(1, 100, 100001)
+    approximation = np.array([fast_erfcx(value) for value in x])
+    assert np.max(np.abs(approximation / erfcx(x) - 1)) < FAST_ERFCX_MAX_REL_ERROR
+
+
+@pytest.mark.parametrize("use_fast_erfcx", (True, False))
+def test_calculate_decay_matrix_gaussian_irf_on_index(use_fast_erfcx: bool):
+    rates = np.array([2.0, 0.5, 0.01])
+    times = np.linspace(-5, 50, 200)
+    matrix = np.zeros((times.size, rates.size))
+    calculate_decay_matrix_gaussian_irf_on_index(
+        matrix,
+        rates,
+        times,
+        np.array([1.0]),
+        np.array([0.2]),
+        np.array([1.0]),
+        False,
+        0.0,
+        use_fast_erfcx,
+    )
+    assert np.allclose(matrix, reference_decay_matrix(rates, times, 1.0, 0.2))
+
+
+def test_calculate_decay_matrix_gaussian_irf_dispersion():
+    rates = np.array([300.0, 2.0, 0.5])
+    times = np.linspace(-5, 50, 200)
+    centers = np.array([[0.5], [1.0], [3.0]])
+    widths = np.array([[0.1], [0.2], [0.3]])
+    matrix = np.zeros((centers.shape[0], times.size, rates.size))
+    calculate_decay_matrix_gaussian_irf(
+        matrix, rates, times, centers, widths, np.array([1.0]), False, 0.0
+    )
+    for index, (center, width) in enumerate(zip(centers[:, 0], widths[:, 0])):
+        on_index = np.zeros((times.size, rates.size))
+        calculate_decay_matrix_gaussian_irf_on_index(
+            on_index, rates, times, centers[index], widths[index], np.array([1.0]), False, 0.0
+        )
+        assert np.allclose(matrix[index], on_index)
+        # The fastest rate overflows the naive reference formula and is checked by the limit
+        assert np.allclose(
+            matrix[index, :, 1:], reference_decay_matrix(rates[1:], times, center, width)
+        )
+        assert np.all(np.isfinite(matrix[index]))
@@ -298,3 +298,39 @@ def test_kmatrix_ipython_rendering():
 
     assert test_markdown_str in rendered_markdown_return
     assert rendered_markdown_return[test_markdown_str].startswith("| compartment")
+
+
+def test_eigen_memoization():
+    matrix = {
+        ("s2", "s1"): "1",
+        ("s1", "s2"): "3",
+        ("s2", "s2"): "2",
+    }
+    compartments = ["s1", "s2"]
+    mat = fill_item(
+        KMatrix(label="", matrix=matrix), None, Parameters.from_list([0.55, 0.04, 0.1])
+    )
+
+    eigenvalues, eigenvectors = mat.eigen(compartments)
+    assert mat.eigen(compartments)[1] is eigenvectors
+    assert not eigenvectors.flags.writeable
+
+    changed = fill_item(
+        KMatrix(label="", matrix=matrix), None, Parameters.from_list([0.55, 0.04, 0.2])
+    )
+    assert not np.allclose(changed.eigen(compartments)[0], eigenvalues)
+
+
+def test_a_matrix_sequential_many_compartments():
+    compartments = [f"s{i}" for i in range(6)]
+    matrix = {(compartments[i + 1], compartments[i]): str(i + 1) for i in range(5)}
+    matrix[("s5", "s5")] = "6"
+    params = Parameters.from_list([0.9, 0.5, 0.3, 0.2, 0.1, 0.05])
+    mat = fill_item(KMatrix(label="", matrix=matrix), None, params)
+    initial_concentration = [1, 0, 0, 0, 0, 0]
+
+    assert mat.is_sequential(compartments, initial_concentration)
+    assert np.allclose(
+        mat.a_matrix_sequential(compartments),
+        mat.a_matrix_general(compartments, initial_concentration),
+    )
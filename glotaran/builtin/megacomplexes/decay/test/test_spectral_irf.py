@@ -259,3 +259,27 @@ def test_spectral_irf(suite):
             )
 
     assert "irf_center" in resultdata
+
+
+@pytest.mark.parametrize(
+    "suite",
+    [SimpleIrfDispersion, MultiIrfDispersion, MultiCenterIrfDispersion],
+)
+def test_irf_parameter_arrays(suite):
+    irf = fill_item(suite.model.irf["irf1"], suite.model, suite.parameters)
+    global_axis = np.linspace(300, 500, 7)
+
+    centers, widths, scales, shifts, _, _ = irf.parameter_arrays(global_axis, True)
+
+    assert centers.shape == widths.shape == (global_axis.size, scales.size)
+    assert np.all(shifts == 0)
+    for index in range(global_axis.size):
+        wanted_centers, wanted_widths, wanted_scales, *_ = irf.parameter(index, global_axis)
+        assert np.allclose(centers[index], wanted_centers)
+        assert np.allclose(widths[index], wanted_widths)
+        assert np.allclose(scales, wanted_scales)
+
+    assert irf.parameter_arrays(global_axis, True)[0] is centers
+    first_center = irf.center[0] if isinstance(irf.center, list) else irf.center
+    first_center.value += 0.1
+    assert np.allclose(irf.parameter_arrays(global_axis, True)[0][:, 0], centers[:, 0] + 0.1)
@@ -17,6 +17,7 @@ from glotaran.builtin.megacomplexes.decay.irf import IrfSpectralMultiGaussian
 from glotaran.model import DatasetModel
 from glotaran.model import Megacomplex
 from glotaran.model import get_dataset_model_model_dimension
+from glotaran.utils.jit import jit_kernel
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
@@ -163,20 +164,21 @@ def decay_matrix_implementation_index_independent(
             centers,
             widths,
             irf_scales,
-            shift,
+            shifts,
             backsweep,
             backsweep_period,
-        ) = dataset_model.irf.parameter(None, global_axis)
+        ) = dataset_model.irf.parameter_arrays(global_axis, False)
 
         calculate_decay_matrix_gaussian_irf_on_index(
             matrix,
             rates,
             model_axis,
-            centers - shift,
-            widths,
+            centers[0] - shifts[0],
+            widths[0],
             irf_scales,
             backsweep,
             backsweep_period,
+            dataset_model.irf.fast_erfcx,
         )
         if dataset_model.irf.normalize:
             matrix /= np.sum(irf_scales)
@@ -192,36 +194,31 @@ def decay_matrix_implementation_index_dependent(
     model_axis: np.ndarray,
     dataset_model: DatasetModel,
 ):
-    all_centers, all_widths = [], []
-    backsweep, backsweep_period = False, None
-    irf_scales = []
-    for global_index in range(global_axis.size):
-        (
-            centers,
-            widths,
-            irf_scales,
-            shift,
-            backsweep,
-            backsweep_period,
-        ) = dataset_model.irf.parameter(global_index, global_axis)
-        all_centers.append(centers - shift)
-        all_widths.append(widths)
+    (
+        centers,
+        widths,
+        irf_scales,
+        shifts,
+        backsweep,
+        backsweep_period,
+    ) = dataset_model.irf.parameter_arrays(global_axis, True)
 
     calculate_decay_matrix_gaussian_irf(
         matrix,
         rates,
         model_axis,
-        np.array(all_centers),
-        np.array(all_widths),
+        centers - shifts[:, np.newaxis],
+        widths,
         irf_scales,
         backsweep,
         backsweep_period,
+        dataset_model.irf.fast_erfcx,
     )
     if dataset_model.irf.normalize:
         matrix /= np.sum(irf_scales)
 
 
-@nb.jit(nopython=True, parallel=True)
+@jit_kernel("void(float64[:, ::1], float64[::1], float64[::1])", parallel=True)
 def calculate_decay_matrix_no_irf(matrix, rates, times):
     for n_r in nb.prange(rates.size):
         r_n = rates[n_r]
@@ -1,4 +1,7 @@
 """This package contains the spectral shape item."""
+from __future__ import annotations
+
+from collections.abc import Sequence
 
 import numpy as np
 
@@ -6,10 +9,66 @@ from glotaran.model import ModelItemTyped
 from glotaran.model import ParameterType
 from glotaran.model import item
 
+LOG2 = np.log(2)
+
 
 @item
 class SpectralShape(ModelItemTyped):
-    pass
+    def calculate(self, axis: np.ndarray) -> np.ndarray:
+        """Calculate the shape for ``axis``.
+
+        Parameters
+        ----------
+        axis: np.ndarray
+            The axis to calculate the shape on.
+
+        Returns
+        -------
+        np.ndarray
+            The shape.
+
+        Raises
+        ------
+        NotImplementedError
+            If the shape type doesn't implement it.
+        """
+        raise NotImplementedError(
+            f"Spectral shape type {type(self).__name__!r} needs to implement 'calculate'."
+        )
+
+    @classmethod
+    def calculate_batch(cls, shapes: Sequence[SpectralShape], axis: np.ndarray) -> np.ndarray:
+        """Calculate multiple shapes of this type for ``axis`` at once.
+
+        Defaults to stacking :meth:`calculate` of each shape, subclasses override this
+        with a broadcasted evaluation over all shapes.
+
+        Parameters
+        ----------
+        shapes: Sequence[SpectralShape]
+            The shapes to calculate, all of type ``cls``.
+        axis: np.ndarray
+            The axis to calculate the shapes on.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(axis.size, len(shapes))``.
+        """
+        return np.stack([shape.calculate(axis) for shape in shapes], axis=1)
+
+
+def _parameter_values(shapes: Sequence[SpectralShape], name: str) -> np.ndarray:
+    """Get the values of the parameter attribute ``name`` of all ``shapes`` as row vector."""
+    return np.array([float(getattr(shape, name)) for shape in shapes], dtype=np.float64)
+
+
+def _amplitudes(shapes: Sequence[SpectralShapeGaussian]) -> np.ndarray:
+    """Get the amplitudes of ``shapes``, where a missing amplitude is 1."""
+    return np.array(
+        [1.0 if shape.amplitude is None else float(shape.amplitude) for shape in shapes],
+        dtype=np.float64,
+    )
 
 
 @item
@@ -58,10 +117,39 @@ class SpectralShapeGaussian(SpectralShape):
         np.ndarray
             An array representing a Gaussian shape.
         """
-        shape = np.exp(-np.log(2) * np.square(2 * (axis - self.location) / self.width))
-        if self.amplitude is not None:
-            shape *= self.amplitude
-        return shape
+        return self.calculate_batch([self], axis)[:, 0]
+
+    @classmethod
+    def calculate_batch(
+        cls, shapes: Sequence[SpectralShapeGaussian], axis: np.ndarray
+    ) -> np.ndarray:
+        """Calculate multiple Gaussian shapes for ``axis`` in one broadcasted expression.
+
+        Parameters
+        ----------
+        shapes: Sequence[SpectralShapeGaussian]
+            The Gaussian shapes to calculate.
+        axis: np.ndarray
+            The axis to calculate the shapes on.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(axis.size, len(shapes))``.
+
+        See Also
+        --------
+        SpectralShapeGaussian.calculate
+        """
+        locations = _parameter_values(shapes, "location")
+        widths = _parameter_values(shapes, "width")
+        matrix = np.subtract.outer(axis, locations)
+        matrix *= 2 / widths
+        np.square(matrix, out=matrix)
+        matrix *= -LOG2
+        np.exp(matrix, out=matrix)
+        matrix *= _amplitudes(shapes)
+        return matrix
 
 
 @item
@@ -123,17 +211,56 @@ class SpectralShapeSkewedGaussian(SpectralShapeGaussian):
         np.ndarray
             An array representing a skewed Gaussian shape.
         """
-        if np.allclose(self.skewness, 0):
-            return super().calculate(axis)
-        log_args = 1 + (2 * self.skewness * (axis - self.location) / self.width)
-        shape = np.zeros(log_args.shape)
-        valid_arg_mask = np.where(log_args > 0)
-        shape[valid_arg_mask] = np.exp(
-            -np.log(2) * np.square(np.log(log_args[valid_arg_mask]) / self.skewness)
+        return self.calculate_batch([self], axis)[:, 0]
+
+    @classmethod
+    def calculate_batch(
+        cls, shapes: Sequence[SpectralShapeSkewedGaussian], axis: np.ndarray
+    ) -> np.ndarray:
+        """Calculate multiple skewed Gaussian shapes for ``axis`` in one broadcasted expression.
+
+        Shapes with a skewness close to zero are calculated as normal Gaussian.
+
+        Parameters
+        ----------
+        shapes: Sequence[SpectralShapeSkewedGaussian]
+            The skewed Gaussian shapes to calculate.
+        axis: np.ndarray
+            The axis to calculate the shapes on.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(axis.size, len(shapes))``.
+
+        See Also
+        --------
+        SpectralShapeSkewedGaussian.calculate
+        """
+        skewnesses = _parameter_values(shapes, "skewness")
+        not_skewed = np.isclose(skewnesses, 0)
+        if np.all(not_skewed):
+            return SpectralShapeGaussian.calculate_batch(shapes, axis)
+
+        matrix = np.empty((axis.size, len(shapes)), dtype=np.float64)
+        if np.any(not_skewed):
+            matrix[:, not_skewed] = SpectralShapeGaussian.calculate_batch(
+                [shape for shape, is_gaussian in zip(shapes, not_skewed) if is_gaussian], axis
+            )
+
+        skewed = ~not_skewed
+        skewnesses = skewnesses[skewed]
+        locations = _parameter_values(shapes, "location")[skewed]
+        widths = _parameter_values(shapes, "width")[skewed]
+        log_args = 1 + np.subtract.outer(axis, locations) * (2 * skewnesses / widths)
+        valid_args = log_args > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skewed_matrix = np.exp(-LOG2 * np.square(np.log(log_args) / skewnesses))
+        # The amplitudes of the not skewed shapes are applied by the Gaussian calculation
+        matrix[:, skewed] = np.where(valid_args, skewed_matrix, 0) * _amplitudes(
+            [shape for shape, is_skewed in zip(shapes, skewed) if is_skewed]
         )
-        if self.amplitude is not None:
-            shape *= self.amplitude
-        return shape
+        return matrix
 
 
 @item
@@ -157,6 +284,24 @@ class SpectralShapeOne(SpectralShape):
         """
         return np.ones(axis.shape[0])
 
+    @classmethod
+    def calculate_batch(cls, shapes: Sequence[SpectralShapeOne], axis: np.ndarray) -> np.ndarray:
+        """Calculate multiple constant shapes with value 1.
+
+        Parameters
+        ----------
+        shapes: Sequence[SpectralShapeOne]
+            The shapes to calculate.
+        axis: np.ndarray
+            The axis to calculate the shapes on.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(axis.size, len(shapes))``.
+        """
+        return np.ones((axis.shape[0], len(shapes)))
+
 
 @item
 class SpectralShapeZero(SpectralShape):
@@ -180,3 +325,21 @@ class SpectralShapeZero(SpectralShape):
 
         """
         return np.zeros(axis.shape[0])
+
+    @classmethod
+    def calculate_batch(cls, shapes: Sequence[SpectralShapeZero], axis: np.ndarray) -> np.ndarray:
+        """Calculate multiple constant shapes with value 0.
+
+        Parameters
+        ----------
+        shapes: Sequence[SpectralShapeZero]
+            The shapes to calculate.
+        axis: np.ndarray
+            The axis to calculate the shapes on.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(axis.size, len(shapes))``.
+        """
+        return np.zeros((axis.shape[0], len(shapes)))
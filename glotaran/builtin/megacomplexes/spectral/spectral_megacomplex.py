@@ -22,6 +22,35 @@ class SpectralDatasetModel(DatasetModel):
     spectral_axis_inverted: bool = False
     spectral_axis_scale: float = 1
 
+    def transform_spectral_axis(self, model_axis: ArrayLike) -> ArrayLike:
+        """Apply the inversion and scaling of the spectral axis.
+
+        The transformed axis is cached on the dataset model, so it is shared by all spectral
+        megacomplexes of the dataset.
+
+        Parameters
+        ----------
+        model_axis: ArrayLike
+            The spectral axis of the data.
+
+        Returns
+        -------
+        ArrayLike
+            The transformed spectral axis.
+        """
+        key = (self.spectral_axis_inverted, self.spectral_axis_scale, model_axis.tobytes())
+        cache = getattr(self, "_spectral_axis_cache", None)
+        if cache is None or cache[0] != key:
+            if self.spectral_axis_inverted:
+                transformed_axis = self.spectral_axis_scale / model_axis
+            elif self.spectral_axis_scale != 1:
+                transformed_axis = model_axis * self.spectral_axis_scale
+            else:
+                transformed_axis = model_axis
+            cache = (key, transformed_axis)
+            self._spectral_axis_cache = cache
+        return cache[1]
+
 
 @megacomplex(dataset_model_type=SpectralDatasetModel)
 class SpectralMegacomplex(Megacomplex):
@@ -42,17 +71,18 @@ class SpectralMegacomplex(Megacomplex):
                 raise ModelError(f"More then one shape defined for compartment '{compartment}'")
             compartments.append(compartment)
 
-        if dataset_model.spectral_axis_inverted:
-            model_axis = dataset_model.spectral_axis_scale / model_axis
-        elif dataset_model.spectral_axis_scale != 1:
-            model_axis = model_axis * dataset_model.spectral_axis_scale
-
-        dim1 = model_axis.size
-        dim2 = len(self.shape)
-        matrix = np.zeros((dim1, dim2))
+        model_axis = dataset_model.transform_spectral_axis(np.asarray(model_axis))
 
+        shapes_by_type: dict[type[SpectralShape], list[int]] = {}
         for i, shape in enumerate(self.shape.values()):
-            matrix[:, i] += shape.calculate(model_axis)
+            shapes_by_type.setdefault(type(shape), []).append(i)
+
+        shapes = list(self.shape.values())
+        matrix = np.empty((model_axis.size, len(shapes)))
+        for shape_type, indices in shapes_by_type.items():
+            matrix[:, indices] = shape_type.calculate_batch(
+                [shapes[i] for i in indices], model_axis
+            )
 
         return compartments, matrix
 
@@ -302,3 +302,83 @@ def test_spectral_model(suite):
         suite.axis["spectral"].size,
         len(suite.decay_compartments),
     )
+
+
+def test_spectral_matrix_mixed_shapes():
+    shape_count = 60
+    shapes = {
+        f"g{i}": {
+            "type": "gaussian",
+            "amplitude": "shape.amplitude",
+            "location": f"location.{i + 1}",
+            "width": "shape.width",
+        }
+        for i in range(shape_count)
+    }
+    for label, skewness, amplitude in [
+        ("sk", "shape.skewness", "shape.skew_amplitude"),
+        ("sk0", "shape.zero_skewness", "shape.amplitude"),
+    ]:
+        shapes[label] = {
+            "type": "skewed-gaussian",
+            "amplitude": amplitude,
+            "location": "shape.skew_location",
+            "width": "shape.width",
+            "skewness": skewness,
+        }
+    shapes["one"] = {"type": "one"}
+    shapes["zero"] = {"type": "zero"}
+    model = SpectralModel(
+        **{
+            "megacomplex": {
+                "mc1": {"type": "spectral", "shape": {label: label for label in shapes}},
+            },
+            "shape": shapes,
+            "dataset": {
+                "dataset1": {
+                    "megacomplex": ["mc1"],
+                    "spectral_axis_scale": 1e7,
+                    "spectral_axis_inverted": True,
+                },
+            },
+        }
+    )
+    parameters = Parameters.from_dict(
+        {
+            "shape": [
+                ["amplitude", 2],
+                ["width", 1500],
+                ["skew_location", 18000],
+                ["skew_amplitude", 3],
+                ["skewness", 0.5],
+                ["zero_skewness", 0],
+            ],
+            "location": list(np.linspace(13000, 25000, shape_count)),
+        }
+    )
+    dataset_model = fill_item(model.dataset["dataset1"], model, parameters)
+    spectral = np.linspace(400, 750, 200)
+    axis = 1e7 / spectral
+
+    matrix = MatrixProvider.calculate_dataset_matrix(dataset_model, None, spectral)
+    assert matrix.clp_labels == list(shapes)
+    assert matrix.matrix.shape == (spectral.size, shape_count + 4)
+
+    for i, location in enumerate(np.linspace(13000, 25000, shape_count)):
+        wanted = 2 * np.exp(-np.log(2) * np.square(2 * (axis - location) / 1500))
+        assert np.allclose(matrix.matrix[:, i], wanted)
+
+    log_args = 1 + 2 * 0.5 * (axis - 18000) / 1500
+    wanted_skewed = np.zeros_like(axis)
+    wanted_skewed[log_args > 0] = 3 * np.exp(
+        -np.log(2) * np.square(np.log(log_args[log_args > 0]) / 0.5)
+    )
+    assert np.allclose(matrix.matrix[:, shape_count], wanted_skewed)
+    wanted_gaussian = 2 * np.exp(-np.log(2) * np.square(2 * (axis - 18000) / 1500))
+    assert np.allclose(matrix.matrix[:, shape_count + 1], wanted_gaussian)
+    assert np.all(matrix.matrix[:, shape_count + 2] == 1)
+    assert np.all(matrix.matrix[:, shape_count + 3] == 0)
+
+    assert dataset_model.transform_spectral_axis(
+        spectral
+    ) is dataset_model.transform_spectral_axis(spectral)
@@ -3,17 +3,15 @@ import sys
 import click
 
 from glotaran.cli.commands import util
-from glotaran.optimization.optimize import optimize
 from glotaran.plugin_system.data_io_registration import known_data_formats
 from glotaran.plugin_system.project_io_registration import save_result
-from glotaran.project.scheme import Scheme
 
 
 @click.option(
     "--dataformat",
     "-dfmt",
     default=None,
-    type=click.Choice(known_data_formats()),
+    type=util.LazyChoice(known_data_formats),
     help="The input format of the data. Will be inferred from extension if not set.",
 )
 @click.option(
@@ -35,7 +33,9 @@ from glotaran.project.scheme import Scheme
     "--outformat",
     "-ofmt",
     default="folder",
-    type=click.Choice(util.project_io_list_supporting_plugins("save_result", ("yml_str"))),
+    type=util.LazyChoice(
+        lambda: util.project_io_list_supporting_plugins("save_result", ("yml_str"))
+    ),
     help="The format of the output.",
     show_default=True,
 )
@@ -67,6 +67,9 @@ def optimize_cmd(
     glotaran optimize --
 
     """
+    from glotaran.optimization.optimize import optimize
+    from glotaran.project.scheme import Scheme
+
     if scheme_file is not None:
         scheme = util.load_scheme_file(scheme_file, verbose=True)
         if nfev is not None:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable
 from collections.abc import Iterable
+from collections.abc import Sequence
 
 import click
 from click import echo
@@ -152,6 +154,24 @@ def project_io_list_supporting_plugins(
     return list(filter(lambda entry: entry not in block_list, supporting_list))
 
 
+class LazyChoice(click.Choice):
+    """Choice of values which are only created when they are needed.
+
+    This prevents loading all plugins at startup, just to create the choices of an option.
+    """
+
+    def __init__(self, create_choices: Callable[[], Sequence[str]], case_sensitive: bool = True):
+        self._create_choices = create_choices
+        self._choices: Sequence[str] | None = None
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self) -> Sequence[str]:
+        if self._choices is None:
+            self._choices = self._create_choices()
+        return self._choices
+
+
 class ValOrRangeOrList(click.ParamType):
     name = "number or range or list"
 
@@ -0,0 +1,19 @@
+import click
+
+from glotaran.plugin_system.megacomplex_registration import get_megacomplex
+from glotaran.plugin_system.megacomplex_registration import known_megacomplex_names
+
+
+@click.option("--verbose", "-v", is_flag=True, help="Print the compile time of each kernel.")
+def warmup_cmd(verbose: bool):
+    """Compiles the numba kernels of all installed megacomplexes and caches them on disk."""
+    from glotaran.utils.jit import precompile_kernels
+
+    for name in known_megacomplex_names():
+        get_megacomplex(name)
+
+    timings = precompile_kernels()
+    if verbose:
+        for kernel_name, timing in timings.items():
+            click.echo(f"    * {kernel_name}: {timing:.2f}s")
+    click.echo(f"Compiled {len(timings)} kernels in {sum(timings.values()):.2f}s.")
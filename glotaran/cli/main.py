@@ -5,6 +5,7 @@ from glotaran.cli.commands.optimize import optimize_cmd
 from glotaran.cli.commands.pluginlist import plugin_list_cmd
 from glotaran.cli.commands.print import print_cmd
 from glotaran.cli.commands.validate import validate_cmd
+from glotaran.cli.commands.warmup import warmup_cmd
 
 
 class Cli(click.Group):
@@ -55,6 +56,11 @@ def main(prog_name="glotaran"):
     """The glotaran CLI main function."""
 
 
+main.add_command(
+    main.command(name="warmup", short_help="Precompiles all numba kernels.", help_priority=5)(
+        warmup_cmd
+    )
+)
 main.add_command(
     main.command(
         name="pluginlist", short_help="Prints a list of installed plugins.", help_priority=4
@@ -52,3 +52,11 @@ def test_cli_validate_parameters_file(tmp_path: Path):
     assert all(
         substring in result_file_not_exist.output for substring in ("Error", "does not exist")
     )
+
+
+def test_cli_warmup():
+    """Test the CLI warmup option."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["warmup", "--verbose"], prog_name="glotaran")
+    assert result.exit_code == 0
+    assert "calculate_decay_matrix_gaussian_irf" in result.output
@@ -19,8 +19,6 @@ from typing import TypeVar
 from typing import cast
 from warnings import warn
 
-import numpy as np
-
 DecoratedCallable = TypeVar(
     "DecoratedCallable", bound=Callable[..., Any]
 )  # decorated function or class
@@ -537,7 +535,7 @@ def deprecate_dict_entry(
     """
     dict_changed = False
 
-    if not np.logical_xor(swap_keys is None, replace_rules is None):
+    if (swap_keys is None) == (replace_rules is None):
         raise ValueError(
             "Exactly one of the parameters `swap_keys` or `replace_rules` needs to be provided."
         )
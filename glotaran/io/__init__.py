@@ -4,33 +4,76 @@ Note:
 -----
 Since Io functionality is purely plugin based this package mostly
 reexports functions from the ``glotaran.plugin_system`` from a common place.
+
+The attributes are imported lazily on first access (:pep:`562`), so importing
+``glotaran.io`` doesn't import the plugin system and its dependencies.
 """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from glotaran.utils.lazy_import import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from glotaran.io.interface import SAVING_OPTIONS_DEFAULT
+    from glotaran.io.interface import SAVING_OPTIONS_MINIMAL
+    from glotaran.io.interface import DataIoInterface
+    from glotaran.io.interface import ProjectIoInterface
+    from glotaran.io.interface import SavingOptions
+    from glotaran.io.prepare_dataset import prepare_time_trace_dataset
+    from glotaran.plugin_system.data_io_registration import data_io_plugin_table
+    from glotaran.plugin_system.data_io_registration import get_dataloader
+    from glotaran.plugin_system.data_io_registration import get_datasaver
+    from glotaran.plugin_system.data_io_registration import load_dataset
+    from glotaran.plugin_system.data_io_registration import register_data_io
+    from glotaran.plugin_system.data_io_registration import save_dataset
+    from glotaran.plugin_system.data_io_registration import set_data_plugin
+    from glotaran.plugin_system.data_io_registration import show_data_io_method_help
+    from glotaran.plugin_system.project_io_registration import get_project_io_method
+    from glotaran.plugin_system.project_io_registration import load_model
+    from glotaran.plugin_system.project_io_registration import load_parameters
+    from glotaran.plugin_system.project_io_registration import load_result
+    from glotaran.plugin_system.project_io_registration import load_scheme
+    from glotaran.plugin_system.project_io_registration import project_io_plugin_table
+    from glotaran.plugin_system.project_io_registration import register_project_io
+    from glotaran.plugin_system.project_io_registration import save_model
+    from glotaran.plugin_system.project_io_registration import save_parameters
+    from glotaran.plugin_system.project_io_registration import save_result
+    from glotaran.plugin_system.project_io_registration import save_scheme
+    from glotaran.plugin_system.project_io_registration import set_project_plugin
+    from glotaran.plugin_system.project_io_registration import show_project_io_method_help
+    from glotaran.utils.io import load_datasets
 
-from glotaran.io.interface import SAVING_OPTIONS_DEFAULT
-from glotaran.io.interface import SAVING_OPTIONS_MINIMAL
-from glotaran.io.interface import DataIoInterface
-from glotaran.io.interface import ProjectIoInterface
-from glotaran.io.interface import SavingOptions
-from glotaran.io.prepare_dataset import prepare_time_trace_dataset
-from glotaran.plugin_system.data_io_registration import data_io_plugin_table
-from glotaran.plugin_system.data_io_registration import get_dataloader
-from glotaran.plugin_system.data_io_registration import get_datasaver
-from glotaran.plugin_system.data_io_registration import load_dataset
-from glotaran.plugin_system.data_io_registration import register_data_io
-from glotaran.plugin_system.data_io_registration import save_dataset
-from glotaran.plugin_system.data_io_registration import set_data_plugin
-from glotaran.plugin_system.data_io_registration import show_data_io_method_help
-from glotaran.plugin_system.project_io_registration import get_project_io_method
-from glotaran.plugin_system.project_io_registration import load_model
-from glotaran.plugin_system.project_io_registration import load_parameters
-from glotaran.plugin_system.project_io_registration import load_result
-from glotaran.plugin_system.project_io_registration import load_scheme
-from glotaran.plugin_system.project_io_registration import project_io_plugin_table
-from glotaran.plugin_system.project_io_registration import register_project_io
-from glotaran.plugin_system.project_io_registration import save_model
-from glotaran.plugin_system.project_io_registration import save_parameters
-from glotaran.plugin_system.project_io_registration import save_result
-from glotaran.plugin_system.project_io_registration import save_scheme
-from glotaran.plugin_system.project_io_registration import set_project_plugin
-from glotaran.plugin_system.project_io_registration import show_project_io_method_help
-from glotaran.utils.io import load_datasets
+__getattr__, __dir__, __all__ = lazy_module_attributes(
+    __name__,
+    {
+        "SAVING_OPTIONS_DEFAULT": "glotaran.io.interface",
+        "SAVING_OPTIONS_MINIMAL": "glotaran.io.interface",
+        "DataIoInterface": "glotaran.io.interface",
+        "ProjectIoInterface": "glotaran.io.interface",
+        "SavingOptions": "glotaran.io.interface",
+        "prepare_time_trace_dataset": "glotaran.io.prepare_dataset",
+        "data_io_plugin_table": "glotaran.plugin_system.data_io_registration",
+        "get_dataloader": "glotaran.plugin_system.data_io_registration",
+        "get_datasaver": "glotaran.plugin_system.data_io_registration",
+        "load_dataset": "glotaran.plugin_system.data_io_registration",
+        "register_data_io": "glotaran.plugin_system.data_io_registration",
+        "save_dataset": "glotaran.plugin_system.data_io_registration",
+        "set_data_plugin": "glotaran.plugin_system.data_io_registration",
+        "show_data_io_method_help": "glotaran.plugin_system.data_io_registration",
+        "get_project_io_method": "glotaran.plugin_system.project_io_registration",
+        "load_model": "glotaran.plugin_system.project_io_registration",
+        "load_parameters": "glotaran.plugin_system.project_io_registration",
+        "load_result": "glotaran.plugin_system.project_io_registration",
+        "load_scheme": "glotaran.plugin_system.project_io_registration",
+        "project_io_plugin_table": "glotaran.plugin_system.project_io_registration",
+        "register_project_io": "glotaran.plugin_system.project_io_registration",
+        "save_model": "glotaran.plugin_system.project_io_registration",
+        "save_parameters": "glotaran.plugin_system.project_io_registration",
+        "save_result": "glotaran.plugin_system.project_io_registration",
+        "save_scheme": "glotaran.plugin_system.project_io_registration",
+        "set_project_plugin": "glotaran.plugin_system.project_io_registration",
+        "show_project_io_method_help": "glotaran.plugin_system.project_io_registration",
+        "load_datasets": "glotaran.utils.io",
+    },
+)
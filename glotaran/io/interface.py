@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Any
     from typing import Literal
     from typing import Union
 
@@ -36,9 +37,31 @@ class SavingOptions:
     """A collection of options for result saving."""
 
     data_filter: list[str] | None = None
-    data_format: Literal["nc"] = "nc"
+    data_format: Literal["nc", "zarr"] = "nc"
     parameter_format: Literal["csv"] = "csv"
     report: bool = True
+    matrix_format: Literal["float64", "float32", "recipe"] = "float64"
+    """Format of index dependent matrices (e.g. of dispersive IRFs) in the result data.
+
+    ``"float32"`` halves their size, ``"recipe"`` doesn't save them at all and
+    recalculates them from the model and optimized parameters when the result is loaded.
+    """
+    data_compression_level: int | None = None
+    """Compression level of the result data, passed to the data io plugin.
+
+    None uses the default of the plugin, which is uncompressed for ``"nc"``.
+    """
+    data_encoding: dict[str, dict[str, Any]] | None = None
+    """Compression and chunk encoding of single result data variables.
+
+    For example ``{"fitted_data": {"zlib": True, "complevel": 4, "chunksizes": (100, 1)}}``
+    with ``"nc"`` or ``{"fitted_data": {"chunks": (100, 1)}}`` with ``"zarr"``.
+    """
+    number_of_threads: int | None = None
+    """Number of threads saving the files of a result concurrently.
+
+    None uses the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+    """
 
 
 SAVING_OPTIONS_DEFAULT = SavingOptions()
@@ -1,13 +1,35 @@
 """Module containing dataset preparation functionality."""
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from functools import cache
 from typing import TYPE_CHECKING
 
 import numpy as np
 import xarray as xr
 
+from glotaran.utils.lazy_variable import lazy_variable
+
 if TYPE_CHECKING:
     from collections.abc import Hashable
+    from typing import Literal
+
+    SvdMethod = Literal["full", "truncated", "randomized"]
+
+SVD_METHODS = ("full", "truncated", "randomized")
+"""Supported methods to calculate the SVD of a data matrix."""
+
+SVD_CACHE_MAX_BYTES = 2**28
+"""Maximum number of bytes of the cached singular vectors and values."""
+
+SVD_CACHE_MAX_ENTRY_BYTES = 2**26
+"""Maximum number of bytes of the singular vectors and values of a single cached SVD."""
+
+FINGERPRINT_BLOCK_BYTES = 2**24
+"""Number of bytes of not contiguous data copied at once to calculate a fingerprint."""
+
+_SVD_CACHE: OrderedDict[bytes, tuple[np.ndarray, np.ndarray, np.ndarray]] = OrderedDict()
 
 
 def prepare_time_trace_dataset(
@@ -56,16 +78,196 @@ def prepare_time_trace_dataset(
     return dataset
 
 
+def clear_svd_cache():
+    """Remove all SVDs from the cache of :func:`calculate_svd`."""
+    _SVD_CACHE.clear()
+
+
+def data_fingerprint(data: np.ndarray, *options: object) -> bytes:
+    """Calculate a fingerprint of the content of a data matrix.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        The data matrix.
+    *options: object
+        Additional values (e.g. calculation options) the fingerprint depends on.
+
+    Returns
+    -------
+    bytes
+        The blake2b digest of the shape, dtype, values and options.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr((data.shape, data.dtype.str, options)).encode())
+    if data.flags.c_contiguous:
+        hasher.update(np.ascontiguousarray(data).view(np.uint8).data)
+    else:
+        # Hash blocks of rows, so no contiguous copy of the whole data is needed
+        row_size = max(data[:1].nbytes, 1)
+        block_size = max(FINGERPRINT_BLOCK_BYTES // row_size, 1)
+        for start in range(0, data.shape[0], block_size):
+            hasher.update(
+                np.ascontiguousarray(data[start : start + block_size]).view(np.uint8).data
+            )
+    return hasher.digest()
+
+
+def randomized_svd(
+    data: np.ndarray,
+    number_of_components: int,
+    *,
+    oversampling: int = 10,
+    power_iterations: int = 2,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Approximate the leading singular vectors and values with a randomized range finder.
+
+    The range of ``data`` is sampled with a random gaussian matrix, refined with power
+    iterations and the exact SVD of ``data`` projected on this range is calculated
+    (Halko, Martinsson and Tropp 2011).
+
+    Parameters
+    ----------
+    data: np.ndarray
+        The data matrix.
+    number_of_components: int
+        The number of singular values to calculate.
+    oversampling: int
+        Number of additional samples of the range. Defaults to 10.
+    power_iterations: int
+        Number of power iterations, which improve the accuracy for slowly decaying
+        singular values. Defaults to 2.
+    seed: int
+        Seed of the random matrix. Defaults to 0.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The left singular vectors, the singular values and the (transposed) right
+        singular vectors, like :func:`numpy.linalg.svd`.
+    """
+    number_of_samples = min(number_of_components + oversampling, *data.shape)
+    sample = np.random.default_rng(seed).standard_normal((data.shape[1], number_of_samples))
+    basis, _ = np.linalg.qr(data @ sample)
+    for _ in range(power_iterations):
+        basis, _ = np.linalg.qr(data.T @ basis)
+        basis, _ = np.linalg.qr(data @ basis)
+    left, singular_values, right = np.linalg.svd(basis.T @ data, full_matrices=False)
+    return (
+        (basis @ left)[:, :number_of_components],
+        singular_values[:number_of_components],
+        right[:number_of_components],
+    )
+
+
+def _validate_svd_options(method: str, number_of_components: int | None):
+    """Raise a ``ValueError`` if the options of :func:`calculate_svd` are invalid."""
+    if method not in SVD_METHODS:
+        raise ValueError(f"Unknown SVD method {method!r}, supported methods are {SVD_METHODS}.")
+    if number_of_components is None and method != "full":
+        raise ValueError(f"The SVD method {method!r} requires 'number_of_components'.")
+    if number_of_components is not None and number_of_components < 1:
+        raise ValueError(
+            f"'number_of_components' needs to be positive, got {number_of_components}."
+        )
+
+
+def calculate_svd(
+    data: np.ndarray,
+    *,
+    method: SvdMethod = "full",
+    number_of_components: int | None = None,
+    use_cache: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate the SVD of a data matrix.
+
+    Results are cached by the fingerprint of the data, so recalculating the SVD of the
+    same data (e.g. reloading a dataset or refitting a scheme) is skipped. SVDs larger
+    than ``SVD_CACHE_MAX_ENTRY_BYTES`` are not cached.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        The data matrix.
+    method: SvdMethod
+        ``"full"`` calculates all singular values, ``"truncated"`` the leading
+        ``number_of_components`` with ARPACK and ``"randomized"`` approximates them with
+        :func:`randomized_svd`. Defaults to ``"full"``.
+    number_of_components: int | None
+        Number of singular values to calculate. Required for ``"truncated"`` and
+        ``"randomized"``, the full SVD is truncated if provided. Defaults to None.
+    use_cache: bool
+        Whether to look up and store the result in the cache. Defaults to True.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The left singular vectors, the singular values and the (transposed) right
+        singular vectors, like :func:`numpy.linalg.svd`. The arrays are read-only since
+        they are shared with the cache.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is unknown or ``number_of_components`` is missing or not positive.
+    """
+    _validate_svd_options(method, number_of_components)
+
+    data = np.asarray(data)
+    if use_cache:
+        fingerprint = data_fingerprint(data, method, number_of_components)
+        if fingerprint in _SVD_CACHE:
+            _SVD_CACHE.move_to_end(fingerprint)
+            return _SVD_CACHE[fingerprint]
+
+    if method == "full" or number_of_components >= min(data.shape):  # type:ignore[operator]
+        left, singular_values, right = np.linalg.svd(data, full_matrices=False)
+        left, singular_values, right = (
+            left[:, :number_of_components],
+            singular_values[:number_of_components],
+            right[:number_of_components],
+        )
+    elif method == "truncated":
+        from scipy.sparse.linalg import svds
+
+        left, singular_values, right = svds(data, k=number_of_components, random_state=0)
+        # ARPACK returns the singular values in ascending order
+        left, singular_values, right = left[:, ::-1], singular_values[::-1], right[::-1]
+    else:
+        left, singular_values, right = randomized_svd(
+            data, number_of_components  # type:ignore[arg-type]
+        )
+
+    svd = tuple(np.ascontiguousarray(array) for array in (left, singular_values, right))
+    for array in svd:
+        array.flags.writeable = False
+    # Large SVDs are rarely recalculated and would be kept for the lifetime of the process
+    if use_cache and sum(array.nbytes for array in svd) <= SVD_CACHE_MAX_ENTRY_BYTES:
+        _SVD_CACHE[fingerprint] = svd  # type:ignore[assignment]
+        cache_size = sum(array.nbytes for cached in _SVD_CACHE.values() for array in cached)
+        while cache_size > SVD_CACHE_MAX_BYTES and len(_SVD_CACHE) > 1:
+            _, removed = _SVD_CACHE.popitem(last=False)
+            cache_size -= sum(array.nbytes for array in removed)
+    return svd  # type:ignore[return-value]
+
+
 def add_svd_to_dataset(
     dataset: xr.Dataset,
     name: str = "data",
     lsv_dim: Hashable = "time",
     rsv_dim: Hashable = "spectral",
     data_array: xr.DataArray | None = None,
+    *,
+    method: SvdMethod = "full",
+    number_of_components: int | None = None,
+    lazy: bool = False,
+    use_cache: bool = True,
 ) -> None:
     """Add the SVD of a dataset inplace as Data variables to the dataset.
 
-    The SVD is only computed if it doesn't already exist on the dataset.
+    The SVD is only computed if it doesn't already exist on the dataset or in the cache
+    of :func:`calculate_svd`. The dataset gets writable copies of the cached arrays.
 
     Parameters
     ----------
@@ -80,11 +282,60 @@ def add_svd_to_dataset(
     data_array: xr.DataArray | None
         Dataarray to calculate the SVD for, when provided the data extraction
         from the dataset will be skipped, by default None
+    method: SvdMethod
+        Method to calculate the SVD with, see :func:`calculate_svd`. Defaults to "full".
+    number_of_components: int | None
+        Number of singular values to calculate, see :func:`calculate_svd`.
+        Defaults to None.
+    lazy: bool
+        Whether to calculate the SVD on first access of one of its variables instead
+        of immediately. Defaults to False.
+    use_cache: bool
+        Whether to use the cache of :func:`calculate_svd`, which is only worth it for
+        data whose SVD might be calculated again. Defaults to True.
     """
     if data_array is None:
         data_array = dataset[name] if name != "data" else dataset.data
-    if f"{name}_singular_values" not in dataset:
-        l, s, r = np.linalg.svd(data_array, full_matrices=False)
+    if f"{name}_singular_values" in dataset:
+        return
+    if not lazy:
+        # The cached arrays are read-only and shared, the dataset gets its own copies
+        l, s, r = (
+            array.copy()
+            for array in calculate_svd(
+                data_array.values,
+                method=method,
+                number_of_components=number_of_components,
+                use_cache=use_cache,
+            )
+        )
         dataset[f"{name}_left_singular_vectors"] = ((lsv_dim, "left_singular_value_index"), l)
         dataset[f"{name}_singular_values"] = (("singular_value_index"), s)
         dataset[f"{name}_right_singular_vectors"] = ((rsv_dim, "right_singular_value_index"), r.T)
+        return
+
+    _validate_svd_options(method, number_of_components)
+    lsv_size, rsv_size = data_array.shape
+    size = min(lsv_size, rsv_size, number_of_components or lsv_size)
+
+    @cache
+    def svd() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return tuple(  # type:ignore[return-value]
+            array.copy()
+            for array in calculate_svd(
+                data_array.values,  # type:ignore[union-attr]
+                method=method,
+                number_of_components=number_of_components,
+                use_cache=use_cache,
+            )
+        )
+
+    dataset[f"{name}_left_singular_vectors"] = lazy_variable(
+        (lsv_dim, "left_singular_value_index"), (lsv_size, size), np.float64, lambda: svd()[0]
+    )
+    dataset[f"{name}_singular_values"] = lazy_variable(
+        ("singular_value_index",), (size,), np.float64, lambda: svd()[1]
+    )
+    dataset[f"{name}_right_singular_vectors"] = lazy_variable(
+        (rsv_dim, "right_singular_value_index"), (rsv_size, size), np.float64, lambda: svd()[2].T
+    )
@@ -0,0 +1,107 @@
+"""Tests for ``glotaran.io.prepare_dataset``."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from glotaran.io import prepare_dataset
+from glotaran.io.prepare_dataset import add_svd_to_dataset
+from glotaran.io.prepare_dataset import calculate_svd
+from glotaran.io.prepare_dataset import clear_svd_cache
+
+
+@pytest.fixture
+def low_rank_data() -> np.ndarray:
+    """Rank 3 data matrix with a little noise."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((200, 3)) @ np.diag([100, 10, 1]) @ rng.standard_normal((3, 50))
+    return data + 1e-6 * rng.standard_normal(data.shape)
+
+
+@pytest.mark.parametrize("method", ("full", "truncated", "randomized"))
+def test_calculate_svd(low_rank_data: np.ndarray, method: str):
+    """Leading singular values and subspaces match the full SVD."""
+    expected_left, expected_singular_values, expected_right = np.linalg.svd(
+        low_rank_data, full_matrices=False
+    )
+
+    left, singular_values, right = calculate_svd(
+        low_rank_data, method=method, number_of_components=3, use_cache=False
+    )
+
+    assert left.shape == (200, 3)
+    assert right.shape == (3, 50)
+    assert not left.flags.writeable
+    np.testing.assert_allclose(singular_values, expected_singular_values[:3])
+    # Singular vectors are only defined up to their sign
+    np.testing.assert_allclose(np.abs(np.sum(left * expected_left[:, :3], axis=0)), 1)
+    np.testing.assert_allclose(np.abs(np.sum(right * expected_right[:3], axis=1)), 1)
+
+
+def test_calculate_svd_cache(low_rank_data: np.ndarray, monkeypatch: pytest.MonkeyPatch):
+    """The SVD of the same data and options is only calculated once."""
+    clear_svd_cache()
+    first = calculate_svd(low_rank_data)
+    assert calculate_svd(low_rank_data.copy()) is first
+    assert calculate_svd(low_rank_data, number_of_components=2) is not first
+
+    changed_data = low_rank_data.copy()
+    changed_data[0, 0] += 1
+    assert calculate_svd(changed_data) is not first
+
+    monkeypatch.setattr(prepare_dataset, "SVD_CACHE_MAX_BYTES", 0)
+    calculate_svd(low_rank_data, method="randomized", number_of_components=3)
+    assert len(prepare_dataset._SVD_CACHE) == 1
+    clear_svd_cache()
+    assert calculate_svd(low_rank_data) is not first
+
+    clear_svd_cache()
+    monkeypatch.setattr(prepare_dataset, "SVD_CACHE_MAX_ENTRY_BYTES", 0)
+    calculate_svd(low_rank_data)
+    assert len(prepare_dataset._SVD_CACHE) == 0
+
+
+@pytest.mark.parametrize(
+    "method, number_of_components, message",
+    (
+        ("arpack", None, "Unknown SVD method 'arpack'"),
+        ("randomized", None, "requires 'number_of_components'"),
+        ("full", 0, "'number_of_components' needs to be positive"),
+    ),
+)
+def test_calculate_svd_errors(method: str, number_of_components: int | None, message: str):
+    """Invalid options raise."""
+    with pytest.raises(ValueError, match=message):
+        calculate_svd(np.ones((3, 3)), method=method, number_of_components=number_of_components)
+
+
+@pytest.mark.parametrize("lazy", (False, True))
+def test_add_svd_to_dataset_writable_copies(low_rank_data: np.ndarray, lazy: bool):
+    """Datasets with equal data get their own writable singular vectors."""
+    datasets = [
+        xr.DataArray(low_rank_data, dims=("time", "spectral")).to_dataset(name="data")
+        for _ in range(2)
+    ]
+    for dataset in datasets:
+        add_svd_to_dataset(dataset, lazy=lazy)
+
+    left_singular_vectors = [dataset.data_left_singular_vectors.values for dataset in datasets]
+    assert all(values.flags.writeable for values in left_singular_vectors)
+    assert not np.shares_memory(*left_singular_vectors)
+    if not lazy:
+        expected = left_singular_vectors[1].copy()
+        datasets[0]["data_left_singular_vectors"][:, 0] *= -1
+        np.testing.assert_array_equal(datasets[1].data_left_singular_vectors, expected)
+
+
+def test_add_svd_to_dataset_truncated(low_rank_data: np.ndarray):
+    """Only the requested number of singular vectors is added."""
+    dataset = xr.DataArray(low_rank_data, dims=("time", "spectral")).to_dataset(name="data")
+
+    add_svd_to_dataset(dataset, method="truncated", number_of_components=2)
+
+    assert dataset.data_singular_values.shape == (2,)
+    assert dataset.data_left_singular_vectors.dims == ("time", "left_singular_value_index")
+    assert dataset.data_left_singular_vectors.shape == (200, 2)
+    assert dataset.data_right_singular_vectors.shape == (50, 2)
@@ -1 +1,16 @@
 """This package contains functions for optimization."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from glotaran.utils.lazy_import import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from glotaran.optimization.flim import optimize_flim
+
+__getattr__, __dir__, __all__ = lazy_module_attributes(
+    __name__,
+    {
+        "optimize_flim": "glotaran.optimization.flim",
+    },
+)
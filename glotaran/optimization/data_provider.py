@@ -19,6 +19,34 @@ if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
 
 
+LAZY_READ_BLOCK_SIZE = 2**24
+"""Number of bytes read at once from data which are not loaded into memory."""
+
+
+def read_data_array_in_blocks(data_array: xr.DataArray) -> np.ndarray:
+    """Copy a 2D data array, which might not be loaded into memory, in blocks of columns.
+
+    This way only the fortran ordered result is allocated and no temporary copy of the
+    whole data array. For data in memory this is as fast as a single copy.
+
+    Parameters
+    ----------
+    data_array : xr.DataArray
+        The data array to read.
+
+    Returns
+    -------
+    np.ndarray
+        The fortran ordered values of the data array.
+    """
+    data = np.empty(data_array.shape, dtype=data_array.dtype, order="F")
+    column_size = max(data.shape[0] * data.itemsize, 1)
+    block_size = max(LAZY_READ_BLOCK_SIZE // column_size, 1)
+    for start in range(0, data.shape[1], block_size):
+        data[:, start : start + block_size] = data_array[:, start : start + block_size].to_numpy()
+    return data
+
+
 class AlignDatasetError(ValueError):
     """Indicates that datasets can not be aligned."""
 
@@ -67,15 +95,14 @@ class DataProvider:
             self.add_model_weight(scheme.model, label, model_dimension, global_dimension)
 
             self._data[label] = self.get_from_dataset(  # type:ignore[assignment]
-                dataset, "data", model_dimension, global_dimension
+                dataset, "data", model_dimension, global_dimension, weight=self._weight[label]
             )
-            if self._weight[label] is not None:
-                self._data[label] *= self._weight[label]
 
             if has_dataset_model_global_model(dataset_model):
-                self._flattened_data[label] = self._data[label].T.flatten()
+                # The arrays are fortran ordered, so the flattened arrays are views.
+                self._flattened_data[label] = self._data[label].T.reshape(-1)
                 self._flattened_weight[label] = (
-                    self._weight[label].T.flatten()  # type:ignore[union-attr]
+                    self._weight[label].T.reshape(-1)  # type:ignore[union-attr]
                     if self._weight[label] is not None
                     else None
                 )
@@ -100,10 +127,18 @@ class DataProvider:
 
     @staticmethod
     def get_from_dataset(
-        dataset: xr.Dataset, name: str, model_dimension: str, global_dimension: str
+        dataset: xr.Dataset,
+        name: str,
+        model_dimension: str,
+        global_dimension: str,
+        weight: ArrayLike | None = None,
     ) -> ArrayLike | None:
         """Get a copy of data from a dataset with dimensions (model, global).
 
+        The copy is fortran ordered, so the values of a global index are contiguous.
+        It is created with :func:`read_data_array_in_blocks`, so lazily loaded data
+        (e.g. from ``load_dataset(file_name, lazy=True)``) are read from file only once.
+
         Parameters
         ----------
         dataset : xr.Dataset
@@ -114,17 +149,21 @@ class DataProvider:
             The model dimension.
         global_dimension : str
             The global dimension.
+        weight : ArrayLike | None
+            Weight with dimensions (model, global) the data get multiplied with.
+            Defaults to None.
 
         Returns
         -------
         ArrayLike | None
             The copy of the data. None if name is not present in dataset.
         """
-        data = None
-        if name in dataset:
-            data = dataset[name].data.copy()
-            if dataset[name].dims != (model_dimension, global_dimension):
-                data = data.T
+        if name not in dataset:
+            return None
+        data_array = dataset[name].transpose(model_dimension, global_dimension)
+        data = read_data_array_in_blocks(data_array)
+        if weight is not None:
+            data *= weight
         return data
 
     @staticmethod
@@ -189,7 +228,7 @@ class DataProvider:
         model_axis = self._model_axes[dataset_label]
         global_axis = self._global_axes[dataset_label]
         weight = xr.DataArray(
-            np.ones((model_axis.size, global_axis.size)),
+            np.ones((model_axis.size, global_axis.size), order="F"),
             coords=(
                 (model_dimension, model_axis),
                 (global_dimension, global_axis),
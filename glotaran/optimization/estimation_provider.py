@@ -18,6 +18,7 @@ from glotaran.optimization.matrix_provider import MatrixProviderLinked
 from glotaran.optimization.matrix_provider import MatrixProviderUnlinked
 from glotaran.optimization.nnls import residual_nnls
 from glotaran.optimization.variable_projection import residual_variable_projection
+from glotaran.utils.tracing import trace_span
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
@@ -287,13 +288,19 @@ class EstimationProviderUnlinked(EstimationProvider):
 
     def estimate(self):
         """Calculate the estimation."""
-        self._clp_penalty.clear()
-
-        for dataset_model in self.group.dataset_models.values():
-            if has_dataset_model_global_model(dataset_model):
-                self.calculate_full_model_estimation(dataset_model)
-            else:
-                self.calculate_estimation(dataset_model)
+        with trace_span("EstimationProvider.estimate"):
+            self._clp_penalty.clear()
+
+            for label, dataset_model in self.group.dataset_models.items():
+                with trace_span(
+                    "EstimationProvider.calculate_estimation",
+                    dataset=label,
+                    global_index_range=(0, self._data_provider.get_global_axis(label).size),
+                ):
+                    if has_dataset_model_global_model(dataset_model):
+                        self.calculate_full_model_estimation(dataset_model)
+                    else:
+                        self.calculate_estimation(dataset_model)
 
     def get_full_penalty(self) -> ArrayLike:
         """Get the full penalty.
@@ -445,23 +452,27 @@ class EstimationProviderLinked(EstimationProvider):
 
     def estimate(self):
         """Calculate the estimation."""
-        for index, global_index_value in enumerate(self._data_provider.aligned_global_axis):
-            matrix_container = self._matrix_provider.get_aligned_matrix_container(index)
-            data = self._data_provider.get_aligned_data(index)
-            reduced_clps, residual = self.calculate_residual(matrix_container.matrix, data)
-            self._clps[index] = self.retrieve_clps(
-                self._matrix_provider.aligned_full_clp_labels[index],
-                matrix_container.clp_labels,
-                reduced_clps,
-                global_index_value,
-            )
-            self._residuals[index] = residual
+        with trace_span(
+            "EstimationProvider.estimate",
+            global_index_range=(0, self._data_provider.aligned_global_axis.size),
+        ):
+            for index, global_index_value in enumerate(self._data_provider.aligned_global_axis):
+                matrix_container = self._matrix_provider.get_aligned_matrix_container(index)
+                data = self._data_provider.get_aligned_data(index)
+                reduced_clps, residual = self.calculate_residual(matrix_container.matrix, data)
+                self._clps[index] = self.retrieve_clps(
+                    self._matrix_provider.aligned_full_clp_labels[index],
+                    matrix_container.clp_labels,
+                    reduced_clps,
+                    global_index_value,
+                )
+                self._residuals[index] = residual
 
-        self._clp_penalty = self.calculate_clp_penalties(
-            self._matrix_provider.aligned_full_clp_labels,
-            self._clps,
-            self._data_provider.aligned_global_axis,
-        )
+            self._clp_penalty = self.calculate_clp_penalties(
+                self._matrix_provider.aligned_full_clp_labels,
+                self._clps,
+                self._data_provider.aligned_global_axis,
+            )
 
     def get_full_penalty(self) -> ArrayLike:
         """Get the full penalty.
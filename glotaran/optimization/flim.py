@@ -0,0 +1,486 @@
+"""Module containing the pixel parallel analysis of FLIM data.
+
+Fluorescence lifetime images contain tens of thousands of pixels with a decay trace each.
+As long as all pixels share the same IRF, they also share the model matrix. Instead of
+treating the pixels as global axis of a single optimization, the matrix is calculated once
+and the clps of all pixels are solved in batches. Optionally the parameters are refined
+for every pixel in a pool of processes.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from scipy.linalg import solve_triangular
+from scipy.optimize import least_squares
+from scipy.optimize import nnls
+
+from glotaran.model import DatasetGroup
+from glotaran.model import Model
+from glotaran.model.dataset_model import get_dataset_model_model_dimension
+from glotaran.model.dataset_model import has_dataset_model_global_model
+from glotaran.optimization.matrix_provider import MatrixContainer
+from glotaran.optimization.matrix_provider import MatrixProvider
+from glotaran.optimization.optimizer import SUPPORTED_METHODS
+from glotaran.optimization.optimizer import UnsupportedMethodError
+from glotaran.parameter import Parameters
+from glotaran.plugin_system.megacomplex_registration import get_megacomplex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from glotaran.model import DatasetModel
+    from glotaran.project import Scheme
+
+FLIM_BATCH_SIZE = 4096
+"""Number of pixels which are solved at once."""
+
+_WORKER_STATE: dict[str, Any] = {}
+"""State of a pixel refinement worker, which is set by :func:`initialize_refinement`."""
+
+
+@dataclass
+class SharedMatrix:
+    """The model matrix shared by all pixels, with constraints and relations applied."""
+
+    clp_labels: list[str]
+    """The labels of the clps."""
+    matrix: np.ndarray
+    """The reduced matrix with the shape ``(model axis size, number of reduced clps)``."""
+    clp_mapping: np.ndarray
+    """Matrix mapping the reduced clps to the clps."""
+
+    def solve(
+        self, data: np.ndarray, residual_function: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Solve the clps of a batch of pixels.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The traces of the pixels with the shape ``(model axis size, number of pixels)``.
+        residual_function : str
+            ``"variable_projection"`` solves the linear least squares problems of all
+            pixels with a single QR decomposition, ``"non_negative_least_squares"``
+            solves them pixel by pixel.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The clps with the shape ``(number of pixels, number of clps)``,
+            the residuals with the shape of ``data`` and the chi square of the pixels.
+        """
+        if residual_function == "non_negative_least_squares":
+            reduced_clps = np.column_stack([nnls(self.matrix, trace)[0] for trace in data.T])
+        else:
+            q, r = np.linalg.qr(self.matrix)
+            reduced_clps = solve_triangular(r, q.T @ data)
+        residual = data - self.matrix @ reduced_clps
+        return (
+            (self.clp_mapping @ reduced_clps).T,
+            residual,
+            np.einsum("ij,ij->j", residual, residual),
+        )
+
+
+def create_dataset_group(model: Model, dataset_label: str) -> DatasetGroup:
+    """Create the dataset group containing only the FLIM dataset.
+
+    Parameters
+    ----------
+    model : Model
+        The model.
+    dataset_label : str
+        The label of the FLIM dataset.
+
+    Returns
+    -------
+    DatasetGroup
+        The dataset group.
+    """
+    group = model.get_dataset_groups()[model.dataset[dataset_label].group]
+    group.dataset_models = {dataset_label: model.dataset[dataset_label]}
+    return group
+
+
+def calculate_shared_matrix(
+    group: DatasetGroup, dataset_label: str, model_axis: np.ndarray, parameters: Parameters
+) -> SharedMatrix:
+    """Calculate the matrix shared by all pixels.
+
+    Parameters
+    ----------
+    group : DatasetGroup
+        The dataset group created by :func:`create_dataset_group`.
+    dataset_label : str
+        The label of the FLIM dataset.
+    model_axis : np.ndarray
+        The model axis, e.g. the time axis.
+    parameters : Parameters
+        The parameters.
+
+    Returns
+    -------
+    SharedMatrix
+        The shared matrix.
+
+    Raises
+    ------
+    ValueError
+        If the matrix depends on the pixel.
+    """
+    group.set_parameters(parameters)
+    dataset_model = group.dataset_models[dataset_label]
+    container = MatrixProvider.calculate_dataset_matrix(dataset_model, np.zeros(1), model_axis)
+    if container.is_index_dependent:
+        raise ValueError(
+            f"The matrix of dataset '{dataset_label}' is index dependent, "
+            "but all pixels need to share the same matrix."
+        )
+    if dataset_model.scale is not None:
+        container = container.create_scaled_matrix(dataset_model.scale)
+
+    # The reduction is linear, so reducing the identity gives the mapping of the clps
+    matrix_provider = MatrixProvider(group)
+    identity = MatrixContainer(container.clp_labels, np.eye(len(container.clp_labels)))
+    clp_mapping = matrix_provider.reduce_matrix(identity, np.zeros(1))[0].matrix
+    return SharedMatrix(container.clp_labels, container.matrix @ clp_mapping, clp_mapping)
+
+
+def calculate_decay_components(
+    dataset_model: DatasetModel, clp_labels: list[str], clps: np.ndarray
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Calculate the rates and decay associated amplitudes of the decay megacomplexes.
+
+    Parameters
+    ----------
+    dataset_model : DatasetModel
+        The filled dataset model.
+    clp_labels : list[str]
+        The labels of the clps.
+    clps : np.ndarray
+        The clps with the shape ``(number of pixels, number of clps)``.
+
+    Returns
+    -------
+    dict[str, tuple[np.ndarray, np.ndarray]]
+        The rates and the decay associated amplitudes with the shape
+        ``(number of pixels, number of rates)`` of each decay megacomplex.
+    """
+    from glotaran.builtin.megacomplexes.decay.util import collect_megacomplexes
+
+    components = {}
+    for megacomplex in collect_megacomplexes(dataset_model, as_global=False):
+        species = megacomplex.get_compartments(dataset_model)
+        initial_concentration = megacomplex.get_initial_concentration(dataset_model)
+        rates = megacomplex.get_k_matrix().rates(species, initial_concentration)
+        species_clps = clps[:, [clp_labels.index(label) for label in species]]
+        components[megacomplex.label] = (
+            rates,
+            species_clps @ megacomplex.get_a_matrix(dataset_model).T,
+        )
+    return components
+
+
+def initialize_refinement(
+    model_dict: dict[str, Any],
+    parameter_dict_list: list[dict[str, Any]],
+    dataset_label: str,
+    model_axis: np.ndarray,
+    options: dict[str, Any],
+):
+    """Initialize a pixel refinement worker.
+
+    Models are not picklable, so the model is recreated from its dictionary.
+
+    Parameters
+    ----------
+    model_dict : dict[str, Any]
+        The model as dictionary, see :meth:`Model.as_dict`.
+    parameter_dict_list : list[dict[str, Any]]
+        The starting parameters as list of dictionaries.
+    dataset_label : str
+        The label of the FLIM dataset.
+    model_axis : np.ndarray
+        The model axis.
+    options : dict[str, Any]
+        The residual function and the options of :func:`scipy.optimize.least_squares`.
+    """
+    megacomplex_types = {get_megacomplex(m["type"]) for m in model_dict["megacomplex"].values()}
+    model = Model.create_class_from_megacomplexes(megacomplex_types)(**model_dict)
+    parameters = Parameters.from_parameter_dict_list(parameter_dict_list)
+    (
+        labels,
+        initial_values,
+        lower_bounds,
+        upper_bounds,
+    ) = parameters.get_label_value_and_bounds_arrays(exclude_non_vary=True)
+    _WORKER_STATE.update(
+        group=create_dataset_group(model, dataset_label),
+        dataset_label=dataset_label,
+        model_axis=model_axis,
+        parameters=parameters,
+        labels=labels,
+        initial_values=initial_values,
+        bounds=(lower_bounds, upper_bounds),
+        **options,
+    )
+
+
+def _calculate_pixel_solution(
+    values: np.ndarray, trace: np.ndarray
+) -> tuple[SharedMatrix, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate the matrix and clps of a pixel for the free parameter ``values``."""
+    parameters = _WORKER_STATE["parameters"]
+    parameters.set_from_label_and_value_arrays(_WORKER_STATE["labels"], values)
+    shared_matrix = calculate_shared_matrix(
+        _WORKER_STATE["group"],
+        _WORKER_STATE["dataset_label"],
+        _WORKER_STATE["model_axis"],
+        parameters,
+    )
+    return shared_matrix, *shared_matrix.solve(
+        trace[:, np.newaxis], _WORKER_STATE["residual_function"]
+    )
+
+
+def refine_pixels(
+    data: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, tuple[np.ndarray, np.ndarray]]]:
+    """Optimize the parameters of each pixel in a batch, starting from the shared parameters.
+
+    Needs to be called in a worker initialized with :func:`initialize_refinement`.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The traces of the pixels with the shape ``(model axis size, number of pixels)``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, tuple[np.ndarray, np.ndarray]]]
+        The optimized free parameters, the clps and the chi square of the pixels and the
+        rates and decay associated amplitudes of the decay megacomplexes.
+    """
+    state = _WORKER_STATE
+    parameter_values = np.empty((data.shape[1], len(state["labels"])))
+    clps = []
+    chi_square = np.empty(data.shape[1])
+    components: dict[str, tuple[list[np.ndarray], list[np.ndarray]]] = {}
+    for pixel_index, trace in enumerate(data.T):
+        optimization_result = least_squares(
+            lambda values: _calculate_pixel_solution(values, trace)[2][:, 0],
+            state["initial_values"],
+            bounds=state["bounds"],
+            method=state["method"],
+            max_nfev=state["max_nfev"],
+            ftol=state["ftol"],
+            gtol=state["gtol"],
+            xtol=state["xtol"],
+        )
+        parameter_values[pixel_index] = optimization_result.x
+        shared_matrix, pixel_clps, _, pixel_chi_square = _calculate_pixel_solution(
+            optimization_result.x, trace
+        )
+        clps.append(pixel_clps[0])
+        chi_square[pixel_index] = pixel_chi_square[0]
+        dataset_model = state["group"].dataset_models[state["dataset_label"]]
+        for label, (rates, amplitudes) in calculate_decay_components(
+            dataset_model, shared_matrix.clp_labels, pixel_clps
+        ).items():
+            component_rates, component_amplitudes = components.setdefault(label, ([], []))
+            component_rates.append(rates)
+            component_amplitudes.append(amplitudes[0])
+    return (
+        parameter_values,
+        np.array(clps),
+        chi_square,
+        {
+            label: (np.array(rates), np.array(amplitudes))
+            for label, (rates, amplitudes) in components.items()
+        },
+    )
+
+
+def iterate_pixel_batches(data: xr.DataArray, batch_size: int) -> Iterator[np.ndarray]:
+    """Iterate over the traces of batches of pixels.
+
+    Parameters
+    ----------
+    data : xr.DataArray
+        The data with the dimensions ``(model dimension, pixel dimension)``.
+    batch_size : int
+        The number of pixels in a batch.
+
+    Yields
+    ------
+    np.ndarray
+        The traces of the pixels of a batch as float array.
+    """
+    for start in range(0, data.shape[1], batch_size):
+        yield np.asarray(data[:, start : start + batch_size].values, dtype=np.float64)
+
+
+def optimize_flim(
+    scheme: Scheme,
+    dataset_label: str | None = None,
+    *,
+    batch_size: int = FLIM_BATCH_SIZE,
+    refine: bool = False,
+    number_of_processes: int | None = None,
+) -> xr.Dataset:
+    """Analyze the pixels of a FLIM dataset in parallel.
+
+    All pixels share the matrix calculated with ``scheme.parameters``, e.g. the parameters
+    of a global analysis of the summed up traces, and their clps are solved in batches.
+    With ``refine=True`` the free parameters are additionally optimized for every pixel.
+
+    Weights and global megacomplexes are not supported, and the matrix must not depend on
+    the pixel.
+
+    Parameters
+    ----------
+    scheme : Scheme
+        The scheme containing the model, the parameters and the FLIM dataset, e.g. loaded
+        with ``load_dataset("image.sdt", flim=True)``.
+    dataset_label : str | None
+        The label of the FLIM dataset. Defaults to None, which uses the only dataset.
+    batch_size : int
+        The number of pixels which are solved at once. Defaults to ``FLIM_BATCH_SIZE``.
+    refine : bool
+        Whether to optimize the free parameters for every pixel. Defaults to False.
+    number_of_processes : int | None
+        The number of processes refining the pixels. 1 refines the pixels in the calling
+        process. Defaults to None, which uses the default of
+        :class:`concurrent.futures.ProcessPoolExecutor`. The processes are spawned, so
+        scripts need an ``if __name__ == "__main__":`` guard.
+
+    Returns
+    -------
+    xr.Dataset
+        Maps of the intensity, the clps as ``amplitude`` and the ``chi_square`` of the
+        pixels. For each decay megacomplex the ``decay_associated_amplitude``, the
+        ``lifetime`` and the amplitude weighted ``average_lifetime`` with the
+        megacomplex label as suffix. With ``refine=True`` the optimized free parameters
+        as ``optimized_parameters``. Pixels identified by ``x`` and ``y`` are unstacked
+        to ``pixel_x`` and ``pixel_y``.
+
+    Raises
+    ------
+    ValueError
+        If the dataset label is missing or the dataset is weighted or has
+        global megacomplexes.
+    UnsupportedMethodError
+        If the optimization method of the scheme is unsupported.
+    """
+    if dataset_label is None:
+        if len(scheme.model.dataset) != 1:
+            raise ValueError(
+                f"The model contains {len(scheme.model.dataset)} datasets, "
+                "please provide the label of the FLIM dataset."
+            )
+        dataset_label = next(iter(scheme.model.dataset))
+    if scheme.optimization_method not in SUPPORTED_METHODS:
+        raise UnsupportedMethodError(scheme.optimization_method)
+    dataset = scheme.data[dataset_label]
+    if "weight" in dataset or len(scheme.model.weights) != 0:
+        raise ValueError("Weighted FLIM datasets are not supported.")
+
+    group = create_dataset_group(scheme.model, dataset_label)
+    group.set_parameters(scheme.parameters)
+    dataset_model = group.dataset_models[dataset_label]
+    if has_dataset_model_global_model(dataset_model):
+        raise ValueError("Global megacomplexes are not supported for FLIM datasets.")
+    model_dimension = get_dataset_model_model_dimension(dataset_model)
+    pixel_dimension = next(dim for dim in dataset.data.dims if dim != model_dimension)
+    data = dataset.data.transpose(model_dimension, pixel_dimension)
+    model_axis = np.asarray(data.coords[model_dimension].values, dtype=np.float64)
+
+    shared_matrix = calculate_shared_matrix(group, dataset_label, model_axis, scheme.parameters)
+    result = xr.Dataset(
+        {"intensity_map": data.sum(dim=model_dimension).astype(np.float64)},
+        attrs={"model_dimension": model_dimension, "pixel_dimension": pixel_dimension},
+    )
+    batches = iterate_pixel_batches(data, batch_size)
+    if refine:
+        options = {
+            "residual_function": group.residual_function,
+            "method": SUPPORTED_METHODS[scheme.optimization_method],
+            "max_nfev": scheme.maximum_number_function_evaluations,
+            "ftol": scheme.ftol,
+            "gtol": scheme.gtol,
+            "xtol": scheme.xtol,
+        }
+        initializer_arguments = (
+            scheme.model.as_dict(),
+            scheme.parameters.to_parameter_dict_list(),
+            dataset_label,
+            model_axis,
+            options,
+        )
+        if number_of_processes == 1:
+            initialize_refinement(*initializer_arguments)
+            batch_results = list(map(refine_pixels, batches))
+        else:
+            # Forked workers can inherit locks held by threads of numba or BLAS,
+            # so the workers are spawned and rebuild the model from its dict.
+            with ProcessPoolExecutor(
+                number_of_processes,
+                mp_context=get_context("spawn"),
+                initializer=initialize_refinement,
+                initargs=initializer_arguments,
+            ) as executor:
+                batch_results = list(executor.map(refine_pixels, batches))
+        parameter_values, clps, chi_square = (
+            np.concatenate([batch_result[index] for batch_result in batch_results])
+            for index in range(3)
+        )
+        components = {
+            label: (
+                np.concatenate([batch_result[3][label][0] for batch_result in batch_results]),
+                np.concatenate([batch_result[3][label][1] for batch_result in batch_results]),
+            )
+            for label in batch_results[0][3]
+        }
+        result.coords["parameter"] = scheme.parameters.get_label_value_and_bounds_arrays(
+            exclude_non_vary=True
+        )[0]
+        result["optimized_parameters"] = ((pixel_dimension, "parameter"), parameter_values)
+    else:
+        batch_results = [shared_matrix.solve(batch, group.residual_function) for batch in batches]
+        clps = np.concatenate([batch_clps for batch_clps, _, _ in batch_results])
+        chi_square = np.concatenate([batch_chi_square for _, _, batch_chi_square in batch_results])
+        components = calculate_decay_components(dataset_model, shared_matrix.clp_labels, clps)
+
+    result.coords["clp_label"] = shared_matrix.clp_labels
+    result["amplitude"] = ((pixel_dimension, "clp_label"), clps)
+    result["chi_square"] = ((pixel_dimension,), chi_square)
+    for label, (rates, amplitudes) in components.items():
+        component_dimension = f"component_{label}"
+        rate_dimensions = (
+            (pixel_dimension, component_dimension) if rates.ndim == 2 else (component_dimension,)
+        )
+        result.coords[component_dimension] = np.arange(1, amplitudes.shape[1] + 1)
+        result[f"rate_{label}"] = (rate_dimensions, rates)
+        result[f"lifetime_{label}"] = (rate_dimensions, 1 / rates)
+        result[f"decay_associated_amplitude_{label}"] = (
+            (pixel_dimension, component_dimension),
+            amplitudes,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[f"average_lifetime_{label}"] = (
+                (pixel_dimension,),
+                np.sum(amplitudes / rates, axis=1) / np.sum(amplitudes, axis=1),
+            )
+
+    if isinstance(dataset.indexes.get(pixel_dimension), pd.MultiIndex) and set(
+        dataset.indexes[pixel_dimension].names
+    ) == {"x", "y"}:
+        result = result.unstack(pixel_dimension).rename({"x": "pixel_x", "y": "pixel_y"})
+    return result
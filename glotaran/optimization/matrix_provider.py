@@ -19,6 +19,7 @@ from glotaran.model.interval_item import IntervalItem
 from glotaran.model.item import fill_item
 from glotaran.optimization.data_provider import DataProvider
 from glotaran.optimization.data_provider import DataProviderLinked
+from glotaran.utils.tracing import trace_span
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
@@ -141,9 +142,14 @@ class MatrixProvider:
             model_axis = self._data_provider.get_model_axis(label)
             global_axis = self._data_provider.get_global_axis(label)
 
-            self._matrix_containers[label] = self.calculate_dataset_matrix(
-                dataset_model, global_axis, model_axis
-            )
+            with trace_span(
+                "MatrixProvider.calculate_dataset_matrix",
+                dataset=label,
+                global_index_range=(0, global_axis.size),
+            ):
+                self._matrix_containers[label] = self.calculate_dataset_matrix(
+                    dataset_model, global_axis, model_axis
+                )
 
     @staticmethod
     def calculate_dataset_matrix(
@@ -547,10 +553,11 @@ class MatrixProviderUnlinked(MatrixProvider):
 
     def calculate(self):
         """Calculate the matrices for optimization."""
-        self.calculate_dataset_matrices()
-        self.calculate_global_matrices()
-        self.calculate_prepared_matrices()
-        self.calculate_full_matrices()
+        with trace_span("MatrixProvider.calculate"):
+            self.calculate_dataset_matrices()
+            self.calculate_global_matrices()
+            self.calculate_prepared_matrices()
+            self.calculate_full_matrices()
 
     def calculate_global_matrices(self):
         """Calculate the global matrices of the datasets in the dataset group."""
@@ -681,8 +688,9 @@ class MatrixProviderLinked(MatrixProvider):
 
     def calculate(self):
         """Calculate the matrices for optimization."""
-        self.calculate_dataset_matrices()
-        self.calculate_aligned_matrices()
+        with trace_span("MatrixProvider.calculate"):
+            self.calculate_dataset_matrices()
+            self.calculate_aligned_matrices()
 
     def calculate_aligned_matrices(self):
         """Calculate the aligned matrices of the dataset group."""
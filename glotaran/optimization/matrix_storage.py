@@ -0,0 +1,179 @@
+"""Compact storage of the index dependent matrices of result datasets.
+
+Index dependent matrices (e.g. of a dispersive IRF) have the shape
+(global, model, clp) and are often larger than the data itself, with
+variables like the ``species_concentration`` duplicating parts of them.
+They can be saved as ``float32`` or as a recipe, in which case they are
+dropped from the saved dataset and recalculated from the model and the
+optimized parameters on load.
+"""
+from __future__ import annotations
+
+import json
+from functools import cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+
+from glotaran.optimization.matrix_provider import MatrixProvider
+from glotaran.utils.lazy_variable import lazy_variable
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+    from glotaran.model import Model
+    from glotaran.parameter import Parameters
+
+    MatrixFormat = Literal["float64", "float32", "recipe"]
+
+MATRIX_FORMATS = ("float64", "float32", "recipe")
+"""Supported formats to save index dependent matrices with."""
+
+MATRIX_RECIPE_ATTRIBUTE = "matrix_recipe"
+"""Dataset attribute listing the variables which need to be recalculated on load."""
+
+
+def get_index_dependent_matrix_variables(dataset: xr.Dataset) -> list[str]:
+    """Get the names of the index dependent matrix variables of a result dataset.
+
+    These are the ``matrix`` if it is index dependent and all float variables with
+    the global dimension, the model dimension and a third dimension.
+
+    Parameters
+    ----------
+    dataset: xr.Dataset
+        The result dataset.
+
+    Returns
+    -------
+    list[str]
+        The names of the variables.
+    """
+    if "matrix" not in dataset or dataset.matrix.ndim != 3:
+        return []
+    global_dimension, model_dimension = dataset.matrix.dims[:2]
+    return [
+        str(name)
+        for name, variable in dataset.data_vars.items()
+        if variable.ndim == 3
+        and variable.dims[:2] == (global_dimension, model_dimension)
+        and variable.dtype.kind == "f"
+    ]
+
+
+def compact_index_dependent_matrices(
+    dataset: xr.Dataset, matrix_format: MatrixFormat = "float64"
+) -> xr.Dataset:
+    """Create a copy of a result dataset with the index dependent matrices in a compact format.
+
+    With ``"recipe"`` the ``matrix`` and the variables which select clps from it (e.g.
+    ``species_concentration``) are dropped. Their names are stored in the
+    ``matrix_recipe`` attribute and they are recalculated by
+    :func:`restore_index_dependent_matrices`. Other index dependent variables are
+    stored as ``float32``.
+
+    Parameters
+    ----------
+    dataset: xr.Dataset
+        The result dataset.
+    matrix_format: MatrixFormat
+        ``"float64"`` keeps the matrices as they are, ``"float32"`` halves their size
+        and ``"recipe"`` drops them. Defaults to ``"float64"``.
+
+    Returns
+    -------
+    xr.Dataset
+        The dataset to save, ``dataset`` itself if nothing needs to be changed.
+
+    Raises
+    ------
+    ValueError
+        If ``matrix_format`` is not supported.
+    """
+    if matrix_format not in MATRIX_FORMATS:
+        raise ValueError(
+            f"Unknown matrix format {matrix_format!r}, supported formats are {MATRIX_FORMATS}."
+        )
+    variables = get_index_dependent_matrix_variables(dataset)
+    if matrix_format == "float64" or not variables:
+        return dataset
+
+    recipe = {}
+    if matrix_format == "recipe":
+        clp_labels = set(dataset.clp_label.values)
+        for name in variables:
+            clp_dimension = dataset[name].dims[2]
+            if name == "matrix" or (
+                clp_dimension in dataset.coords
+                and set(dataset.coords[clp_dimension].values) <= clp_labels
+            ):
+                recipe[name] = clp_dimension
+
+    compact_dataset = dataset.drop_vars(list(recipe))
+    compact_dataset.attrs = dict(dataset.attrs)
+    for name in variables:
+        if name not in recipe:
+            compact_dataset[name] = dataset[name].astype(np.float32)
+    if recipe:
+        compact_dataset.attrs[MATRIX_RECIPE_ATTRIBUTE] = json.dumps(recipe)
+    return compact_dataset
+
+
+def restore_index_dependent_matrices(
+    dataset: xr.Dataset, dataset_label: str, model: Model, parameters: Parameters
+):
+    """Add the matrices dropped by :func:`compact_index_dependent_matrices` to a dataset.
+
+    The matrices are recalculated from the model and the optimized parameters on first
+    access.
+
+    Parameters
+    ----------
+    dataset: xr.Dataset
+        The loaded result dataset, which gets updated inplace.
+    dataset_label: str
+        The label of the dataset in the model.
+    model: Model
+        The model of the result.
+    parameters: Parameters
+        The optimized parameters of the result.
+    """
+    if MATRIX_RECIPE_ATTRIBUTE not in dataset.attrs:
+        return
+    recipe: dict[str, str] = json.loads(dataset.attrs.pop(MATRIX_RECIPE_ATTRIBUTE))
+    global_dimension = dataset.attrs["global_dimension"]
+    model_dimension = dataset.attrs["model_dimension"]
+    global_axis = dataset.coords[global_dimension].values
+    model_axis = dataset.coords[model_dimension].values
+    clp_labels = dataset.clp_label.values
+    dataset_group = model.get_dataset_groups()[model.dataset[dataset_label].group]
+    dataset_group.set_parameters(parameters)
+    dataset_model = dataset_group.dataset_models[dataset_label]
+
+    @cache
+    def calculate_matrix() -> np.ndarray:
+        matrix_container = MatrixProvider.calculate_dataset_matrix(
+            dataset_model, global_axis, model_axis  # type:ignore[arg-type]
+        )
+        matrix = xr.DataArray(
+            matrix_container.matrix,
+            coords=(
+                (global_dimension, global_axis),
+                (model_dimension, model_axis),
+                ("clp_label", matrix_container.clp_labels),
+            ),
+        )
+        return matrix.reindex(clp_label=clp_labels).values
+
+    def calculate_selection(labels: np.ndarray) -> np.ndarray:
+        return calculate_matrix()[:, :, [list(clp_labels).index(label) for label in labels]]
+
+    for name, clp_dimension in recipe.items():
+        labels = clp_labels if name == "matrix" else dataset.coords[clp_dimension].values
+        dataset[name] = lazy_variable(
+            (global_dimension, model_dimension, clp_dimension),
+            (global_axis.size, model_axis.size, labels.size),
+            np.float64,
+            lambda labels=labels: calculate_selection(labels),
+        )
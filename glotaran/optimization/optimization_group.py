@@ -19,8 +19,11 @@ from glotaran.optimization.matrix_provider import MatrixProviderLinked
 from glotaran.optimization.matrix_provider import MatrixProviderUnlinked
 from glotaran.parameter import Parameters
 from glotaran.project import Scheme
+from glotaran.utils.lazy_variable import lazy_variable
+from glotaran.utils.tracing import trace_span
 
 if TYPE_CHECKING:
+    from glotaran.io.prepare_dataset import SvdMethod
     from glotaran.typing.types import ArrayLike
 
 
@@ -45,6 +48,10 @@ class OptimizationGroup:
         self._dataset_group.set_parameters(scheme.parameters)
         self._data = scheme.data
         self._add_svd = scheme.add_svd
+        self._svd_options = {
+            "method": scheme.svd_method,
+            "number_of_components": scheme.svd_components,
+        }
         link_clp = dataset_group.link_clp
         if link_clp is None:
             link_clp = dataset_group.is_linkable(scheme.parameters, scheme.data)
@@ -69,13 +76,8 @@ class OptimizationGroup:
         self._estimation_provider: EstimationProvider = estimation_provider
 
         if self._add_svd:
-            for dataset in self._data.values():
-                self.add_svd_data(
-                    "data",
-                    dataset,
-                    dataset.data.dims[0],
-                    dataset.data.dims[1],
-                )
+            for label in self._dataset_group.dataset_models:
+                self.add_data_svd(label)
 
     def calculate(self, parameters: Parameters):
         """Calculate the optimization group data.
@@ -85,9 +87,13 @@ class OptimizationGroup:
         parameters : Parameters
             The parameters.
         """
-        self._dataset_group.set_parameters(parameters)
-        self._matrix_provider.calculate()
-        self._estimation_provider.estimate()
+        with trace_span(
+            "OptimizationGroup.calculate", datasets=list(self._dataset_group.dataset_models)
+        ):
+            with trace_span("DatasetGroup.set_parameters"):
+                self._dataset_group.set_parameters(parameters)
+            self._matrix_provider.calculate()
+            self._estimation_provider.estimate()
 
     def get_additional_penalties(self) -> list[float]:
         """Get additional penalties.
@@ -129,9 +135,15 @@ class OptimizationGroup:
                 weight = weight.T
             result_dataset["weight"] = (result_dataset.data.dims, weight)
 
-    def create_result_data(self) -> dict[str, xr.Dataset]:
+    def create_result_data(self, lazy: bool = False) -> dict[str, xr.Dataset]:
         """Create resulting datasets.
 
+        Parameters
+        ----------
+        lazy : bool
+            Calculate the fitted data and the SVDs of the residuals on first access
+            instead of immediately.
+
         Returns
         -------
         dict[str, xr.Dataset]
@@ -163,10 +175,25 @@ class OptimizationGroup:
             result_dataset["clp"] = clps[label]
 
             if self._add_svd:
-                self.add_svd_data("residual", result_dataset, model_dimension, global_dimension)
+                self.add_svd_data(
+                    "residual",
+                    result_dataset,
+                    model_dimension,
+                    global_dimension,
+                    lazy=lazy,
+                    # The SVDs of residuals are unique to a fit and not worth caching
+                    use_cache=False,
+                    **self._svd_options,
+                )
                 if "weighted_residual" in result_dataset:
                     self.add_svd_data(
-                        "weighted_residual", result_dataset, model_dimension, global_dimension
+                        "weighted_residual",
+                        result_dataset,
+                        model_dimension,
+                        global_dimension,
+                        lazy=lazy,
+                        use_cache=False,
+                        **self._svd_options,
                     )
 
             # Calculate RMS
@@ -188,14 +215,62 @@ class OptimizationGroup:
             )
 
             # reconstruct fitted data
-            result_dataset["fitted_data"] = result_dataset.data - result_dataset.residual
+            if lazy:
+                result_dataset["fitted_data"] = self.create_lazy_fitted_data(
+                    result_dataset.data, result_dataset.residual
+                )
+            else:
+                result_dataset["fitted_data"] = result_dataset.data - result_dataset.residual
 
             finalize_dataset_model(dataset_model, result_dataset)
 
         return result_datasets
 
+    def add_data_svd(self, label: str):
+        """Add the SVD of the data to a dataset of the group.
+
+        The SVD of unweighted data is calculated from the copy of the data provider, so
+        data which are not loaded into memory (e.g. from ``load_dataset(file_name,
+        lazy=True)``) are not read again. Weighted data are read from the dataset, use
+        ``Scheme(..., add_svd=False)`` to avoid this second copy.
+
+        Parameters
+        ----------
+        label : str
+            The label of the dataset.
+        """
+        dataset = self._data[label]
+        data_array = dataset.data
+        if self._data_provider.get_weight(label) is None:
+            data_array = xr.DataArray(
+                self._data_provider.get_data(label),
+                dims=(
+                    self._data_provider.get_model_dimension(label),
+                    self._data_provider.get_global_dimension(label),
+                ),
+            ).transpose(*data_array.dims)
+        self.add_svd_data(
+            "data",
+            dataset,
+            dataset.data.dims[0],
+            dataset.data.dims[1],
+            data_array=data_array,
+            **self._svd_options,
+        )
+
     @staticmethod
-    def add_svd_data(name: str, dataset: xr.Dataset, lsv_dim: str, rsv_dim: str):
+    def add_svd_data(
+        name: str,
+        dataset: xr.Dataset,
+        lsv_dim: str,
+        rsv_dim: str,
+        *,
+        data_array: xr.DataArray | None = None,
+        method: SvdMethod = "full",
+        number_of_components: int | None = None,
+        lazy: bool = False,
+        use_cache: bool = True,
+    ):
         """Add the SVD of a data matrix to a dataset.
 
         Parameters
@@ -208,9 +283,50 @@ class OptimizationGroup:
             The dimension name of the left singular vectors.
         rsv_dim : str
             The dimension name of the right singular vectors.
+        data_array : xr.DataArray | None
+            The data matrix to decompose instead of ``dataset[name]``. Defaults to None.
+        method : SvdMethod
+            The method to calculate the SVD with.
+        number_of_components : int | None
+            The number of singular values to calculate.
+        lazy : bool
+            Calculate the SVD on first access instead of immediately.
+        use_cache : bool
+            Whether to use the SVD cache.
         """
         add_svd_to_dataset(
-            dataset, name=name, lsv_dim=lsv_dim, rsv_dim=rsv_dim, data_array=dataset[name]
+            dataset,
+            name=name,
+            lsv_dim=lsv_dim,
+            rsv_dim=rsv_dim,
+            data_array=dataset[name] if data_array is None else data_array,
+            method=method,
+            number_of_components=number_of_components,
+            lazy=lazy,
+            use_cache=use_cache,
+        )
+
+    @staticmethod
+    def create_lazy_fitted_data(data: xr.DataArray, residual: xr.DataArray) -> xr.Variable:
+        """Create the fitted data variable, which is calculated on first access.
+
+        Parameters
+        ----------
+        data : xr.DataArray
+            The data.
+        residual : xr.DataArray
+            The (unweighted) residual.
+
+        Returns
+        -------
+        xr.Variable
+            The lazy fitted data with the dimensions of the data.
+        """
+        return lazy_variable(
+            data.dims,
+            data.shape,
+            np.result_type(data.dtype, residual.dtype),
+            lambda: (data - residual).transpose(*data.dims).values,
         )
 
     @property
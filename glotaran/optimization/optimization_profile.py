@@ -0,0 +1,142 @@
+"""Module containing the ``OptimizationProfile`` class."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pandas as pd
+
+from glotaran.utils.profiling import PROFILE_COLUMNS
+
+if TYPE_CHECKING:
+    from glotaran.typing import StrOrPath
+    from glotaran.utils.profiling import StageProfiler
+
+
+class OptimizationProfile:
+    """Wrapped DataFrame with the time spent in the stages of an optimization.
+
+    Each row holds the number of calls, the accumulated wall time in seconds and the peak
+    allocated bytes of a stage for a dataset. Rows for a whole dataset group have an empty
+    dataset label.
+    """
+
+    def __init__(self, data=None, source_path: StrOrPath | None = None) -> None:
+        """Ensure DataFrame has the correct columns."""
+        self._df = pd.DataFrame(data, columns=PROFILE_COLUMNS)
+        self._df["dataset"] = self._df["dataset"].fillna("").astype(str)
+        if source_path is not None:
+            self.source_path = Path(source_path).as_posix()
+        else:
+            self.source_path = "optimization_profile.csv"
+
+    def __getattr__(self, attr: str) -> Any:
+        """Access class attribute and fallback to DataFrame attribute if not present.
+
+        Parameters
+        ----------
+        attr: str
+            Name of the attribute to access.
+
+        Returns
+        -------
+        Any
+            Attribute of ``OptimizationProfile`` or the DataFrame
+        """
+        if attr in self.__dict__:
+            return getattr(self, attr)
+        return getattr(self.data, attr)
+
+    def __getitem__(self, column: str) -> pd.Series:
+        """Access DataFrame instead of class items.
+
+        Parameters
+        ----------
+        column: str
+            Name of the column to access.
+
+        Returns
+        -------
+        pd.Series
+            Column of the DataFrame.
+        """
+        return self.data[column]
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Underlying ``DataFrame`` which allows for autocomplete with static analyzers.
+
+        Returns
+        -------
+        pd.DataFrame
+            ``DataFrame`` containing ``OptimizationProfile`` data.
+        """
+        return self._df
+
+    def by_stage(self) -> pd.DataFrame:
+        """Aggregate the profile over all datasets.
+
+        Returns
+        -------
+        pd.DataFrame
+            Calls, wall time and peak allocated bytes per stage, sorted by wall time.
+        """
+        return (
+            self.data.groupby("stage")
+            .agg(
+                calls=("calls", "sum"),
+                wall_time=("wall_time", "sum"),
+                allocated_bytes=("allocated_bytes", "max"),
+            )
+            .sort_values("wall_time", ascending=False)
+        )
+
+    @classmethod
+    def from_profiler(
+        cls: type[OptimizationProfile], profiler: StageProfiler
+    ) -> OptimizationProfile:
+        """Create ``OptimizationProfile`` instance from the records of a ``profiler``.
+
+        Parameters
+        ----------
+        profiler: StageProfiler
+            Profiler which recorded the optimization.
+
+        Returns
+        -------
+        OptimizationProfile
+            ``OptimizationProfile`` instance with the records of the profiler.
+        """
+        return cls(profiler.to_dataframe())
+
+    @classmethod
+    def from_csv(cls: type[OptimizationProfile], path: StrOrPath) -> OptimizationProfile:
+        """Read ``OptimizationProfile`` from file.
+
+        Parameters
+        ----------
+        path : StrOrPath
+            The path to the csv file.
+
+        Returns
+        -------
+        OptimizationProfile
+            ``OptimizationProfile`` read from file.
+        """
+        return cls(pd.read_csv(path, keep_default_na=False), source_path=Path(path).as_posix())
+
+    loader = from_csv
+
+    def to_csv(self, path: StrOrPath, delimiter: str = ","):
+        """Write a ``OptimizationProfile`` to a CSV file and set ``source_path``.
+
+        Parameters
+        ----------
+        path : StrOrPath
+            The path to the CSV file.
+        delimiter : str
+            The delimiter of the CSV file.
+        """
+        self.source_path = Path(path).as_posix()
+        self.data.to_csv(path, sep=delimiter, index=False)
@@ -6,7 +6,14 @@ from glotaran.project import Result
 from glotaran.project import Scheme
 
 
-def optimize(scheme: Scheme, verbose: bool = True, raise_exception: bool = False) -> Result:
+def optimize(
+    scheme: Scheme,
+    verbose: bool = True,
+    raise_exception: bool = False,
+    profile: bool = False,
+    profile_memory: bool = False,
+    lazy_result_data: bool = False,
+) -> Result:
     """Optimize a scheme.
 
     Parameters
@@ -17,12 +24,25 @@ def optimize(scheme: Scheme, verbose: bool = True, raise_exception: bool = False
         Deactivate printing of logs if `False`.
     raise_exception : bool
         Raise exceptions during optimizations instead of gracefully exiting if `True`.
+    profile : bool
+        Record the time spent in the stages of the optimization in
+        :attr:`Result.profile` if `True`.
+    profile_memory : bool
+        Additionally record the memory allocated in the stages if `True`.
+        This slows down the optimization considerably.
+    lazy_result_data : bool
+        Calculate the fitted data and the SVDs of the residuals of the result data on
+        first access (e.g. when plotting or saving the result) if `True`. Results which
+        are only inspected for parameters and errors are created faster and with less
+        memory.
 
     Returns
     -------
     Result
         The result of the optimization.
     """
-    optimizer = Optimizer(scheme, verbose, raise_exception)
+    optimizer = Optimizer(
+        scheme, verbose, raise_exception, profile, profile_memory, lazy_result_data
+    )
     optimizer.optimize()
     return optimizer.create_result()
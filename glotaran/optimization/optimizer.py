@@ -1,6 +1,8 @@
 """Module containing the optimizer class."""
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 from warnings import warn
 
@@ -11,12 +13,15 @@ from scipy.optimize import least_squares
 from glotaran import __version__ as glotaran_version
 from glotaran.optimization.optimization_group import OptimizationGroup
 from glotaran.optimization.optimization_history import OptimizationHistory
+from glotaran.optimization.optimization_profile import OptimizationProfile
 from glotaran.parameter import ParameterHistory
 from glotaran.parameter.parameter import _log_value
 from glotaran.project import Result
 from glotaran.project import Scheme
+from glotaran.utils.profiling import StageProfiler
 from glotaran.utils.regex import RegexPattern
 from glotaran.utils.tee import TeeContext
+from glotaran.utils.tracing import trace_span
 
 if TYPE_CHECKING:
     from glotaran.typing.types import ArrayLike
@@ -78,7 +83,15 @@ class UnsupportedMethodError(ValueError):
 class Optimizer:
     """A class to optimize a scheme."""
 
-    def __init__(self, scheme: Scheme, verbose: bool = True, raise_exception: bool = False):
+    def __init__(
+        self,
+        scheme: Scheme,
+        verbose: bool = True,
+        raise_exception: bool = False,
+        profile: bool = False,
+        profile_memory: bool = False,
+        lazy_result_data: bool = False,
+    ):
         """Initialize an optimization group for a dataset group.
 
         Parameters
@@ -89,6 +102,14 @@ class Optimizer:
             Deactivate printing of logs if `False`.
         raise_exception : bool
             Raise exceptions during optimizations instead of gracefully exiting if `True`.
+        profile : bool
+            Record the time spent in the stages of the optimization if `True`.
+        profile_memory : bool
+            Additionally record the memory allocated in the stages if `True`.
+            This slows down the optimization considerably.
+        lazy_result_data : bool
+            Calculate derived variables of the result data (fitted data and SVDs of the
+            residuals) on first access if `True`.
 
         Raises
         ------
@@ -114,6 +135,10 @@ class Optimizer:
         self._tee = TeeContext()
         self._verbose = verbose
         self._raise = raise_exception
+        self._lazy_result_data = lazy_result_data
+        self._profiler = (
+            StageProfiler(track_memory=profile_memory) if profile or profile_memory else None
+        )
 
         self._optimization_result: OptimizeResult = None
         self._termination_reason = ""
@@ -140,20 +165,21 @@ class Optimizer:
             lower_bounds,
             upper_bounds,
         ) = self._scheme.parameters.get_label_value_and_bounds_arrays(exclude_non_vary=True)
-        with self._tee:
+        with self._tee, self.activate_profiler():
             try:
                 verbose = 2 if self._verbose else 0
-                self._optimization_result = least_squares(
-                    self.objective_function,
-                    initial_parameter,
-                    bounds=(lower_bounds, upper_bounds),
-                    method=self._method,
-                    max_nfev=self._scheme.maximum_number_function_evaluations,
-                    verbose=verbose,
-                    ftol=self._scheme.ftol,
-                    gtol=self._scheme.gtol,
-                    xtol=self._scheme.xtol,
-                )
+                with trace_span("Optimizer.optimize", method=self._method):
+                    self._optimization_result = least_squares(
+                        self.objective_function,
+                        initial_parameter,
+                        bounds=(lower_bounds, upper_bounds),
+                        method=self._method,
+                        max_nfev=self._scheme.maximum_number_function_evaluations,
+                        verbose=verbose,
+                        ftol=self._scheme.ftol,
+                        gtol=self._scheme.gtol,
+                        xtol=self._scheme.xtol,
+                    )
                 self._termination_reason = self._optimization_result.message
             except Exception as e:
                 if self._raise:
@@ -174,8 +200,11 @@ class Optimizer:
         ArrayLike
             The objective for the optimizer.
         """
-        self._parameters.set_from_label_and_value_arrays(self._free_parameter_labels, parameters)
-        return self.calculate_penalty()
+        with trace_span("Optimizer.objective_function"):
+            self._parameters.set_from_label_and_value_arrays(
+                self._free_parameter_labels, parameters
+            )
+            return self.calculate_penalty()
 
     def calculate_penalty(self) -> ArrayLike:
         """Calculate the penalty of the scheme.
@@ -195,9 +224,33 @@ class Optimizer:
 
         return np.concatenate(penalties) if len(penalties) != 1 else penalties[0]
 
+    def activate_profiler(self) -> AbstractContextManager:
+        """Activate the profiler of the optimizer, if profiling is enabled.
+
+        Returns
+        -------
+        AbstractContextManager
+            Context manager in which the profiler is active.
+        """
+        return nullcontext() if self._profiler is None else self._profiler.activate()
+
     def create_result(self) -> Result:
         """Create the result of the optimization.
 
+        Returns
+        -------
+        Result
+            The result of the optimization.
+        """
+        with self.activate_profiler(), trace_span("Optimizer.create_result"):
+            result = self._create_result()
+        if self._profiler is not None:
+            result.profile = OptimizationProfile.from_profiler(self._profiler)
+        return result
+
+    def _create_result(self) -> Result:
+        """Create the result of the optimization without profiling it.
+
         Returns
         -------
         Result
@@ -265,14 +318,14 @@ class Optimizer:
         ]
 
         full_penalty = self.calculate_penalty()
-        result_args["cost"] = 0.5 * np.dot(full_penalty, full_penalty)
+        result_args["cost"] = float(0.5 * np.dot(full_penalty, full_penalty))
 
         result_args["optimized_parameters"] = self._parameters
 
         result_args["data"] = {}
         for group in self._optimization_groups:
             group.calculate(self._parameters)
-            result_args["data"].update(group.create_result_data())
+            result_args["data"].update(group.create_result_data(lazy=self._lazy_result_data))
 
         return Result(**result_args)
 
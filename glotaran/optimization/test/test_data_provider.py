@@ -1,7 +1,11 @@
+from pathlib import Path
+
 import numpy as np
 import pytest
 import xarray as xr
 
+from glotaran.io import load_dataset
+from glotaran.io import save_dataset
 from glotaran.model import DatasetGroup
 from glotaran.optimization.data_provider import DataProvider
 from glotaran.optimization.data_provider import DataProviderLinked
@@ -87,6 +91,28 @@ def test_data_provider(
     assert np.array_equal(dataset_two.coords["model"], data_provider.get_model_axis("dataset2"))
     assert np.array_equal(dataset_two.coords["global"], data_provider.get_global_axis("dataset2"))
 
+    for label, dataset in scheme.data.items():
+        assert data_provider.get_data(label).flags.f_contiguous
+        assert not np.shares_memory(data_provider.get_data(label), dataset.data.values)
+
+
+def test_data_provider_lazy_dataset(
+    tmp_path: Path, dataset_one: xr.Dataset, scheme: Scheme, dataset_group: DatasetGroup
+):
+    save_dataset(dataset_one, tmp_path / "dataset1.nc")
+    scheme.data["dataset1"] = load_dataset(tmp_path / "dataset1.nc", lazy=True)
+
+    data_provider = DataProvider(scheme, dataset_group)
+
+    lazy_data = scheme.data["dataset1"].data
+    assert not np.shares_memory(lazy_data.values, lazy_data.values)
+    assert np.array_equal(
+        dataset_one.data * dataset_one.weight, data_provider.get_data("dataset1")
+    )
+    assert np.array_equal(dataset_one.weight, data_provider.get_weight("dataset1"))
+    assert data_provider.get_data("dataset1").flags.f_contiguous
+    scheme.data["dataset1"].close()
+
 
 def test_data_provider_linked(
     dataset_one: xr.Dataset, dataset_two: xr.Dataset, scheme: Scheme, dataset_group: DatasetGroup
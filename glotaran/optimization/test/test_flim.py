@@ -0,0 +1,132 @@
+"""Tests for ``glotaran.optimization.flim``."""
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from glotaran.io import load_model
+from glotaran.io import load_parameters
+from glotaran.optimization.flim import optimize_flim
+from glotaran.optimization.optimizer import UnsupportedMethodError
+from glotaran.project import Scheme
+from glotaran.simulation import simulate
+
+MODEL = """
+default_megacomplex: decay-parallel
+megacomplex:
+  mc:
+    compartments: [s1, s2]
+    rates: [rates.1, rates.2]
+irf:
+  irf1:
+    type: gaussian
+    center: irf.center
+    width: irf.width
+dataset:
+  flim:
+    megacomplex: [mc]
+    irf: irf1
+"""
+
+PARAMETERS = """
+rates: [0.5, 0.1]
+irf:
+  - [center, 1.0, {vary: false}]
+  - [width, 0.2, {vary: false}]
+"""
+
+
+@pytest.fixture(scope="module")
+def flim_scheme() -> tuple[Scheme, np.ndarray]:
+    """Scheme with a simulated 3x4 pixel FLIM image and the simulated amplitudes."""
+    model = load_model(MODEL, format_name="yml_str")
+    parameters = load_parameters(PARAMETERS, format_name="yml_str")
+    x, y = np.meshgrid(np.arange(3), np.arange(4), indexing="ij")
+    amplitudes = np.random.default_rng(0).uniform(10, 100, size=(x.size, 2))
+    time_axis = np.linspace(0, 25, 128)
+    simulated = simulate(
+        model,
+        "flim",
+        parameters,
+        {"time": time_axis, "pixel": np.arange(x.size)},
+        clp=xr.DataArray(
+            amplitudes,
+            coords=[("pixel", np.arange(x.size)), ("clp_label", ["s1", "s2"])],
+        ),
+    )
+    data = xr.DataArray(
+        simulated.data.transpose("time", "pixel").values,
+        coords={
+            "time": time_axis,
+            "pixel": pd.MultiIndex.from_arrays([x.ravel(), y.ravel()], names=["x", "y"]),
+        },
+        dims=("time", "pixel"),
+    )
+    return Scheme(model, parameters, {"flim": data.to_dataset(name="data")}), amplitudes
+
+
+def stacked_amplitudes(result: xr.Dataset) -> np.ndarray:
+    """Amplitudes of a result in the pixel order of the simulated data."""
+    return result.amplitude.stack(pixel=("pixel_x", "pixel_y")).transpose("pixel", ...).values
+
+
+@pytest.mark.parametrize("method", ("variable_projection", "non_negative_least_squares"))
+@pytest.mark.parametrize("batch_size", (5, 4096))
+def test_optimize_flim(flim_scheme: tuple[Scheme, np.ndarray], method: str, batch_size: int):
+    """Amplitudes are recovered in every batch and images are unstacked."""
+    scheme, amplitudes = flim_scheme
+    model = load_model(
+        f"{MODEL}dataset_groups:\n  default:\n    residual_function: {method}\n",
+        format_name="yml_str",
+    )
+    result = optimize_flim(replace(scheme, model=model), batch_size=batch_size)
+
+    assert result.intensity_map.dims == ("pixel_x", "pixel_y")
+    assert result.intensity_map.shape == (3, 4)
+    assert "optimized_parameters" not in result
+    np.testing.assert_allclose(stacked_amplitudes(result), amplitudes, rtol=1e-8)
+    np.testing.assert_allclose(result.chi_square, 0, atol=1e-12)
+    np.testing.assert_allclose(result.lifetime_mc, [2, 10])
+    expected_average_lifetime = (amplitudes @ [2, 10]) / amplitudes.sum(axis=1)
+    np.testing.assert_allclose(
+        result.average_lifetime_mc.stack(pixel=("pixel_x", "pixel_y")), expected_average_lifetime
+    )
+
+
+@pytest.mark.parametrize("number_of_processes", (1, 2))
+def test_optimize_flim_refine(flim_scheme: tuple[Scheme, np.ndarray], number_of_processes: int):
+    """Rates of every pixel are optimized, starting from perturbed parameters."""
+    scheme, amplitudes = flim_scheme
+    parameters = scheme.parameters.copy()
+    parameters.set_from_label_and_value_arrays(["rates.1", "rates.2"], np.array([0.45, 0.12]))
+    result = optimize_flim(
+        replace(scheme, parameters=parameters),
+        batch_size=5,
+        refine=True,
+        number_of_processes=number_of_processes,
+    )
+
+    assert list(result.parameter.values) == ["rates.1", "rates.2"]
+    assert result.optimized_parameters.dims == ("parameter", "pixel_x", "pixel_y")
+    np.testing.assert_allclose(result.optimized_parameters.sel(parameter="rates.1"), 0.5)
+    np.testing.assert_allclose(result.optimized_parameters.sel(parameter="rates.2"), 0.1)
+    np.testing.assert_allclose(stacked_amplitudes(result), amplitudes, rtol=1e-6)
+    np.testing.assert_allclose(result.lifetime_mc.sel(component_mc=1), 2)
+    np.testing.assert_allclose(result.lifetime_mc.sel(component_mc=2), 10)
+
+
+def test_optimize_flim_errors(flim_scheme: tuple[Scheme, np.ndarray]):
+    """Unsupported schemes raise."""
+    scheme, _ = flim_scheme
+
+    with pytest.raises(UnsupportedMethodError):
+        optimize_flim(replace(scheme, optimization_method="Nelder-Mead"))
+
+    weighted_dataset = scheme.data["flim"].copy()
+    weighted_dataset["weight"] = (weighted_dataset.data.dims, np.ones(weighted_dataset.data.shape))
+    with pytest.raises(ValueError, match="Weighted FLIM datasets are not supported."):
+        optimize_flim(replace(scheme, data={"flim": weighted_dataset}))
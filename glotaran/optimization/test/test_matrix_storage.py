@@ -0,0 +1,91 @@
+"""Tests for ``glotaran.optimization.matrix_storage``."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from glotaran.io import SavingOptions
+from glotaran.io import load_result
+from glotaran.io import save_result
+from glotaran.optimization.matrix_storage import compact_index_dependent_matrices
+from glotaran.optimization.matrix_storage import restore_index_dependent_matrices
+from glotaran.optimization.optimize import optimize
+from glotaran.project import Result
+from glotaran.testing.simulated_data.synthetic_scheme import generate_synthetic_scheme
+from glotaran.utils.lazy_variable import is_lazy_variable
+
+
+@pytest.fixture(scope="module")
+def dispersive_result() -> Result:
+    """Result with an index dependent matrix and a damped oscillation."""
+    scheme = generate_synthetic_scheme(
+        time_size=50, spectral_size=20, index_dependent_irf=True, nr_oscillations=1
+    ).scheme
+    scheme.maximum_number_function_evaluations = 1
+    return optimize(scheme, raise_exception=True, verbose=False)
+
+
+def test_compact_index_dependent_matrices(dispersive_result: Result):
+    """Matrices are converted to float32 or dropped without changing the result."""
+    dataset = dispersive_result.data["dataset_1"]
+    attrs = dict(dataset.attrs)
+
+    assert compact_index_dependent_matrices(dataset) is dataset
+
+    float32_dataset = compact_index_dependent_matrices(dataset, "float32")
+    for name in ("matrix", "species_concentration", "damped_oscillation_sin"):
+        assert float32_dataset[name].dtype == np.float32
+    assert float32_dataset.data.dtype == np.float64
+
+    recipe_dataset = compact_index_dependent_matrices(dataset, "recipe")
+    assert "matrix" not in recipe_dataset
+    assert "species_concentration" not in recipe_dataset
+    assert recipe_dataset.damped_oscillation_sin.dtype == np.float32
+    assert recipe_dataset.attrs["matrix_recipe"] == (
+        '{"matrix": "clp_label", "species_concentration": "species"}'
+    )
+
+    assert dataset.attrs == attrs
+    assert dataset.matrix.dtype == np.float64
+
+    restore_index_dependent_matrices(
+        recipe_dataset,
+        "dataset_1",
+        dispersive_result.scheme.model,
+        dispersive_result.optimized_parameters,
+    )
+    assert "matrix_recipe" not in recipe_dataset.attrs
+    assert is_lazy_variable(recipe_dataset.matrix)
+    xr.testing.assert_allclose(recipe_dataset.matrix, dataset.matrix, rtol=1e-12)
+    xr.testing.assert_allclose(
+        recipe_dataset.species_concentration, dataset.species_concentration, rtol=1e-12
+    )
+
+
+def test_compact_index_dependent_matrices_index_independent():
+    """Datasets without index dependent matrices are not changed."""
+    dataset = xr.Dataset({"matrix": (("time", "clp_label"), np.ones((3, 2)))})
+
+    assert compact_index_dependent_matrices(dataset, "recipe") is dataset
+    with pytest.raises(ValueError, match="Unknown matrix format 'float16'"):
+        compact_index_dependent_matrices(dataset, "float16")  # type:ignore[arg-type]
+
+
+def test_save_and_load_result_matrix_recipe(dispersive_result: Result, tmp_path: Path):
+    """Saved recipes are restored on load."""
+    save_result(
+        dispersive_result,
+        tmp_path / "result.yml",
+        saving_options=SavingOptions(matrix_format="recipe"),
+    )
+
+    with xr.open_dataset(tmp_path / "dataset_1.nc") as saved_dataset:
+        assert "matrix" not in saved_dataset
+    loaded_dataset = load_result(tmp_path / "result.yml").data["dataset_1"]
+    assert is_lazy_variable(loaded_dataset.matrix)
+    xr.testing.assert_allclose(
+        loaded_dataset.matrix, dispersive_result.data["dataset_1"].matrix, rtol=1e-12
+    )
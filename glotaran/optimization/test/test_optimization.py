@@ -1,7 +1,13 @@
+import pickle
+
 import numpy as np
 import pytest
 import xarray as xr
 
+from glotaran.io import load_dataset
+from glotaran.io import prepare_dataset
+from glotaran.io import save_dataset
+from glotaran.optimization.optimization_group import OptimizationGroup
 from glotaran.optimization.optimize import optimize
 from glotaran.optimization.test.models import SimpleTestModel
 from glotaran.optimization.test.suites import FullModel
@@ -12,6 +18,7 @@ from glotaran.optimization.test.suites import TwoCompartmentDecay
 from glotaran.parameter import Parameters
 from glotaran.project import Scheme
 from glotaran.simulation import simulate
+from glotaran.utils.lazy_variable import is_lazy_variable
 
 
 @pytest.mark.parametrize("is_index_dependent", [True, False])
@@ -228,3 +235,102 @@ def test_result_data(model_weight: bool, index_dependent: bool):
         assert result_data.matrix.dims == ("global", "model", "clp_label")
     else:
         assert result_data.matrix.dims == ("model", "clp_label")
+
+
+def test_result_data_lazy():
+    """Derived variables are calculated on first access and equal the eager ones."""
+    suite = MultichannelMulticomponentDecay
+    model = suite.model
+    dataset = simulate(
+        suite.sim_model,
+        "dataset1",
+        suite.wanted_parameters,
+        {"global": suite.global_axis, "model": suite.model_axis},
+    )
+    dataset["weight"] = xr.ones_like(dataset.data) * 0.5
+    scheme = Scheme(
+        model,
+        suite.initial_parameters,
+        {"dataset1": dataset},
+        maximum_number_function_evaluations=1,
+    )
+    eager_data = optimize(scheme, raise_exception=True).data["dataset1"]
+    lazy_data = optimize(scheme, raise_exception=True, lazy_result_data=True).data["dataset1"]
+
+    derived_variables = [
+        "fitted_data",
+        *(
+            f"{name}_{variable}"
+            for name in ("residual", "weighted_residual")
+            for variable in ("left_singular_vectors", "singular_values", "right_singular_vectors")
+        ),
+    ]
+    assert {name for name in lazy_data.data_vars if is_lazy_variable(lazy_data[name])} == set(
+        derived_variables
+    )
+    assert not is_lazy_variable(lazy_data.residual)
+    assert lazy_data.attrs == eager_data.attrs
+
+    xr.testing.assert_allclose(pickle.loads(pickle.dumps(lazy_data)), eager_data)
+    xr.testing.assert_allclose(lazy_data, eager_data)
+    assert not any(is_lazy_variable(lazy_data[name]) for name in derived_variables)
+
+
+def test_data_svd_lazy_dataset(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """The SVD of unweighted lazily loaded data doesn't read the data again."""
+    suite = MultichannelMulticomponentDecay
+    dataset = simulate(
+        suite.sim_model,
+        "dataset1",
+        suite.wanted_parameters,
+        {"global": suite.global_axis, "model": suite.model_axis},
+    )
+    save_dataset(dataset, tmp_path / "dataset1.nc")
+    scheme = Scheme(
+        suite.model,
+        suite.initial_parameters,
+        {"dataset1": load_dataset(tmp_path / "dataset1.nc", lazy=True)},
+        maximum_number_function_evaluations=1,
+    )
+    decomposed = []
+
+    def calculate_svd(data, **kwargs):
+        decomposed.append(data)
+        return prepare_dataset_calculate_svd(data, **kwargs)
+
+    prepare_dataset_calculate_svd = prepare_dataset.calculate_svd
+    monkeypatch.setattr(prepare_dataset, "calculate_svd", calculate_svd)
+    optimization_group = OptimizationGroup(scheme, suite.model.get_dataset_groups()["default"])
+
+    assert len(decomposed) == 1
+    assert np.shares_memory(decomposed[0], optimization_group._data_provider.get_data("dataset1"))
+    lazy_data = scheme.data["dataset1"]
+    reconstructed = (
+        lazy_data.data_left_singular_vectors.values * lazy_data.data_singular_values.values
+    ) @ lazy_data.data_right_singular_vectors.values.T
+    np.testing.assert_allclose(reconstructed, dataset.data.values, atol=1e-10)
+    lazy_data.close()
+
+
+def test_residual_svd_not_cached():
+    """Only the SVD of the data is cached, since the residuals are unique to a fit."""
+    suite = MultichannelMulticomponentDecay
+    dataset = simulate(
+        suite.sim_model,
+        "dataset1",
+        suite.wanted_parameters,
+        {"global": suite.global_axis, "model": suite.model_axis},
+    )
+    dataset["weight"] = xr.ones_like(dataset.data) * 0.5
+    scheme = Scheme(
+        suite.model,
+        suite.initial_parameters,
+        {"dataset1": dataset},
+        maximum_number_function_evaluations=1,
+    )
+    prepare_dataset.clear_svd_cache()
+
+    result_data = optimize(scheme, raise_exception=True).data["dataset1"]
+
+    assert "weighted_residual_singular_values" in result_data
+    assert len(prepare_dataset._SVD_CACHE) == 1
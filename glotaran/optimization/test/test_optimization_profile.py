@@ -0,0 +1,47 @@
+"""Tests for ``glotaran.optimization.optimization_profile``."""
+from dataclasses import replace
+from pathlib import Path
+
+from pandas.testing import assert_frame_equal
+
+from glotaran.optimization.optimization_profile import OptimizationProfile
+from glotaran.optimization.optimize import optimize
+from glotaran.testing.simulated_data.sequential_spectral_decay import SCHEME
+from glotaran.utils.profiling import PROFILE_COLUMNS
+
+
+def test_optimization_profile_init_no_data():
+    """Empty DataFrame with correct columns."""
+    profile = OptimizationProfile()
+
+    assert profile.shape == (0, 5)
+    assert list(profile.columns) == PROFILE_COLUMNS
+
+
+def test_optimization_profile_csv_round_trip(tmp_path: Path):
+    """Save and reloaded profile is the same, including empty dataset labels."""
+    profile = OptimizationProfile([["stage", "", 2, 0.5, 0], ["stage", "dataset_1", 2, 0.25, 100]])
+    profile.to_csv(tmp_path / "profile.csv")
+
+    assert profile.source_path == (tmp_path / "profile.csv").as_posix()
+    assert_frame_equal(OptimizationProfile.from_csv(tmp_path / "profile.csv").data, profile.data)
+
+
+def test_optimize_profile():
+    """Profile is only created if profiling is enabled."""
+    scheme = replace(SCHEME, maximum_number_function_evaluations=1)
+
+    assert optimize(scheme, raise_exception=True).profile is None
+
+    profile = optimize(scheme, raise_exception=True, profile=True).profile
+    assert isinstance(profile, OptimizationProfile)
+    stages = set(profile["stage"])
+    assert {
+        "OptimizationGroup.calculate",
+        "MatrixProvider.calculate",
+        "EstimationProvider.estimate",
+        "Parameters.set_from_label_and_value_arrays",
+        "Optimizer.create_result",
+    } <= stages
+    assert "dataset_1" in set(profile["dataset"])
+    assert profile.by_stage().loc["Optimizer.create_result", "calls"] == 1
@@ -5,13 +5,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
 from glotaran.parameter.parameters import Parameters
 
 if TYPE_CHECKING:
     from os import PathLike
 
+    import pandas as pd
+
 
 class ParameterHistory:
     """A class representing a history of parameters."""
@@ -58,6 +59,8 @@ class ParameterHistory:
         ParameterHistory
             The created history.
         """
+        import pandas as pd
+
         df = pd.read_csv(path)
         return cls.from_dataframe(df)
 
@@ -108,6 +111,8 @@ class ParameterHistory:
         pd.DataFrame
             The created data frame.
         """
+        import pandas as pd
+
         return pd.DataFrame(self._parameters, columns=self.parameter_labels)
 
     def to_csv(self, file_name: str | PathLike[str], delimiter: str = ","):
@@ -8,15 +8,16 @@ from typing import Any
 
 import asteval
 import numpy as np
-import pandas as pd
-from tabulate import tabulate
 
 from glotaran.io import load_parameters
 from glotaran.parameter.parameter import Parameter
 from glotaran.utils.ipython import MarkdownStr
 from glotaran.utils.sanitize import pretty_format_numerical
+from glotaran.utils.tracing import trace_span
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from glotaran.parameter.parameter_history import ParameterHistory
 
 
@@ -184,6 +185,8 @@ class Parameters:
         pd.DataFrame
             The created data frame.
         """
+        import pandas as pd
+
         return pd.DataFrame(self.to_parameter_dict_list())
 
     def to_parameter_dict_list(self) -> list[dict[str, Any]]:
@@ -377,10 +380,11 @@ class Parameters:
                 f"Length of labels({len(labels)}) not equal to length of values({len(values)})."
             )
 
-        for label, value in zip(labels, values):
-            self.get(label).set_value_from_optimization(value)
+        with trace_span("Parameters.set_from_label_and_value_arrays"):
+            for label, value in zip(labels, values):
+                self.get(label).set_value_from_optimization(value)
 
-        self.update_parameter_expression()
+            self.update_parameter_expression()
 
     def markdown(self, float_format: str = ".3e") -> MarkdownStr:
         """Format the :class:`ParameterGroup` as markdown string.
@@ -501,6 +505,8 @@ def param_dict_to_markdown(
     MarkdownStr :
         The markdown representation as string.
     """
+    from tabulate import tabulate
+
     node_indentation = "  " * depth
     return_string = ""
     table_header = [
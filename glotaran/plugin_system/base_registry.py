@@ -3,12 +3,20 @@
 Since this module is imported at the root ``__init__.py`` file all other
 glotaran imports should be used for typechecking only in the 'if TYPE_CHECKING' block.
 This is to prevent issues with circular imports.
+
+Plugins are loaded lazily, the entry points are only imported on the first lookup of a
+plugin. Which entry point provides which registry keys is recorded in a metadata cache,
+so that a lookup only imports the entry point providing the key.
 """
 from __future__ import annotations
 
+import json
 import os
 from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import MutableMapping
 from importlib import metadata
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import cast
 from warnings import warn
@@ -16,7 +24,6 @@ from warnings import warn
 if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Generator
-    from collections.abc import MutableMapping
     from collections.abc import Sequence
     from typing import Any
     from typing import TypeVar
@@ -33,15 +40,103 @@ if TYPE_CHECKING:
     GenericPluginInstance = TypeVar("GenericPluginInstance", bound=object)
 
 
+PLUGIN_ENTRY_POINT_PREFIX = "glotaran.plugins"
+"""Prefix of the entry point groups of glotaran plugins."""
+
+PLUGIN_CACHE_VERSION = 1
+"""Version of the plugin metadata cache format, a different version invalidates the cache."""
+
+
+class LazyPluginRegistry(MutableMapping):
+    """Plugin registry which loads the plugin entry points on demand.
+
+    Looking up a key which isn't registered yet, loads the entry point providing it.
+    Iterating over the registry loads all plugins.
+    """
+
+    def __init__(self, name: str):
+        """Initialize an empty registry.
+
+        Parameters
+        ----------
+        name: str
+            Name of the registry, which is used as key in the plugin metadata cache.
+        """
+        self.name = name
+        self.loaded: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a plugin, loading the entry point providing it if needed."""
+        if key not in self.loaded:
+            load_plugins_providing(self.name, key)
+        return self.loaded[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a plugin, loading the entry point providing it if needed."""
+        if key not in self.loaded and isinstance(key, str):
+            load_plugins_providing(self.name, key)
+        return key in self.loaded
+
+    def __setitem__(self, key: str, plugin: Any):
+        """Add a plugin without loading any entry points."""
+        self.loaded[key] = plugin
+
+    def __delitem__(self, key: str):
+        """Remove a plugin without loading any entry points."""
+        del self.loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of all plugins."""
+        load_plugins()
+        return iter(self.loaded)
+
+    def __len__(self) -> int:
+        """Number of keys of all plugins."""
+        load_plugins()
+        return len(self.loaded)
+
+
 class __PluginRegistry:
     """Central Plugin Registry.
 
     This is super private since if anyone messes with it, the pluginsystem could break.
     """
 
-    megacomplex: MutableMapping[str, type[Megacomplex]] = {}
-    data_io: MutableMapping[str, DataIoInterface] = {}
-    project_io: MutableMapping[str, ProjectIoInterface] = {}
+    megacomplex: MutableMapping[str, type[Megacomplex]] = LazyPluginRegistry("megacomplex")
+    data_io: MutableMapping[str, DataIoInterface] = LazyPluginRegistry("data_io")
+    project_io: MutableMapping[str, ProjectIoInterface] = LazyPluginRegistry("project_io")
+
+
+PLUGIN_REGISTRY_NAMES = ("megacomplex", "data_io", "project_io")
+"""Names of the registries in the central plugin registry."""
+
+
+class __PluginLoadingState:
+    """State of the lazy plugin loading."""
+
+    entry_points: list[metadata.EntryPoint] | None = None
+    loaded_entry_points: set[str] = set()
+    loading_entry_points: int = 0
+    all_loaded: bool = False
+    cache: dict[str, Any] | None = None
+
+
+def loaded_plugins(plugin_registry: MutableMapping[str, _PluginType]) -> MutableMapping:
+    """Plugins of a registry which are registered already, without loading any entry points.
+
+    Parameters
+    ----------
+    plugin_registry : MutableMapping[str, _PluginType]
+        Registry to get the loaded plugins from.
+
+    Returns
+    -------
+    MutableMapping
+        The loaded plugins.
+    """
+    if isinstance(plugin_registry, LazyPluginRegistry):
+        return plugin_registry.loaded
+    return plugin_registry
 
 
 def full_plugin_name(plugin: object | type[object]) -> str:
@@ -108,6 +203,119 @@ class PluginOverwriteWarning(UserWarning):
         super().__init__(message, *args)
 
 
+def plugin_cache_path() -> Path:
+    """Path of the plugin metadata cache file.
+
+    The path can be set with the environment variable ``GLOTARAN_PLUGIN_CACHE``,
+    setting it to an empty string deactivates the cache.
+
+    Returns
+    -------
+    Path
+        Path of the cache file.
+    """
+    if "GLOTARAN_PLUGIN_CACHE" in os.environ:
+        return Path(os.environ["GLOTARAN_PLUGIN_CACHE"])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "glotaran" / "plugin_cache.json"
+
+
+def plugin_entry_points() -> list[metadata.EntryPoint]:
+    """Entry points of all groups starting with ``PLUGIN_ENTRY_POINT_PREFIX``.
+
+    Returns
+    -------
+    list[metadata.EntryPoint]
+        The plugin entry points.
+    """
+    if __PluginLoadingState.entry_points is None:
+        entry_points = metadata.entry_points()
+        __PluginLoadingState.entry_points = [
+            entry_point
+            for group in sorted(entry_points.groups)
+            if group.startswith(PLUGIN_ENTRY_POINT_PREFIX)
+            for entry_point in entry_points.select(group=group)
+        ]
+    return __PluginLoadingState.entry_points
+
+
+def _entry_point_metadata(entry_point: metadata.EntryPoint) -> dict[str, Any]:
+    """Identifying metadata of an entry point and the distribution providing it."""
+    distribution = getattr(entry_point, "dist", None)
+    return {
+        "group": entry_point.group,
+        "name": entry_point.name,
+        "value": entry_point.value,
+        "distribution": None if distribution is None else distribution.name,
+        "version": None if distribution is None else distribution.version,
+    }
+
+
+def _load_entry_point(entry_point: metadata.EntryPoint):
+    """Load an entry point if it wasn't loaded before."""
+    entry_point_id = f"{entry_point.group}:{entry_point.name}:{entry_point.value}"
+    if entry_point_id not in __PluginLoadingState.loaded_entry_points:
+        __PluginLoadingState.loaded_entry_points.add(entry_point_id)
+        __PluginLoadingState.loading_entry_points += 1
+        try:
+            entry_point.load()
+        finally:
+            __PluginLoadingState.loading_entry_points -= 1
+
+
+def read_plugin_cache() -> dict[str, Any] | None:
+    """Read the plugin metadata cache if it matches the installed entry points.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The cache or ``None`` if there is no valid cache.
+    """
+    if __PluginLoadingState.cache is None:
+        try:
+            cache = json.loads(plugin_cache_path().read_text())
+        except (OSError, ValueError):
+            return None
+        entry_points = [_entry_point_metadata(ep) for ep in plugin_entry_points()]
+        if (
+            cache.get("version") == PLUGIN_CACHE_VERSION
+            and [entry["metadata"] for entry in cache.get("entry_points", [])] == entry_points
+        ):
+            __PluginLoadingState.cache = cache
+    return __PluginLoadingState.cache
+
+
+def write_plugin_cache():
+    """Record which registry keys each plugin entry point provides.
+
+    A key is attributed to the entry point whose module contains the module
+    the plugin is defined in. Failing to write the cache is silently ignored.
+    """
+    entry_points = []
+    for entry_point in plugin_entry_points():
+        module = entry_point.value.partition(":")[0]
+        keys = {
+            name: sorted(
+                key
+                for key, plugin in loaded_plugins(registry).items()
+                if f"{full_plugin_name(plugin)}.".startswith(f"{module}.")
+            )
+            for name in PLUGIN_REGISTRY_NAMES
+            if isinstance(registry := getattr(__PluginRegistry, name), MutableMapping)
+        }
+        entry_points.append({"metadata": _entry_point_metadata(entry_point), "keys": keys})
+    cache = {"version": PLUGIN_CACHE_VERSION, "entry_points": entry_points}
+    __PluginLoadingState.cache = cache
+    path = plugin_cache_path()
+    if path.name == "":
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2))
+    except OSError:
+        pass
+
+
 def load_plugins():
     """Initialize plugins registered under the entrypoint 'glotaran.plugins'.
 
@@ -119,12 +327,41 @@ def load_plugins():
     - ``glotaran.plugins.data_io``
     - ``glotaran.plugins.megacomplex``
     - ``glotaran.plugins.project_io``
+
+    This is called lazily by the first iteration over a plugin registry or the
+    lookup of a key no entry point is known to provide.
+    After loading all plugins the plugin metadata cache is updated.
+    """
+    if "DEACTIVATE_GTA_PLUGINS" in os.environ or __PluginLoadingState.all_loaded:
+        return
+    __PluginLoadingState.all_loaded = True
+    for entry_point in plugin_entry_points():
+        _load_entry_point(entry_point)
+    write_plugin_cache()
+
+
+def load_plugins_providing(registry_name: str, plugin_register_key: str):
+    """Load the entry points providing ``plugin_register_key`` for a registry.
+
+    If the plugin metadata cache doesn't know an entry point providing the key,
+    all plugins are loaded.
+
+    Parameters
+    ----------
+    registry_name : str
+        Name of the registry, e.g. 'megacomplex'.
+    plugin_register_key : str
+        Key of the plugin in the registry.
     """
-    if "DEACTIVATE_GTA_PLUGINS" not in os.environ:  # pragma: no branch
-        for entry_point_name, entry_points in metadata.entry_points().items():
-            if entry_point_name.startswith("glotaran.plugins"):
-                for entry_point in entry_points:
-                    entry_point.load()
+    if "DEACTIVATE_GTA_PLUGINS" in os.environ or __PluginLoadingState.all_loaded:
+        return
+    if (cache := read_plugin_cache()) is not None:
+        for entry_point, entry in zip(plugin_entry_points(), cache["entry_points"]):
+            if plugin_register_key in entry["keys"].get(registry_name, []):
+                _load_entry_point(entry_point)
+        if plugin_register_key in loaded_plugins(getattr(__PluginRegistry, registry_name)):
+            return
+    load_plugins()
 
 
 def set_plugin(
@@ -191,6 +428,8 @@ def add_plugin_to_registry(
 
     In addition it also adds the plugin with it full import path name as key,
     which allows for a better reproducibility in case there are conflicting plugins.
+    Plugins of entry points which provide ``plugin_register_key`` are loaded before checking
+    for conflicts, so they keep their key regardless of the order the plugins are added in.
 
     Parameters
     ----------
@@ -221,7 +460,14 @@ def add_plugin_to_registry(
             "The character '.' isn't allowed in the name of a plugin, "
             f"you provided the name {plugin_register_key!r}."
         )
-    if plugin_register_key in plugin_registry:
+    # Plugins added by other means than loading an entry point (e.g. a user defined
+    # megacomplex) must not take the key of a not yet loaded entry point plugin.
+    known_plugins = (
+        loaded_plugins(plugin_registry)
+        if __PluginLoadingState.loading_entry_points
+        else plugin_registry
+    )
+    if plugin_register_key in known_plugins:
         old_key = plugin_register_key
         plugin_register_key = full_plugin_name(plugin)
         if full_plugin_name(plugin_registry[old_key]) != full_plugin_name(plugin):
@@ -14,6 +14,9 @@ from typing import cast
 
 DecoratedFunc = TypeVar("DecoratedFunc", bound=Callable[..., Any])  # decorated function
 
+FOLDER_FILE_FORMATS = ("zarr",)
+"""File formats which are stored as folders rather than single files."""
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
@@ -33,6 +36,7 @@ def infer_file_format(
     needs_to_exist : bool
         Whether or not a file need to exists for an successful format inferring.
         While write functions don't need the file to exists, load functions do.
+        Folders are only accepted for formats in ``FOLDER_FILE_FORMATS`` (e.g. ``zarr``).
     allow_folder: bool
         Whether or not to allow the format to be ``folder``.
         This is only used in ``save_result``.
@@ -49,10 +53,16 @@ def infer_file_format(
     ValueError
         If file has no extension.
     """
-    if not os.path.isfile(file_path) and needs_to_exist and not allow_folder:
+    _, file_format = os.path.splitext(file_path)
+    is_folder_store = file_format.lstrip(".") in FOLDER_FILE_FORMATS and os.path.isdir(file_path)
+    if (
+        not os.path.isfile(file_path)
+        and not is_folder_store
+        and needs_to_exist
+        and not allow_folder
+    ):
         raise ValueError(f"There is no file {file_path!r}.")
 
-    _, file_format = os.path.splitext(file_path)
     if file_format != "":
         file_format = file_format.lstrip(".")
         return "yaml" if file_format == "yml" else file_format
@@ -14,22 +14,31 @@ from glotaran.builtin.megacomplexes.decay import DecayMegacomplex
 from glotaran.io.interface import DataIoInterface
 from glotaran.io.interface import ProjectIoInterface
 from glotaran.model.megacomplex import Megacomplex
+from glotaran.plugin_system.base_registry import LazyPluginRegistry
 from glotaran.plugin_system.base_registry import PluginOverwriteWarning
+from glotaran.plugin_system.base_registry import __PluginLoadingState
+from glotaran.plugin_system.base_registry import __PluginRegistry
 from glotaran.plugin_system.base_registry import add_instantiated_plugin_to_registry
 from glotaran.plugin_system.base_registry import add_plugin_to_registry
 from glotaran.plugin_system.base_registry import full_plugin_name
 from glotaran.plugin_system.base_registry import get_method_from_plugin
 from glotaran.plugin_system.base_registry import get_plugin_from_registry
 from glotaran.plugin_system.base_registry import is_registered_plugin
+from glotaran.plugin_system.base_registry import load_plugins
+from glotaran.plugin_system.base_registry import loaded_plugins
 from glotaran.plugin_system.base_registry import methods_differ_from_baseclass
 from glotaran.plugin_system.base_registry import methods_differ_from_baseclass_table
 from glotaran.plugin_system.base_registry import registered_plugins
 from glotaran.plugin_system.base_registry import set_plugin
 from glotaran.plugin_system.base_registry import show_method_help
 from glotaran.plugin_system.base_registry import supported_file_extensions
+from glotaran.plugin_system.megacomplex_registration import register_megacomplex
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from _pytest.capture import CaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
 
     from glotaran.plugin_system.base_registry import _PluginInstantiableType
     from glotaran.plugin_system.base_registry import _PluginType
@@ -424,3 +433,127 @@ def test_supported_file_extensions(
     )
 
     assert list(result) == expected
+
+
+class MockMegacomplexA(Megacomplex):
+    pass
+
+
+class MockMegacomplexB(Megacomplex):
+    pass
+
+
+class MockEntryPoint:
+    """Entry point registering a megacomplex class when it is loaded."""
+
+    def __init__(self, name: str, plugin: type[Megacomplex]):
+        self.group = "glotaran.plugins.megacomplexes"
+        self.name = name
+        self.value = full_plugin_name(plugin)
+        self.dist = None
+        self.plugin = plugin
+        self.load_count = 0
+
+    def load(self):
+        self.load_count += 1
+        register_megacomplex(self.name, self.plugin)
+
+
+@pytest.fixture
+def lazy_plugin_state(monkeypatch: MonkeyPatch, tmp_path: Path):
+    """Isolated plugin loading state with mock entry points and cache."""
+    monkeypatch.setenv("GLOTARAN_PLUGIN_CACHE", str(tmp_path / "plugin_cache.json"))
+    monkeypatch.delenv("DEACTIVATE_GTA_PLUGINS", raising=False)
+
+    def reset(entry_points: list[MockEntryPoint]):
+        monkeypatch.setattr(__PluginRegistry, "megacomplex", LazyPluginRegistry("megacomplex"))
+        monkeypatch.setattr(__PluginLoadingState, "entry_points", entry_points)
+        monkeypatch.setattr(__PluginLoadingState, "loaded_entry_points", set())
+        monkeypatch.setattr(__PluginLoadingState, "all_loaded", False)
+        monkeypatch.setattr(__PluginLoadingState, "cache", None)
+        return entry_points
+
+    yield reset
+
+
+def test_lazy_plugin_registry_without_cache(lazy_plugin_state):
+    """Without cache all plugins are loaded on the first lookup and the cache is written."""
+    entry_point_a, entry_point_b = lazy_plugin_state(
+        [MockEntryPoint("mock-a", MockMegacomplexA), MockEntryPoint("mock-b", MockMegacomplexB)]
+    )
+    registry = __PluginRegistry.megacomplex
+
+    assert loaded_plugins(registry) == {}
+    assert registry["mock-a"] is MockMegacomplexA
+    assert "mock-b" in loaded_plugins(registry)
+    assert entry_point_a.load_count == entry_point_b.load_count == 1
+
+    cache = __PluginLoadingState.cache
+    assert [entry["keys"]["megacomplex"] for entry in cache["entry_points"]] == [
+        ["mock-a", full_plugin_name(MockMegacomplexA)],
+        ["mock-b", full_plugin_name(MockMegacomplexB)],
+    ]
+
+
+def test_lazy_plugin_registry_with_cache(lazy_plugin_state):
+    """With cache only the entry point providing a key is loaded."""
+    lazy_plugin_state(
+        [MockEntryPoint("mock-a", MockMegacomplexA), MockEntryPoint("mock-b", MockMegacomplexB)]
+    )
+    load_plugins()
+    entry_point_a, entry_point_b = lazy_plugin_state(
+        [MockEntryPoint("mock-a", MockMegacomplexA), MockEntryPoint("mock-b", MockMegacomplexB)]
+    )
+    registry = __PluginRegistry.megacomplex
+
+    assert is_registered_plugin("mock-b", registry)
+    assert (entry_point_a.load_count, entry_point_b.load_count) == (0, 1)
+    assert "mock-a" not in loaded_plugins(registry)
+
+    assert not is_registered_plugin("unknown", registry)
+    assert (entry_point_a.load_count, entry_point_b.load_count) == (1, 1)
+
+
+def test_lazy_plugin_registry_outdated_cache(lazy_plugin_state):
+    """The cache isn't used if the installed entry points changed."""
+    lazy_plugin_state([MockEntryPoint("mock-a", MockMegacomplexA)])
+    load_plugins()
+    entry_point_a, entry_point_b = lazy_plugin_state(
+        [MockEntryPoint("mock-a", MockMegacomplexA), MockEntryPoint("mock-b", MockMegacomplexB)]
+    )
+
+    assert "mock-a" in __PluginRegistry.megacomplex
+    assert entry_point_a.load_count == entry_point_b.load_count == 1
+
+
+def test_lazy_plugin_registry_iteration(lazy_plugin_state):
+    """Iterating over the registry loads all plugins."""
+    lazy_plugin_state([MockEntryPoint("mock-a", MockMegacomplexA)])
+
+    assert registered_plugins(__PluginRegistry.megacomplex) == ["mock-a"]
+
+
+def test_lazy_plugin_registry_deactivated(lazy_plugin_state, monkeypatch: MonkeyPatch):
+    """No plugins are loaded if 'DEACTIVATE_GTA_PLUGINS' is set."""
+    (entry_point_a,) = lazy_plugin_state([MockEntryPoint("mock-a", MockMegacomplexA)])
+    monkeypatch.setenv("DEACTIVATE_GTA_PLUGINS", "1")
+
+    assert "mock-a" not in __PluginRegistry.megacomplex
+    assert entry_point_a.load_count == 0
+
+
+@pytest.mark.parametrize("with_cache", (True, False))
+def test_lazy_plugin_registry_add_plugin_before_loading(lazy_plugin_state, with_cache: bool):
+    """Entry point plugins keep their key if a conflicting plugin is added before loading."""
+    if with_cache:
+        lazy_plugin_state([MockEntryPoint("mock-a", MockMegacomplexA)])
+        load_plugins()
+    (entry_point_a,) = lazy_plugin_state([MockEntryPoint("mock-a", MockMegacomplexA)])
+    registry = __PluginRegistry.megacomplex
+
+    with pytest.warns(PluginOverwriteWarning, match="MockMegacomplexB.+MockMegacomplexA"):
+        register_megacomplex("mock-a", MockMegacomplexB)
+
+    assert entry_point_a.load_count == 1
+    assert registry["mock-a"] is MockMegacomplexA
+    assert registry[full_plugin_name(MockMegacomplexB)] is MockMegacomplexB
@@ -43,6 +43,23 @@ def test_infer_file_format(tmp_path: Path, extension: str, expected: str):
     assert infer_file_format(file_path) == expected
 
 
+def test_infer_file_format_folder_store(tmp_path: Path):
+    """Infer format of stores which are folders like ``zarr``."""
+    file_path = tmp_path / "dummy.zarr"
+    file_path.mkdir()
+
+    assert infer_file_format(file_path) == "zarr"
+
+
+def test_infer_file_format_folder_of_file_format(tmp_path: Path):
+    """Raise error if the path of a single file format is a folder."""
+    file_path = tmp_path / "dummy.nc"
+    file_path.mkdir()
+
+    with pytest.raises(ValueError, match="There is no file"):
+        infer_file_format(file_path)
+
+
 def test_inferr_file_format_no_extension(tmp_path: Path):
     """Raise error if file has no extension."""
     file_path = tmp_path / "dummy"
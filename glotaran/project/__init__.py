@@ -1,5 +1,20 @@
 """The glotaran project package."""
+from __future__ import annotations
 
-from glotaran.project.project import Project
-from glotaran.project.result import Result
-from glotaran.project.scheme import Scheme
+from typing import TYPE_CHECKING
+
+from glotaran.utils.lazy_import import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from glotaran.project.project import Project
+    from glotaran.project.result import Result
+    from glotaran.project.scheme import Scheme
+
+__getattr__, __dir__, __all__ = lazy_module_attributes(
+    __name__,
+    {
+        "Project": "glotaran.project.project",
+        "Result": "glotaran.project.result",
+        "Scheme": "glotaran.project.scheme",
+    },
+)
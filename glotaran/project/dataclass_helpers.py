@@ -43,8 +43,137 @@ def exclude_from_dict_field(
     return field(default=default, metadata={"exclude_from_dict": True})
 
 
+class LazyFileLoadable:
+    """Placeholder of a ``file_loadable_field`` value, which is loaded on first access.
+
+    See Also
+    --------
+    LazyFileLoadableFields
+    """
+
+    def __init__(
+        self,
+        file_loader: Callable[[Any, str | Path | None], FileLoadable],
+        source_path: Any,
+        folder: str | Path | None = None,
+    ):
+        """Initialize a placeholder with the arguments of a ``file_loader``.
+
+        Parameters
+        ----------
+        file_loader: Callable[[Any, str | Path | None], FileLoadable]
+            The ``file_loader`` of the field.
+        source_path: Any
+            File path (or mapping of file paths for wrapper classes) to load the value from.
+        folder: str | Path | None
+            Path to the base folder ``source_path`` is a relative path to. Defaults to None.
+        """
+        self.file_loader = file_loader
+        self.source_path = source_path
+        self.folder = folder
+        self.callbacks: list[Callable[[Any], None]] = []
+
+    def load(self) -> FileLoadable:
+        """Load the value and pass it to the callbacks.
+
+        Returns
+        -------
+        FileLoadable
+            The loaded value.
+        """
+        value = self.file_loader(self.source_path, self.folder)
+        for callback in self.callbacks:
+            callback(value)
+        return value
+
+    def __repr__(self) -> str:
+        """Representation of the not yet loaded value."""
+        return f"{type(self).__name__}({self.source_path!r})"
+
+
+class LazyFileLoadableFields:
+    """Mixin for dataclasses which load :class:`LazyFileLoadable` values on first access.
+
+    The placeholders are kept out of the instance attributes, so attribute access is
+    only intercepted for fields which are not loaded yet.
+
+    See Also
+    --------
+    fromdict
+    """
+
+    _lazy_file_loadable_fields: dict[str, LazyFileLoadable] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Load the value of a field which is not loaded yet.
+
+        Parameters
+        ----------
+        name: str
+            Name of the attribute.
+
+        Returns
+        -------
+        Any
+            The loaded value.
+
+        Raises
+        ------
+        AttributeError
+            If ``name`` is not a field which is not loaded yet.
+        """
+        lazy_fields = self._lazy_file_loadable_fields
+        if name not in lazy_fields:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = lazy_fields[name].load()
+        # Rebinding instead of mutating keeps shallow copies consistent
+        self._lazy_file_loadable_fields = {
+            key: lazy_value for key, lazy_value in lazy_fields.items() if key != name
+        }
+        setattr(self, name, value)
+        return value
+
+
+def add_load_callback(
+    dataclass_instance: DataclassInstance, field_name: str, callback: Callable[[Any], None]
+):
+    """Call ``callback`` with the value of a ``file_loadable_field`` once it is loaded.
+
+    Parameters
+    ----------
+    dataclass_instance: DataclassInstance
+        Instance of the dataclass.
+    field_name: str
+        Name of the field.
+    callback: Callable[[Any], None]
+        Function called with the loaded value, immediately if it is already loaded.
+    """
+    lazy_fields = getattr(dataclass_instance, "_lazy_file_loadable_fields", {})
+    if field_name in lazy_fields:
+        lazy_fields[field_name].callbacks.append(callback)
+    else:
+        callback(getattr(dataclass_instance, field_name))
+
+
+def is_loaded(dataclass_instance: DataclassInstance, field_name: str) -> bool:
+    """Check if the value of a ``file_loadable_field`` is loaded.
+
+    Parameters
+    ----------
+    dataclass_instance: DataclassInstance
+        Instance of the dataclass.
+    field_name: str
+        Name of the field.
+
+    Returns
+    -------
+    bool
+    """
+    return field_name not in getattr(dataclass_instance, "_lazy_file_loadable_fields", {})
+
+
 def file_loader_factory(
-    targetClass: type[FileLoadable], *, is_wrapper_class: bool = False
+    targetClass: type[FileLoadable], *, is_wrapper_class: bool = False, optional: bool = False
 ) -> Callable[[FileLoadable | str | Path], FileLoadable]:
     """Create ``file_loader`` functions to load ``targetClass`` from file.
 
@@ -56,6 +185,8 @@ def file_loader_factory(
         Whether or not ``targetClass`` is a wrapper class, so the isinstance check will be ignored
         and instead the responsibility for supported types lies at the implementation of
         the loader.
+    optional: bool
+        Whether or not ``None`` is a valid value, which is passed through by the loader.
 
     Returns
     -------
@@ -87,6 +218,8 @@ def file_loader_factory(
         """
         if isinstance(source_path, targetClass):
             return source_path
+        if source_path is None and optional is True:
+            return None  # type:ignore[return-value]
         if isinstance(source_path, (str, Path)):
             if folder is not None:
                 target_obj = targetClass.loader(Path(folder) / source_path)
@@ -110,7 +243,7 @@ def file_loader_factory(
 
 
 def file_loadable_field(
-    targetClass: type[FileLoadable], *, is_wrapper_class=False
+    targetClass: type[FileLoadable], *, is_wrapper_class=False, optional=False
 ) -> FileLoadable:
     """Create a dataclass field which can be and object of type ``targetClass`` or file path.
 
@@ -122,6 +255,9 @@ def file_loadable_field(
         Whether or not ``targetClass`` is a wrapper class, so the isinstance check will be ignored
         and instead the responsibility for supported types lies at the implementation of
         the loader.
+    optional: bool
+        Whether or not the field is optional, in which case it defaults to ``None`` and is
+        omitted by ``asdict`` if it is ``None``.
 
     Notes
     -----
@@ -136,18 +272,24 @@ def file_loadable_field(
     --------
     init_file_loadable_fields
     """
-    return field(
-        metadata={
-            "file_loader": file_loader_factory(targetClass, is_wrapper_class=is_wrapper_class)
-        }
-    )
+    metadata = {
+        "file_loader": file_loader_factory(
+            targetClass, is_wrapper_class=is_wrapper_class, optional=optional
+        )
+    }
+    if optional is True:
+        # A default factory doesn't create a class attribute, which would shadow
+        # fields of ``LazyFileLoadableFields`` classes which are not loaded yet.
+        return field(default_factory=lambda: None, metadata=metadata)
+    return field(metadata=metadata)
 
 
 def init_file_loadable_fields(dataclass_instance: DataclassInstance):
     """Load objects into class when dataclass is initialized with paths.
 
     If the class has file_loadable fields, this needs be called in the
-    ``__post_init__`` method of that class.
+    ``__post_init__`` method of that class. :class:`LazyFileLoadable` values are
+    kept to be loaded on first access.
 
     Parameters
     ----------
@@ -159,11 +301,18 @@ def init_file_loadable_fields(dataclass_instance: DataclassInstance):
     --------
     file_loadable_field
     """
+    lazy_fields = {}
     for field_item in fields(dataclass_instance):
         if "file_loader" in field_item.metadata:
             file_loader = field_item.metadata["file_loader"]
             value = getattr(dataclass_instance, field_item.name)
-            setattr(dataclass_instance, field_item.name, file_loader(value))
+            if isinstance(value, LazyFileLoadable):
+                lazy_fields[field_item.name] = value
+                delattr(dataclass_instance, field_item.name)
+            else:
+                setattr(dataclass_instance, field_item.name, file_loader(value))
+    if lazy_fields:
+        dataclass_instance._lazy_file_loadable_fields = lazy_fields  # type:ignore[attr-defined]
 
 
 def asdict(dataclass: DataclassInstance, folder: Path | None = None) -> dict[str, Any]:
@@ -188,7 +337,9 @@ def asdict(dataclass: DataclassInstance, folder: Path | None = None) -> dict[str
             dataclass_dict[field_item.name] = asdict(value) if is_dataclass(value) else value
         if "file_loader" in field_item.metadata:
             value = getattr(dataclass, field_item.name)
-            if value.source_path is not None:
+            if value is None:
+                dataclass_dict.pop(field_item.name, None)
+            elif value.source_path is not None:
                 if isinstance(value.source_path, (str, Path)):
                     dataclass_dict[field_item.name] = relative_posix_path(
                         value.source_path, folder
@@ -210,6 +361,8 @@ def fromdict(
     dataclass_type: type[DataclassInstanceType],
     dataclass_dict: dict[str, Any],
     folder: Path | None = None,
+    *,
+    lazy: bool = False,
 ) -> DataclassInstanceType:
     """Create a dataclass instance from a dict and loads all file represented fields.
 
@@ -221,16 +374,35 @@ def fromdict(
         A dict for instancing the the dataclass.
     folder : Path
         The root folder for file paths. If ``None`` file paths are consider absolute.
+    lazy : bool
+        Whether to load file represented fields on first access instead of immediately.
+        This requires ``dataclass_type`` to inherit from :class:`LazyFileLoadableFields`.
+        Defaults to False.
 
     Returns
     -------
     DataclassInstanceType
         Created instance of dataclass_type.
+
+    Raises
+    ------
+    ValueError
+        If ``lazy`` is True and ``dataclass_type`` doesn't support lazy loading.
     """
+    if lazy and not issubclass(dataclass_type, LazyFileLoadableFields):
+        raise ValueError(
+            f"Class {dataclass_type.__name__} needs to inherit from 'LazyFileLoadableFields' "
+            "to be loaded lazily."
+        )
     for field_item in fields(dataclass_type):
         if "file_loader" in field_item.metadata:
             file_path = dataclass_dict.get(field_item.name)
-            dataclass_dict[field_item.name] = field_item.metadata["file_loader"](file_path, folder)
+            file_loader = field_item.metadata["file_loader"]
+            dataclass_dict[field_item.name] = (
+                LazyFileLoadable(file_loader, file_path, folder)
+                if lazy and file_path is not None
+                else file_loader(file_path, folder)
+            )
         elif is_dataclass(field_item.default) and field_item.name in dataclass_dict:
             dataclass_dict[field_item.name] = type(field_item.default)(  # type:ignore[misc]
                 **dataclass_dict[field_item.name]
@@ -35,6 +35,7 @@ from glotaran.utils.ipython import display_file
 if TYPE_CHECKING:
     from collections.abc import Hashable
 
+    from glotaran.io.prepare_dataset import SvdMethod
     from glotaran.typing.types import LoadableDataset
 
 TEMPLATE = "version: {gta_version}"
@@ -169,6 +170,8 @@ class Project:
         add_svd: bool = False,
         lsv_dim: Hashable = "time",
         rsv_dim: Hashable = "spectral",
+        svd_method: SvdMethod = "full",
+        svd_components: int | None = None,
     ) -> xr.Dataset:
         """Load a dataset, with SVD data if ``add_svd`` is ``True``.
 
@@ -182,6 +185,12 @@ class Project:
             Dimension of the left singular vectors. Defaults to "time".
         rsv_dim: Hashable
             Dimension of the right singular vectors. Defaults to "spectral",
+        svd_method: SvdMethod
+            Method to calculate the SVD with, see
+            :func:`glotaran.io.prepare_dataset.calculate_svd`. Defaults to "full".
+        svd_components: int | None
+            Number of singular values to calculate. Required for the "truncated" and
+            "randomized" SVD methods. Defaults to None.
 
         Returns
         -------
@@ -200,7 +209,14 @@ class Project:
         if isinstance(dataset, xr.DataArray):
             dataset = dataset.to_dataset(name="data")
         if add_svd is True:
-            add_svd_to_dataset(dataset, name="data", lsv_dim=lsv_dim, rsv_dim=rsv_dim)
+            add_svd_to_dataset(
+                dataset,
+                name="data",
+                lsv_dim=lsv_dim,
+                rsv_dim=rsv_dim,
+                method=svd_method,
+                number_of_components=svd_components,
+            )
         return dataset
 
     def import_data(
@@ -209,8 +225,9 @@ class Project:
         dataset_name: str | None = None,
         allow_overwrite: bool = False,
         ignore_existing: bool = True,
+        data_format: Literal["nc", "zarr"] = "nc",
     ):
-        """Import a dataset by saving it as an .nc file in the project's data folder.
+        """Import a dataset by saving it in the project's data folder.
 
         Parameters
         ----------
@@ -224,6 +241,8 @@ class Project:
         ignore_existing: bool
             Whether to skip import if the dataset already exists and allow_overwrite is False.
             Defaults to ``True``.
+        data_format: Literal["nc", "zarr"]
+            Format the dataset is saved in. Defaults to ``"nc"``.
         """
         if not isinstance(dataset, Mapping) or isinstance(dataset, (xr.Dataset, xr.DataArray)):
             dataset = {dataset_name: dataset}
@@ -234,6 +253,7 @@ class Project:
                 dataset_name=key,
                 allow_overwrite=allow_overwrite,
                 ignore_existing=ignore_existing,
+                data_format=data_format,
             )
 
     @property
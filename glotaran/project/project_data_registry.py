@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 import xarray as xr
 
@@ -35,6 +36,7 @@ class ProjectDataRegistry(ProjectRegistry):
         dataset_name: str | None = None,
         allow_overwrite: bool = False,
         ignore_existing: bool = False,
+        data_format: Literal["nc", "zarr"] = "nc",
     ):
         """Import a dataset.
 
@@ -49,6 +51,8 @@ class ProjectDataRegistry(ProjectRegistry):
             Whether to overwrite an existing dataset.
         ignore_existing: bool
             Whether to ignore import if the dataset already exists.
+        data_format: Literal["nc", "zarr"]
+            Format the dataset is saved in. Defaults to ``"nc"``.
 
         Raises
         ------
@@ -72,7 +76,7 @@ class ProjectDataRegistry(ProjectRegistry):
             dataset_name = dataset_name or dataset.stem
             dataset = load_dataset(dataset)
 
-        data_path = self.directory / f"{dataset_name}.nc"
+        data_path = self.directory / f"{dataset_name}.{data_format}"
         if data_path.exists() and ignore_existing and allow_overwrite is False:
             return
         save_dataset(dataset, data_path, allow_overwrite=allow_overwrite)
@@ -20,8 +20,10 @@ from glotaran.io import load_result
 from glotaran.io import save_result
 from glotaran.model import Model
 from glotaran.optimization.optimization_history import OptimizationHistory
+from glotaran.optimization.optimization_profile import OptimizationProfile
 from glotaran.parameter import ParameterHistory
 from glotaran.parameter import Parameters
+from glotaran.project.dataclass_helpers import LazyFileLoadableFields
 from glotaran.project.dataclass_helpers import exclude_from_dict_field
 from glotaran.project.dataclass_helpers import file_loadable_field
 from glotaran.project.dataclass_helpers import init_file_loadable_fields
@@ -38,8 +40,13 @@ if TYPE_CHECKING:
 
 
 @dataclass
-class Result:
-    """The result of a global analysis."""
+class Result(LazyFileLoadableFields):
+    """The result of a global analysis.
+
+    Results loaded from file load the scheme, parameters, histories and data on first
+    access, while the values saved in the result file (e.g. :attr:`cost`) are available
+    immediately.
+    """
 
     number_of_function_evaluations: int
     """The number of function evaluations."""
@@ -90,7 +97,7 @@ class Result:
     additional_penalty: list[np.ndarray] | None = exclude_from_dict_field(None)
     """A vector with the value for each additional penalty, or None"""
 
-    cost: ArrayLike | None = exclude_from_dict_field(None)
+    cost: float | None = None
     """The final cost."""
 
     # The below can be none in case of unsuccessful optimization
@@ -133,6 +140,10 @@ class Result:
 
     :math:`rms = \sqrt{\chi^2_{red}}`
     """
+    profile: OptimizationProfile | None = file_loadable_field(  # type:ignore[type-var]
+        OptimizationProfile, optional=True
+    )
+    """Time spent in the stages of the optimization, if it was profiled."""
     source_path: StrOrPath = field(
         default="result.yml", init=False, repr=False, metadata={"exclude_from_dict": True}
     )
@@ -41,6 +41,8 @@ class Scheme:
 
     maximum_number_function_evaluations: int | None = None
     add_svd: bool = True
+    svd_method: Literal["full", "truncated", "randomized"] = "full"
+    svd_components: int | None = None
     ftol: float = 1e-8
     gtol: float = 1e-8
     xtol: float = 1e-8
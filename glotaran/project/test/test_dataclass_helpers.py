@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from copy import copy
 from dataclasses import dataclass
 
+import pytest
+
+from glotaran.project.dataclass_helpers import LazyFileLoadableFields
+from glotaran.project.dataclass_helpers import add_load_callback
 from glotaran.project.dataclass_helpers import asdict
 from glotaran.project.dataclass_helpers import exclude_from_dict_field
 from glotaran.project.dataclass_helpers import file_loadable_field
 from glotaran.project.dataclass_helpers import fromdict
 from glotaran.project.dataclass_helpers import init_file_loadable_fields
+from glotaran.project.dataclass_helpers import is_loaded
 
 
 @dataclass
@@ -56,3 +62,60 @@ def test_serialize_to_file_name_field():
     loaded = fromdict(DummyDataclass, dummy_class_dict)
 
     assert loaded == dummy_class
+
+
+@dataclass
+class LazyDummyDataclass(LazyFileLoadableFields):
+    foo: DummyFileLoadable = file_loadable_field(DummyFileLoadable)
+    optional_foo: DummyFileLoadable | None = file_loadable_field(DummyFileLoadable, optional=True)
+    baz: int = 84
+
+    def __post_init__(self):
+        init_file_loadable_fields(self)
+
+
+def test_fromdict_lazy():
+    """File loadable fields are loaded on first access."""
+    loaded_values = []
+    lazy = fromdict(LazyDummyDataclass, {"foo": "foo.file", "optional_foo": "bar.file"}, lazy=True)
+    add_load_callback(lazy, "foo", loaded_values.append)
+    lazy_copy = copy(lazy)
+
+    assert lazy.baz == 84
+    assert not is_loaded(lazy, "foo")
+    assert not is_loaded(lazy, "optional_foo")
+    assert loaded_values == []
+
+    assert lazy.foo.data == {"foo": "foo.file_loaded"}
+    assert is_loaded(lazy, "foo")
+    assert not is_loaded(lazy, "optional_foo")
+    assert loaded_values == [lazy.foo]
+    assert lazy.optional_foo.source_path == "bar.file"
+
+    add_load_callback(lazy, "foo", loaded_values.append)
+    assert loaded_values == [lazy.foo, lazy.foo]
+
+    assert not is_loaded(lazy_copy, "foo")
+    assert lazy_copy.foo.data == {"foo": "foo.file_loaded"}
+
+    with pytest.raises(AttributeError, match="'LazyDummyDataclass' object has no attribute 'bar'"):
+        lazy.bar
+
+    eager = fromdict(LazyDummyDataclass, {"foo": "foo.file"})
+    assert is_loaded(eager, "foo")
+    assert eager.optional_foo is None
+    assert eager == fromdict(LazyDummyDataclass, {"foo": "foo.file"}, lazy=True)
+
+
+def test_fromdict_lazy_not_supported():
+    """Raise if the dataclass doesn't support lazy loading."""
+
+    @dataclass
+    class DummyDataclass:
+        foo: DummyFileLoadable = file_loadable_field(DummyFileLoadable)
+
+        def __post_init__(self):
+            init_file_loadable_fields(self)
+
+    with pytest.raises(ValueError, match="needs to inherit from 'LazyFileLoadableFields'"):
+        fromdict(DummyDataclass, {"foo": "foo.file"}, lazy=True)
@@ -289,6 +289,17 @@ def test_import_data_xarray(tmp_path: Path, data: xr.Dataset | xr.DataArray):
     assert project.load_data("test_data").equals(xr.Dataset({"data": xr.DataArray([1])}))
 
 
+def test_import_data_zarr(tmp_path: Path):
+    """Import data in the zarr format."""
+    pytest.importorskip("zarr")
+    project = Project.open(tmp_path)
+    project.import_data(example_dataset, dataset_name="test_data", data_format="zarr")
+
+    assert (tmp_path / "data/test_data.zarr").is_dir() is True
+    assert project.data["test_data"] == tmp_path / "data/test_data.zarr"
+    assert project.load_data("test_data").equals(example_dataset)
+
+
 def test_import_data_allow_overwrite(existing_project: Project):
     """Overwrite data when ``allow_overwrite==True``."""
 
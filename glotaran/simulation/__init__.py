@@ -1,4 +1,5 @@
 """Package containing code for simulation of dataset models."""
 from glotaran.simulation.simulation import simulate
+from glotaran.simulation.simulation import simulate_batch
 
-__all__ = ["simulate"]
+__all__ = ["simulate", "simulate_batch"]
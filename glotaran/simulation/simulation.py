@@ -1,22 +1,39 @@
 """Functions for simulating a dataset using a global optimization model."""
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+from typing import TypeAlias
 
 import numpy as np
 import xarray as xr
+from attrs import fields
 
 from glotaran.model import DatasetModel
 from glotaran.model.dataset_model import get_dataset_model_model_dimension
 from glotaran.model.dataset_model import has_dataset_model_global_model
+from glotaran.model.item import Item
 from glotaran.model.item import fill_item
 from glotaran.optimization.matrix_provider import MatrixProvider
+from glotaran.parameter import Parameter
+from glotaran.parameter import Parameters
 
 if TYPE_CHECKING:
     from glotaran.model import Model
-    from glotaran.parameter import Parameters
+    from glotaran.optimization.matrix_provider import MatrixContainer
     from glotaran.typing.types import ArrayLike
 
+NoiseSeed: TypeAlias = int | np.random.SeedSequence | np.random.Generator | None
+"""Seed for the noise simulation, passed on to :func:`numpy.random.default_rng`."""
+
+NoiseModel: TypeAlias = Literal["gaussian", "poisson"]
+"""Available noise models, ``"poisson"`` models shot noise of photon counting data."""
+
+_MODEL_ATTRIBUTES = ("megacomplex", "megacomplex_scale")
+_GLOBAL_MODEL_ATTRIBUTES = ("global_megacomplex", "global_megacomplex_scale")
+
 
 def simulate(
     model: Model,
@@ -26,7 +43,8 @@ def simulate(
     clp: xr.DataArray | None = None,
     noise: bool = False,
     noise_std_dev: float = 1.0,
-    noise_seed: int | None = None,
+    noise_seed: NoiseSeed = None,
+    noise_model: NoiseModel = "gaussian",
 ) -> xr.Dataset:
     """Simulate a dataset using a model.
 
@@ -46,9 +64,11 @@ def simulate(
     noise : bool
         Add noise to the simulation.
     noise_std_dev : float
-        The standard deviation for noise simulation.
-    noise_seed : int | None
+        The standard deviation for gaussian noise simulation.
+    noise_seed : NoiseSeed
         The seed for the noise simulation.
+    noise_model : NoiseModel
+        The noise model, either ``"gaussian"`` or ``"poisson"``.
 
     Returns
     -------
@@ -82,13 +102,220 @@ def simulate(
         )
 
     if noise:
-        if noise_seed is not None:
-            np.random.seed(noise_seed)
-        result["data"] = (result.data.dims, np.random.normal(result.data, noise_std_dev))
+        add_noise(result.data.to_numpy(), noise_std_dev, noise_seed, noise_model)
 
     return result
 
 
+def simulate_batch(
+    model: Model,
+    dataset: str,
+    parameters: Parameters | Sequence[Parameters],
+    coordinates: dict[str, ArrayLike],
+    clp: xr.DataArray | None = None,
+    noise: bool = False,
+    noise_std_dev: float = 1.0,
+    noise_seeds: Sequence[NoiseSeed] | None = None,
+    noise_seed: int | np.random.SeedSequence | None = None,
+    noise_model: NoiseModel = "gaussian",
+    batch_dimension: str = "simulation",
+) -> xr.Dataset:
+    """Simulate a dataset for many parameter sets and noise seeds at once.
+
+    Matrices are only calculated once for all parameter sets which share the values of
+    the parameters the matrix depends on, e.g. the model matrix is calculated once if only
+    the parameters of the global megacomplexes differ.
+
+    Parameters
+    ----------
+    model : Model
+        The model containing the dataset model.
+    dataset : str
+        Label of the dataset to simulate
+    parameters : Parameters | Sequence[Parameters]
+        The parameter sets for the simulations. A single parameter set is used for all
+        ``noise_seeds``.
+    coordinates : dict[str, ArrayLike]
+        A dictionary with the coordinates used for simulation (e.g. time, wavelengths, ...).
+    clp : xr.DataArray | None
+        A matrix with conditionally linear parameters (e.g. spectra, pixel intensity, ...).
+        Will be used instead of the dataset's global megacomplexes if not None.
+    noise : bool
+        Add noise to the simulations.
+    noise_std_dev : float
+        The standard deviation for gaussian noise simulation.
+    noise_seeds : Sequence[NoiseSeed] | None
+        One seed for the noise simulation per parameter set.
+    noise_seed : int | np.random.SeedSequence | None
+        Seed from which independent seeds for all simulations are spawned
+        (see :func:`spawn_noise_seeds`), if ``noise_seeds`` is not given.
+    noise_model : NoiseModel
+        The noise model, either ``"gaussian"`` or ``"poisson"``.
+    batch_dimension : str
+        The name of the dimension along which the simulations are stacked.
+
+    Returns
+    -------
+    xr.Dataset
+        The simulated datasets stacked along ``batch_dimension``.
+
+    Raises
+    ------
+    ValueError
+        Raised if the number of parameter sets and noise seeds differ.
+    ValueError
+        Raised if dataset model has no global megacomplex and no clp are provided.
+    """
+    if isinstance(parameters, Parameters):
+        parameters = [parameters] * (1 if noise_seeds is None else len(noise_seeds))
+    if noise_seeds is None:
+        noise_seeds = spawn_noise_seeds(noise_seed, len(parameters))
+    if len(noise_seeds) != len(parameters):
+        raise ValueError(
+            f"Got {len(parameters)} parameter sets but {len(noise_seeds)} noise seeds."
+        )
+
+    dataset_models = [
+        fill_item(model.dataset[dataset], model, parameter_set) for parameter_set in parameters
+    ]
+    model_dimension = get_dataset_model_model_dimension(dataset_models[0])
+    model_axis = np.asarray(coordinates[model_dimension])
+    global_dimension = next(dim for dim in coordinates if dim != model_dimension)
+    global_axis = np.asarray(coordinates[global_dimension])
+
+    is_full_model = has_dataset_model_global_model(dataset_models[0])
+    if not is_full_model and clp is None:
+        raise ValueError(
+            f"Cannot simulate dataset '{dataset}'. "
+            "No global megacomplex is defined and no clp provided."
+        )
+
+    matrices: dict[tuple[float, ...], MatrixContainer] = {}
+    global_clp: dict[tuple[float, ...], tuple[list[str], np.ndarray]] = {}
+    clp_values_by_labels: dict[tuple[str, ...], np.ndarray] = {}
+    data = np.empty((len(dataset_models), model_axis.size, global_axis.size))
+    for i, (dataset_model, noise_seed) in enumerate(zip(dataset_models, noise_seeds)):
+        matrix_key = _parameter_values(dataset_model, _GLOBAL_MODEL_ATTRIBUTES)
+        if matrix_key not in matrices:
+            matrices[matrix_key] = MatrixProvider.calculate_dataset_matrix(
+                dataset_model, global_axis, model_axis
+            )
+        matrix = matrices[matrix_key]
+
+        if is_full_model:
+            global_key = _parameter_values(dataset_model, _MODEL_ATTRIBUTES)
+            if global_key not in global_clp:
+                global_clp[global_key] = calculate_global_clp(
+                    dataset_model, global_axis, model_axis
+                )
+            clp_labels, clp_values = global_clp[global_key]
+            clp_values = clp_values[:, [clp_labels.index(label) for label in matrix.clp_labels]]
+        else:
+            # The clp values only depend on the clp labels, which are the same for most matrices
+            matrix_labels = tuple(matrix.clp_labels)
+            if matrix_labels not in clp_values_by_labels:
+                clp_values_by_labels[matrix_labels] = get_clp_values(
+                    clp, global_dimension, matrix.clp_labels  # type:ignore[arg-type]
+                )
+            clp_values = clp_values_by_labels[matrix_labels]
+
+        data[i] = calculate_simulated_data(matrix, clp_values)
+        if noise:
+            add_noise(data[i], noise_std_dev, noise_seed, noise_model)
+
+    return xr.Dataset(
+        {"data": ((batch_dimension, model_dimension, global_dimension), data)},
+        coords={
+            batch_dimension: np.arange(len(dataset_models)),
+            model_dimension: model_axis,
+            global_dimension: global_axis,
+        },
+    )
+
+
+def spawn_noise_seeds(
+    noise_seed: int | np.random.SeedSequence | None, number_of_seeds: int
+) -> list[np.random.SeedSequence]:
+    """Spawn independent seeds for the noise of multiple simulations.
+
+    The spawned seeds give statistically independent and reproducible random streams,
+    e.g. to simulate in parallel workers without sharing a global random state.
+
+    Parameters
+    ----------
+    noise_seed : int | np.random.SeedSequence | None
+        The seed to spawn from. If ``None`` fresh entropy is used.
+    number_of_seeds : int
+        The number of seeds to spawn.
+
+    Returns
+    -------
+    list[np.random.SeedSequence]
+        The spawned seeds.
+    """
+    if not isinstance(noise_seed, np.random.SeedSequence):
+        noise_seed = np.random.SeedSequence(noise_seed)
+    return noise_seed.spawn(number_of_seeds)
+
+
+def add_noise(
+    data: np.ndarray,
+    noise_std_dev: float = 1.0,
+    noise_seed: NoiseSeed = None,
+    noise_model: NoiseModel = "gaussian",
+) -> np.ndarray:
+    """Add noise to simulated data in place.
+
+    The noise is drawn from a :class:`numpy.random.Generator` row by row, so no second
+    array of the size of the data is allocated.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The simulated data, it gets overwritten.
+    noise_std_dev : float
+        The standard deviation for gaussian noise simulation.
+    noise_seed : NoiseSeed
+        The seed for the noise simulation.
+    noise_model : NoiseModel
+        The noise model, ``"gaussian"`` adds normal distributed noise with standard deviation
+        ``noise_std_dev`` and ``"poisson"`` replaces the data with poisson distributed counts
+        with the data as expected value.
+
+    Returns
+    -------
+    np.ndarray
+        The data with noise.
+
+    Raises
+    ------
+    ValueError
+        Raised if the noise model is unknown.
+    ValueError
+        Raised if poisson noise is requested for data with negative values.
+    """
+    generator = np.random.default_rng(noise_seed)
+    # Reshaping non contiguous data would return a copy, so the rows are indexed instead.
+    rows = (
+        data.reshape(-1, data.shape[-1])
+        if data.flags.c_contiguous
+        else (data[index] for index in np.ndindex(data.shape[:-1]))
+    )
+    if noise_model == "gaussian":
+        for row in rows:
+            row += generator.normal(0.0, noise_std_dev, row.size)
+    elif noise_model == "poisson":
+        if np.any(data < 0):
+            raise ValueError("Poisson noise can only be added to non-negative data.")
+        for row in rows:
+            row[:] = generator.poisson(row)
+    else:
+        raise ValueError(
+            f"Unknown noise model '{noise_model}', supported are 'gaussian' and 'poisson'."
+        )
+    return data
+
+
 def simulate_from_clp(
     dataset_model: DatasetModel,
     global_dimension: str,
@@ -128,22 +355,125 @@ def simulate_from_clp(
         raise ValueError("Missing coordinate 'clp_label' in clp.")
 
     matrix = MatrixProvider.calculate_dataset_matrix(dataset_model, global_axis, model_axis)
+    clp_values = get_clp_values(clp, global_dimension, matrix.clp_labels)
     result = xr.DataArray(
-        np.zeros((model_axis.size, global_axis.size)),
+        calculate_simulated_data(matrix, clp_values),
         coords=[
             (model_dimension, model_axis),
             (global_dimension, global_axis),
         ],
     )
-    result = result.to_dataset(name="data")
-    for i in range(global_axis.size):
-        this_matrix = matrix.matrix[i] if matrix.is_index_dependent else matrix.matrix
-        result.data[:, i] = np.dot(
-            this_matrix,
-            clp.isel({global_dimension: i}).sel({"clp_label": matrix.clp_labels}),
-        )
+    return result.to_dataset(name="data")
 
-    return result
+
+def get_clp_values(clp: xr.DataArray, global_dimension: str, clp_labels: list[str]) -> np.ndarray:
+    """Get the values of the conditionally linear parameters in the order of a matrix.
+
+    Parameters
+    ----------
+    clp : xr.DataArray
+        A matrix with conditionally linear parameters.
+    global_dimension : str
+        The global dimension of the dataset.
+    clp_labels : list[str]
+        The clp labels of the matrix.
+
+    Returns
+    -------
+    np.ndarray
+        The clp values of shape ``(global, clp_labels)``.
+    """
+    return (
+        clp.sel({"clp_label": clp_labels})
+        .transpose(global_dimension, "clp_label")
+        .to_numpy()
+        .astype(np.float64, copy=False)
+    )
+
+
+def calculate_simulated_data(matrix: MatrixContainer, clp_values: np.ndarray) -> np.ndarray:
+    """Calculate the product of a matrix and the conditionally linear parameters.
+
+    Parameters
+    ----------
+    matrix : MatrixContainer
+        The matrix of the dataset.
+    clp_values : np.ndarray
+        The clp values of shape ``(global, clp_labels)`` in the order of the matrix.
+
+    Returns
+    -------
+    np.ndarray
+        The simulated data of shape ``(model, global)``.
+    """
+    if matrix.is_index_dependent:
+        return np.einsum("gmc,gc->mg", matrix.matrix, clp_values, optimize=True)
+    return matrix.matrix @ clp_values.T
+
+
+def calculate_global_clp(
+    dataset_model: DatasetModel, global_axis: ArrayLike, model_axis: ArrayLike
+) -> tuple[list[str], np.ndarray]:
+    """Calculate the conditionally linear parameters from the global megacomplexes.
+
+    Parameters
+    ----------
+    dataset_model : DatasetModel
+        The dataset model to simulate.
+    global_axis : ArrayLike
+        The global axis of the dataset.
+    model_axis : ArrayLike
+        The model axis of the dataset.
+
+    Returns
+    -------
+    tuple[list[str], np.ndarray]
+        The global clp labels and the clp values of shape ``(global, clp_labels)``.
+
+    Raises
+    ------
+    ValueError
+        Raised if at least one of the dataset model's global megacomplexes is index dependent.
+    """
+    global_matrix = MatrixProvider.calculate_dataset_matrix(
+        dataset_model, global_axis, model_axis, global_matrix=True
+    )
+    if global_matrix.is_index_dependent:
+        raise ValueError("Index dependent models for global dimension are not supported.")
+    return global_matrix.clp_labels, global_matrix.matrix
+
+
+def _parameter_values(value: Any, exclude: tuple[str, ...]) -> tuple[float, ...]:
+    """Collect the values of all parameters of a filled item.
+
+    Parameters
+    ----------
+    value : Any
+        The filled item or one of its attribute values.
+    exclude : tuple[str, ...]
+        Names of attributes of the dataset model which are not traversed.
+
+    Returns
+    -------
+    tuple[float, ...]
+        The parameter values in traversal order.
+    """
+    if isinstance(value, Parameter):
+        return (value.value,)
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return sum((_parameter_values(v, exclude) for v in value), ())
+    if isinstance(value, Item):
+        return sum(
+            (
+                _parameter_values(getattr(value, attribute.name), exclude)
+                for attribute in fields(type(value))
+                if not (isinstance(value, DatasetModel) and attribute.name in exclude)
+            ),
+            (),
+        )
+    return ()
 
 
 def simulate_full_model(
@@ -178,20 +508,17 @@ def simulate_full_model(
     ValueError
         Raised if at least one of the dataset model's global megacomplexes is index dependent.
     """
-    global_matrix = MatrixProvider.calculate_dataset_matrix(
-        dataset_model, global_axis, model_axis, global_matrix=True
+    global_clp_labels, global_clp_values = calculate_global_clp(
+        dataset_model, global_axis, model_axis
     )
-    if global_matrix.is_index_dependent:
-        raise ValueError("Index dependent models for global dimension are not supported.")
-    global_clp_labels = global_matrix.clp_labels
-    global_matrix = xr.DataArray(
-        global_matrix.matrix.T,
+    global_clp = xr.DataArray(
+        global_clp_values,
         coords=[
-            ("clp_label", global_clp_labels),
             (global_dimension, global_axis),
+            ("clp_label", global_clp_labels),
         ],
     )
 
     return simulate_from_clp(
-        dataset_model, global_dimension, global_axis, model_dimension, model_axis, global_matrix
+        dataset_model, global_dimension, global_axis, model_dimension, model_axis, global_clp
     )
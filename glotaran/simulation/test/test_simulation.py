@@ -1,9 +1,15 @@
 import numpy as np
 import pytest
+import xarray as xr
 
+from glotaran.optimization.matrix_provider import MatrixProvider
 from glotaran.optimization.test.models import SimpleTestModel
 from glotaran.parameter import Parameters
 from glotaran.simulation import simulate
+from glotaran.simulation import simulate_batch
+from glotaran.simulation import simulation
+from glotaran.simulation.simulation import add_noise
+from glotaran.simulation.simulation import spawn_noise_seeds
 
 
 @pytest.mark.parametrize("index_dependent", [True, False])
@@ -56,3 +62,136 @@ def test_simulate_dataset(index_dependent, noise):
                 ]
             ).T,
         )
+
+
+@pytest.mark.parametrize("index_dependent", [True, False])
+def test_simulate_batch(monkeypatch: pytest.MonkeyPatch, index_dependent: bool):
+    model = SimpleTestModel(
+        **{
+            "megacomplex": {
+                "m1": {"type": "simple-test-mc", "is_index_dependent": index_dependent},
+                "m2": {"type": "simple-test-mc", "is_index_dependent": False},
+            },
+            "dataset": {
+                "dataset1": {
+                    "megacomplex": ["m1"],
+                    "megacomplex_scale": ["1"],
+                    "global_megacomplex": ["m2"],
+                    "global_megacomplex_scale": ["2"],
+                },
+            },
+        }
+    )
+    parameter_sets = [Parameters.from_list([1, scale]) for scale in [1, 2, 3]]
+    coordinates = {"global": np.asarray([1, 2, 3, 4]), "model": np.asarray([2, 3, 4])}
+
+    calculate_dataset_matrix = MatrixProvider.calculate_dataset_matrix
+    calls = []
+
+    def counting_calculate_dataset_matrix(*args, **kwargs):
+        calls.append(kwargs.get("global_matrix", False))
+        return calculate_dataset_matrix(*args, **kwargs)
+
+    monkeypatch.setattr(
+        MatrixProvider, "calculate_dataset_matrix", counting_calculate_dataset_matrix
+    )
+    data = simulate_batch(model, "dataset1", parameter_sets, coordinates)
+    assert calls.count(False) == 1
+    assert calls.count(True) == 3
+
+    assert data.data.dims == ("simulation", "model", "global")
+    assert data.data.shape == (3, 3, 4)
+    for i, parameters in enumerate(parameter_sets):
+        wanted = simulate(model, "dataset1", parameters, coordinates)
+        assert np.allclose(data.data[i], wanted.data)
+
+    noisy = simulate_batch(
+        model,
+        "dataset1",
+        parameter_sets[0],
+        coordinates,
+        noise=True,
+        noise_std_dev=0.1,
+        noise_seeds=[1, 2, 1],
+    )
+    assert noisy.data.shape == (3, 3, 4)
+    assert np.array_equal(noisy.data[0], noisy.data[2])
+    assert not np.array_equal(noisy.data[0], noisy.data[1])
+
+    spawned = simulate_batch(
+        model, "dataset1", parameter_sets, coordinates, noise=True, noise_seed=42
+    )
+    spawned_again = simulate_batch(
+        model, "dataset1", parameter_sets, coordinates, noise=True, noise_seed=42
+    )
+    assert np.array_equal(spawned.data, spawned_again.data)
+    assert not np.allclose(spawned.data[0] - data.data[0], spawned.data[1] - data.data[1])
+
+    with pytest.raises(ValueError, match="2 noise seeds"):
+        simulate_batch(model, "dataset1", parameter_sets, coordinates, noise_seeds=[1, 2])
+
+
+def test_simulate_batch_clp(monkeypatch: pytest.MonkeyPatch):
+    model = SimpleTestModel(
+        **{
+            "megacomplex": {"m1": {"type": "simple-test-mc", "is_index_dependent": False}},
+            "dataset": {"dataset1": {"megacomplex": ["m1"], "megacomplex_scale": ["1"]}},
+        }
+    )
+    parameter_sets = [Parameters.from_list([scale]) for scale in [1, 2, 3]]
+    coordinates = {"global": np.asarray([1, 2, 3, 4]), "model": np.asarray([2, 3, 4])}
+    clp = xr.DataArray(
+        [[1, 10], [2, 20], [3, 30], [4, 40]],
+        coords=(("global", coordinates["global"]), ("clp_label", ["s1", "s2"])),
+    )
+
+    get_clp_values = simulation.get_clp_values
+    calls = []
+
+    def counting_get_clp_values(*args, **kwargs):
+        calls.append(args)
+        return get_clp_values(*args, **kwargs)
+
+    monkeypatch.setattr(simulation, "get_clp_values", counting_get_clp_values)
+    data = simulate_batch(model, "dataset1", parameter_sets, coordinates, clp=clp)
+    assert len(calls) == 1
+
+    for i, parameters in enumerate(parameter_sets):
+        wanted = simulate(model, "dataset1", parameters, coordinates, clp=clp)
+        assert np.allclose(data.data[i], wanted.data)
+
+
+def test_add_noise():
+    data = np.full((20, 30), 100.0)
+    noisy = add_noise(data, 2.0, 1)
+    assert noisy is data
+    assert np.array_equal(noisy, add_noise(np.full((20, 30), 100.0), 2.0, 1))
+    assert abs(np.std(noisy) - 2) < 0.5
+
+    transposed = np.zeros((4, 5, 6)).transpose(2, 0, 1)
+    assert add_noise(transposed, 1.0, 0) is transposed
+    assert np.all(transposed != 0)
+    assert np.array_equal(transposed, add_noise(np.zeros((6, 4, 5)), 1.0, 0))
+
+    counts = add_noise(
+        np.full(1000, 50.0), noise_seed=np.random.default_rng(1), noise_model="poisson"
+    )
+    assert np.array_equal(counts, np.round(counts))
+    assert abs(np.mean(counts) - 50) < 2
+    assert abs(np.var(counts) - 50) < 10
+
+    with pytest.raises(ValueError, match="non-negative"):
+        add_noise(np.full(10, -1.0), noise_model="poisson")
+    with pytest.raises(ValueError, match="Unknown noise model"):
+        add_noise(np.zeros(10), noise_model="uniform")  # type:ignore[arg-type]
+
+
+def test_spawn_noise_seeds():
+    first, second = spawn_noise_seeds(1, 2)
+    assert np.array_equal(
+        add_noise(np.zeros(10), noise_seed=first),
+        add_noise(np.zeros(10), noise_seed=spawn_noise_seeds(1, 2)[0]),
+    )
+    assert not np.array_equal(
+        add_noise(np.zeros(10), noise_seed=first), add_noise(np.zeros(10), noise_seed=second)
+    )
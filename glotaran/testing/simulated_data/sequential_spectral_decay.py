@@ -1,33 +1,102 @@
-"""A simple sequential decay for testing purposes."""
+"""A simple sequential decay for testing purposes.
 
-from glotaran.io import load_model
-from glotaran.project import Scheme
-from glotaran.project.generators import generate_model_yml
-from glotaran.simulation import simulate
-from glotaran.testing.simulated_data.shared_decay import PARAMETERS
+The models, dataset and scheme are created on first access (:pep:`562`),
+so importing this module doesn't simulate the dataset.
+"""
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from glotaran.testing.simulated_data import shared_decay
 from glotaran.testing.simulated_data.shared_decay import SIMULATION_COORDINATES
-from glotaran.testing.simulated_data.shared_decay import SIMULATION_PARAMETERS
+from glotaran.utils.lazy_import import lazy_module_values
 
-SIMULATION_MODEL_YML = generate_model_yml(
-    generator_name="spectral_decay_sequential",
-    generator_arguments={"nr_compartments": 3, "irf": True},
-)
-SIMULATION_MODEL = load_model(SIMULATION_MODEL_YML, format_name="yml_str")
+if TYPE_CHECKING:
+    import xarray as xr
 
-MODEL_YML = generate_model_yml(
-    generator_name="decay_sequential",
-    generator_arguments={"nr_compartments": 3, "irf": True},
-)
-MODEL = load_model(MODEL_YML, format_name="yml_str")
+    from glotaran.model import Model
+    from glotaran.parameter import Parameters
+    from glotaran.project import Scheme
 
+    SIMULATION_PARAMETERS: Parameters
+    PARAMETERS: Parameters
 
-DATASET = simulate(
-    SIMULATION_MODEL,
-    "dataset_1",
-    SIMULATION_PARAMETERS,
-    SIMULATION_COORDINATES,
-    noise=True,
-    noise_std_dev=1e-2,
-)
+    SIMULATION_MODEL_YML: str
+    SIMULATION_MODEL: Model
+    MODEL_YML: str
+    MODEL: Model
+    DATASET: xr.Dataset
+    SCHEME: Scheme
+
+
+@cache
+def _simulation_model_yml() -> str:
+    from glotaran.project.generators import generate_model_yml
+
+    return generate_model_yml(
+        generator_name="spectral_decay_sequential",
+        generator_arguments={"nr_compartments": 3, "irf": True},
+    )
+
+
+@cache
+def _simulation_model() -> Model:
+    from glotaran.io import load_model
+
+    return load_model(_simulation_model_yml(), format_name="yml_str")
+
+
+@cache
+def _model_yml() -> str:
+    from glotaran.project.generators import generate_model_yml
 
-SCHEME = Scheme(model=MODEL, parameters=PARAMETERS, data={"dataset_1": DATASET})
+    return generate_model_yml(
+        generator_name="decay_sequential",
+        generator_arguments={"nr_compartments": 3, "irf": True},
+    )
+
+
+@cache
+def _model() -> Model:
+    from glotaran.io import load_model
+
+    return load_model(_model_yml(), format_name="yml_str")
+
+
+@cache
+def _dataset() -> xr.Dataset:
+    from glotaran.simulation import simulate
+
+    return simulate(
+        _simulation_model(),
+        "dataset_1",
+        shared_decay.SIMULATION_PARAMETERS,
+        SIMULATION_COORDINATES,
+        noise=True,
+        noise_std_dev=1e-2,
+    )
+
+
+@cache
+def _scheme() -> Scheme:
+    from glotaran.project import Scheme
+
+    return Scheme(
+        model=_model(), parameters=shared_decay.PARAMETERS, data={"dataset_1": _dataset()}
+    )
+
+
+__getattr__ = lazy_module_values(
+    __name__,
+    {
+        "SIMULATION_PARAMETERS": lambda: shared_decay.SIMULATION_PARAMETERS,
+        "PARAMETERS": lambda: shared_decay.PARAMETERS,
+        "SIMULATION_MODEL_YML": _simulation_model_yml,
+        "SIMULATION_MODEL": _simulation_model,
+        "MODEL_YML": _model_yml,
+        "MODEL": _model,
+        "DATASET": _dataset,
+        "SCHEME": _scheme,
+    },
+)
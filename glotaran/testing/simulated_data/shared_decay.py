@@ -1,7 +1,21 @@
-"""Shared variables for simulated decays."""
+"""Shared variables for simulated decays.
+
+The parameters are created on first access (:pep:`562`),
+so importing this module doesn't parse them.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import numpy as np
 
-from glotaran.io import load_parameters
+from glotaran.utils.lazy_import import lazy_module_values
+
+if TYPE_CHECKING:
+    from glotaran.parameter import Parameters
+
+    SIMULATION_PARAMETERS: Parameters
+    PARAMETERS: Parameters
 
 SIMULATION_PARAMETERS_YML = """
 rates:
@@ -27,7 +41,6 @@ shapes:
     - [location, 650]
     - [width, 60]
 """
-SIMULATION_PARAMETERS = load_parameters(SIMULATION_PARAMETERS_YML, format_name="yml_str")
 
 PARAMETERS_YML = """
 rates:
@@ -39,8 +52,22 @@ irf:
   - [center, 0.3]
   - [width, 0.1]
 """
-PARAMETERS = load_parameters(PARAMETERS_YML, format_name="yml_str")
 
 TIME_AXIS = np.arange(-1, 20, 0.01)
 SPECTRAL_AXIS = np.arange(600, 700, 1.4)
 SIMULATION_COORDINATES = {"time": TIME_AXIS, "spectral": SPECTRAL_AXIS}
+
+
+def _load_parameters(parameters_yml: str) -> Parameters:
+    from glotaran.io import load_parameters
+
+    return load_parameters(parameters_yml, format_name="yml_str")
+
+
+__getattr__ = lazy_module_values(
+    __name__,
+    {
+        "SIMULATION_PARAMETERS": lambda: _load_parameters(SIMULATION_PARAMETERS_YML),
+        "PARAMETERS": lambda: _load_parameters(PARAMETERS_YML),
+    },
+)
@@ -0,0 +1,253 @@
+"""Parametric generator of synthetic schemes with known ground truth.
+
+The generated schemes are meant as input for scaling benchmarks and performance
+regression tests, so they can be created at any size without shipping data files.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import xarray as xr
+
+from glotaran.builtin.megacomplexes.damped_oscillation import DampedOscillationMegacomplex
+from glotaran.builtin.megacomplexes.decay import DecayParallelMegacomplex
+from glotaran.builtin.megacomplexes.decay import DecaySequentialMegacomplex
+from glotaran.model import Model
+from glotaran.parameter import Parameters
+from glotaran.project import Scheme
+from glotaran.simulation import simulate
+from glotaran.simulation.simulation import add_noise
+from glotaran.simulation.simulation import spawn_noise_seeds
+
+SyntheticModel = Model.create_class_from_megacomplexes(
+    [DecayParallelMegacomplex, DecaySequentialMegacomplex, DampedOscillationMegacomplex]
+)
+
+
+@dataclass
+class SyntheticScheme:
+    """A generated scheme together with its ground truth."""
+
+    scheme: Scheme
+    """The scheme to optimize, its parameters are perturbed from the ground truth."""
+
+    ground_truth: Parameters
+    """The parameters used for the simulation."""
+
+    clp: dict[str, xr.DataArray]
+    """The conditionally linear parameters used for the simulation of each dataset."""
+
+    noise_free_data: dict[str, xr.Dataset]
+    """The simulated datasets before noise was added."""
+
+
+def generate_synthetic_scheme(
+    *,
+    time_size: int = 500,
+    spectral_size: int = 100,
+    nr_species: int = 3,
+    nr_datasets: int = 1,
+    sequential: bool = True,
+    link_clp: bool = True,
+    index_dependent_irf: bool = False,
+    nr_oscillations: int = 0,
+    nnls: bool = False,
+    noise_std_dev: float = 1e-3,
+    perturbation: float = 0.05,
+    seed: int | None = 0,
+) -> SyntheticScheme:
+    """Generate a scheme of decays with a gaussian irf and gaussian species spectra.
+
+    Parameters
+    ----------
+    time_size : int
+        The number of points on the time axis.
+    spectral_size : int
+        The number of points on the spectral axis.
+    nr_species : int
+        The number of decaying species.
+    nr_datasets : int
+        The number of datasets, each has its own irf center.
+    sequential : bool
+        Whether the species decay sequentially or in parallel.
+    link_clp : bool
+        Whether the clp of the datasets are linked. If ``False`` the spectral axes of the
+        datasets are shifted against each other.
+    index_dependent_irf : bool
+        Whether to use an irf with a spectral dispersion of the center.
+    nr_oscillations : int
+        The number of damped oscillations added to each dataset.
+    nnls : bool
+        Whether to use the non-negative least squares residual function.
+    noise_std_dev : float
+        The standard deviation of the gaussian noise, no noise is added if it is 0.
+    perturbation : float
+        The relative perturbation of the start values of the scheme parameters.
+    seed : int | None
+        The seed for the noise and the perturbation of the start values.
+
+    Returns
+    -------
+    SyntheticScheme
+        The generated scheme with its ground truth.
+    """
+    species = [f"species_{i+1}" for i in range(nr_species)]
+    oscillations = [f"osc_{i+1}" for i in range(nr_oscillations)]
+    dataset_labels = [f"dataset_{i+1}" for i in range(nr_datasets)]
+
+    ground_truth = Parameters.from_dict(
+        _generate_parameters(species, oscillations, dataset_labels, index_dependent_irf)
+    )
+    model = SyntheticModel(
+        **_generate_model(
+            species,
+            oscillations,
+            dataset_labels,
+            sequential=sequential,
+            link_clp=link_clp,
+            index_dependent_irf=index_dependent_irf,
+            nnls=nnls,
+        )
+    )
+
+    time_axis = np.linspace(-1, 20, time_size)
+    spectral_step = 300 / spectral_size
+    perturbation_seed, *dataset_seeds = spawn_noise_seeds(seed, nr_datasets + 1)
+
+    data = {}
+    noise_free_data = {}
+    clp = {}
+    for i, (label, dataset_seed) in enumerate(zip(dataset_labels, dataset_seeds)):
+        offset = 0 if link_clp else i * spectral_step / nr_datasets
+        spectral_axis = np.linspace(400, 700, spectral_size) + offset
+        clp[label] = _generate_clp(species, oscillations, spectral_axis)
+        coordinates = {"time": time_axis, "spectral": spectral_axis}
+        noise_free_data[label] = simulate(model, label, ground_truth, coordinates, clp=clp[label])
+        data[label] = noise_free_data[label].copy(deep=True)
+        if noise_std_dev > 0:
+            add_noise(data[label].data.to_numpy(), noise_std_dev, dataset_seed)
+
+    parameters = _perturb_parameters(ground_truth, perturbation, perturbation_seed)
+    return SyntheticScheme(
+        scheme=Scheme(model=model, parameters=parameters, data=data),
+        ground_truth=ground_truth,
+        clp=clp,
+        noise_free_data=noise_free_data,
+    )
+
+
+def _generate_parameters(
+    species: list[str],
+    oscillations: list[str],
+    dataset_labels: list[str],
+    index_dependent_irf: bool,
+) -> dict[str, Any]:
+    """Generate the parameter dictionary of the ground truth."""
+    rates = np.geomspace(2, 0.02, len(species))
+    parameters: dict[str, Any] = {
+        "rates": [[label, rate] for label, rate in zip(species, rates)],
+        "irf": [["width", 0.1]]
+        + [[f"center_{i+1}", 0.3 + 0.05 * i] for i in range(len(dataset_labels))],
+    }
+    if index_dependent_irf:
+        parameters["irf"] += [
+            ["dispersion_center", 550, {"vary": False}],
+            ["dispersion_1", 0.1],
+            ["dispersion_2", 0.02],
+        ]
+    if oscillations:
+        parameters["oscillation"] = [
+            [f"{label}_frequency", frequency]
+            for label, frequency in zip(oscillations, np.linspace(20, 100, len(oscillations)))
+        ] + [[f"{label}_rate", 1.0] for label in oscillations]
+    return parameters
+
+
+def _generate_model(
+    species: list[str],
+    oscillations: list[str],
+    dataset_labels: list[str],
+    *,
+    sequential: bool,
+    link_clp: bool,
+    index_dependent_irf: bool,
+    nnls: bool,
+) -> dict[str, Any]:
+    """Generate the model dictionary."""
+    megacomplexes: dict[str, Any] = {
+        "decay": {
+            "type": "decay-sequential" if sequential else "decay-parallel",
+            "compartments": species,
+            "rates": [f"rates.{label}" for label in species],
+        }
+    }
+    if oscillations:
+        megacomplexes["oscillation"] = {
+            "type": "damped-oscillation",
+            "labels": oscillations,
+            "frequencies": [f"oscillation.{label}_frequency" for label in oscillations],
+            "rates": [f"oscillation.{label}_rate" for label in oscillations],
+        }
+
+    irfs: dict[str, Any] = {}
+    for i, _ in enumerate(dataset_labels):
+        irfs[f"irf_{i+1}"] = {
+            "type": "gaussian",
+            "center": f"irf.center_{i+1}",
+            "width": "irf.width",
+        }
+        if index_dependent_irf:
+            irfs[f"irf_{i+1}"] |= {
+                "type": "spectral-gaussian",
+                "dispersion_center": "irf.dispersion_center",
+                "center_dispersion_coefficients": ["irf.dispersion_1", "irf.dispersion_2"],
+            }
+
+    return {
+        "dataset_groups": {
+            "default": {
+                "residual_function": "non_negative_least_squares"
+                if nnls
+                else "variable_projection",
+                "link_clp": link_clp,
+            }
+        },
+        "megacomplex": megacomplexes,
+        "irf": irfs,
+        "dataset": {
+            label: {"megacomplex": list(megacomplexes), "irf": f"irf_{i+1}"}
+            for i, label in enumerate(dataset_labels)
+        },
+    }
+
+
+def _generate_clp(
+    species: list[str], oscillations: list[str], spectral_axis: np.ndarray
+) -> xr.DataArray:
+    """Generate gaussian spectra for all species and oscillations."""
+    clp_labels = (
+        species
+        + [f"{label}_cos" for label in oscillations]
+        + [f"{label}_sin" for label in oscillations]
+    )
+    locations = np.linspace(450, 650, len(clp_labels))
+    amplitudes = np.ones(len(clp_labels))
+    amplitudes[len(species) :] = 0.1
+    spectra = amplitudes * np.exp(
+        -np.log(2) * np.square(2 * np.subtract.outer(spectral_axis, locations) / 80)
+    )
+    return xr.DataArray(spectra, coords=[("spectral", spectral_axis), ("clp_label", clp_labels)])
+
+
+def _perturb_parameters(
+    ground_truth: Parameters, perturbation: float, seed: np.random.SeedSequence
+) -> Parameters:
+    """Perturb the values of the ground truth parameters, which are not fixed."""
+    generator = np.random.default_rng(seed)
+    parameters = ground_truth.copy()
+    for parameter in parameters.all():
+        if parameter.vary:
+            parameter.value *= 1 + perturbation * generator.uniform(-1, 1)
+    return parameters
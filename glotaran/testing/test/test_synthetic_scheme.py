@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from glotaran.optimization.optimize import optimize
+from glotaran.testing.simulated_data.synthetic_scheme import generate_synthetic_scheme
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"sequential": False, "nnls": True},
+        {"nr_datasets": 2, "link_clp": False},
+        {"nr_datasets": 2, "index_dependent_irf": True, "nr_oscillations": 2},
+    ],
+)
+def test_generate_synthetic_scheme(options: dict):
+    synthetic = generate_synthetic_scheme(time_size=50, spectral_size=20, **options)
+    scheme = synthetic.scheme
+    assert scheme.valid()
+    assert len(scheme.data) == options.get("nr_datasets", 1)
+
+    for label, dataset in scheme.data.items():
+        assert dataset.data.shape == (50, 20)
+        noise = dataset.data - synthetic.noise_free_data[label].data
+        assert 0 < np.std(noise) < 2e-3
+        assert set(synthetic.clp[label].clp_label.values) >= {"species_1", "species_3"}
+
+    if not options.get("link_clp", True):
+        assert not np.array_equal(
+            scheme.data["dataset_1"].spectral, scheme.data["dataset_2"].spectral
+        )
+
+    for parameter in synthetic.ground_truth.all():
+        start_value = scheme.parameters.get(parameter.label).value
+        if parameter.vary:
+            assert start_value != parameter.value
+            assert start_value == pytest.approx(parameter.value, rel=0.05)
+        else:
+            assert start_value == parameter.value
+
+
+def test_generate_synthetic_scheme_reproducible():
+    first = generate_synthetic_scheme(time_size=30, spectral_size=10, seed=1)
+    second = generate_synthetic_scheme(time_size=30, spectral_size=10, seed=1)
+    other = generate_synthetic_scheme(time_size=30, spectral_size=10, seed=2)
+
+    assert np.array_equal(
+        first.scheme.data["dataset_1"].data, second.scheme.data["dataset_1"].data
+    )
+    assert not np.array_equal(
+        first.scheme.data["dataset_1"].data, other.scheme.data["dataset_1"].data
+    )
+    assert first.scheme.parameters == second.scheme.parameters
+
+
+def test_synthetic_scheme_ground_truth():
+    synthetic = generate_synthetic_scheme(time_size=200, spectral_size=30, noise_std_dev=0)
+    result = optimize(synthetic.scheme, verbose=False)
+
+    assert result.success
+    for parameter in synthetic.ground_truth.all():
+        assert result.optimized_parameters.get(parameter.label).value == pytest.approx(
+            parameter.value, rel=1e-4
+        )
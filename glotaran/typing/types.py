@@ -1,7 +1,15 @@
-"""Glotaran types module containing commonly used types."""
+"""Glotaran types module containing commonly used types.
+
+The type aliases using :mod:`xarray` are created on first access (:pep:`562`),
+so importing this module doesn't import :mod:`xarray`.
+"""
+from __future__ import annotations
+
 from collections.abc import Mapping
 from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import TypeVar
 from typing import Union
 
@@ -13,12 +21,34 @@ except ImportError:
     # numpy < 1.23
     from numpy.typing._array_like import _SupportsArray  # type:ignore[no-redef]
 
-import xarray as xr
+from glotaran.utils.lazy_import import lazy_module_values
+
+if TYPE_CHECKING:
+    import xarray as xr
+
+    LoadableDataset = Union["StrOrPath", xr.Dataset, xr.DataArray]
+    DatasetMappable = Union[
+        LoadableDataset, Sequence[LoadableDataset], Mapping[str, LoadableDataset]
+    ]
 
 T = TypeVar("T")
 StrOrPath = Union[str, Path]
-LoadableDataset = Union[StrOrPath, xr.Dataset, xr.DataArray]
-DatasetMappable = Union[LoadableDataset, Sequence[LoadableDataset], Mapping[str, LoadableDataset]]
 
 
 ArrayLike = np.ndarray
+
+
+def _loadable_dataset() -> Any:
+    import xarray as xr
+
+    return Union[StrOrPath, xr.Dataset, xr.DataArray]
+
+
+def _dataset_mappable() -> Any:
+    loadable_dataset = __getattr__("LoadableDataset")
+    return Union[loadable_dataset, Sequence[loadable_dataset], Mapping[str, loadable_dataset]]
+
+
+__getattr__ = lazy_module_values(
+    __name__, {"LoadableDataset": _loadable_dataset, "DatasetMappable": _dataset_mappable}
+)
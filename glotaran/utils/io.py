@@ -6,6 +6,8 @@ import contextlib
 import html
 import inspect
 import os
+import shutil
+import threading
 from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import Sequence
@@ -29,7 +31,9 @@ if TYPE_CHECKING:
     from glotaran.typing.types import StrOrPath
 
 
-def _load_datasets(dataset_mappable: DatasetMappable, index: int = 1) -> dict[str, xr.Dataset]:
+def _load_datasets(
+    dataset_mappable: DatasetMappable, index: int = 1, **load_kwargs: Any
+) -> dict[str, xr.Dataset]:
     """Implement functionality for ``load_datasets`` and  internal use.
 
     Parameters
@@ -39,6 +43,8 @@ def _load_datasets(dataset_mappable: DatasetMappable, index: int = 1) -> dict[st
     index : int
         Index used to create key and ``source_path`` if not present.
         , by default 1
+    **load_kwargs : Any
+        Keyword arguments passed to ``load_dataset`` for datasets given as file path.
 
     Returns
     -------
@@ -52,7 +58,9 @@ def _load_datasets(dataset_mappable: DatasetMappable, index: int = 1) -> dict[st
     """
     dataset_mapping = {}
     if isinstance(dataset_mappable, (str, Path)):
-        dataset_mapping[Path(dataset_mappable).stem] = load_dataset(dataset_mappable)
+        dataset_mapping[Path(dataset_mappable).stem] = load_dataset(
+            dataset_mappable, **load_kwargs
+        )
     elif isinstance(dataset_mappable, (xr.Dataset, xr.DataArray)):
         if isinstance(dataset_mappable, xr.DataArray):
             dataset_mappable: xr.Dataset = dataset_mappable.to_dataset(  # type:ignore[no-redef]
@@ -63,11 +71,11 @@ def _load_datasets(dataset_mappable: DatasetMappable, index: int = 1) -> dict[st
         dataset_mapping[Path(dataset_mappable.source_path).stem] = dataset_mappable
     elif isinstance(dataset_mappable, Sequence):
         for index, dataset in enumerate(dataset_mappable, start=1):
-            key, value = next(iter(_load_datasets(dataset, index=index).items()))
+            key, value = next(iter(_load_datasets(dataset, index=index, **load_kwargs).items()))
             dataset_mapping[key] = value
     elif isinstance(dataset_mappable, Mapping):
         for key, dataset in dataset_mappable.items():
-            _, value = next(iter(_load_datasets(dataset).items()))
+            _, value = next(iter(_load_datasets(dataset, **load_kwargs).items()))
             dataset_mapping[key] = value
     else:
         raise TypeError(
@@ -96,20 +104,25 @@ class DatasetMapping(MutableMapping):
                 self[key] = dataset
 
     @classmethod
-    def loader(cls: type[DatasetMapping], dataset_mappable: DatasetMappable) -> DatasetMapping:
+    def loader(
+        cls: type[DatasetMapping], dataset_mappable: DatasetMappable, **load_kwargs: Any
+    ) -> DatasetMapping:
         """Loader function utilized by ``file_loadable_field``.
 
         Parameters
         ----------
         dataset_mappable : DatasetMappable
             Mapping of datasets to initialize :class:`DatasetMapping`.
+        **load_kwargs : Any
+            Keyword arguments passed to ``load_dataset`` for datasets given as file path,
+            e.g. ``lazy=True`` for NetCDF files.
 
         Returns
         -------
         DatasetMapping
             Populated instance of :class:`DatasetMapping`.
         """
-        return cls(_load_datasets(dataset_mappable))
+        return cls(_load_datasets(dataset_mappable, **load_kwargs))
 
     @property
     def source_path(self):
@@ -172,7 +185,7 @@ class DatasetMapping(MutableMapping):
         return f"<pre>{html.escape(repr(self))}</pre>\n{''.join(items)}"
 
 
-def load_datasets(dataset_mappable: DatasetMappable) -> DatasetMapping:
+def load_datasets(dataset_mappable: DatasetMappable, **load_kwargs: Any) -> DatasetMapping:
     """Load multiple datasets into a mapping (convenience function).
 
     This is used for ``file_loadable_field`` of a dataset mapping e.g.
@@ -182,6 +195,9 @@ def load_datasets(dataset_mappable: DatasetMappable) -> DatasetMapping:
     ----------
     dataset_mappable : DatasetMappable
         Single dataset/file path to a dataset or sequence or mapping of it.
+    **load_kwargs : Any
+        Keyword arguments passed to ``load_dataset`` for datasets given as file path,
+        e.g. ``lazy=True`` for NetCDF files.
 
     Returns
     -------
@@ -189,7 +205,7 @@ def load_datasets(dataset_mappable: DatasetMappable) -> DatasetMapping:
         Mapping of dataset with string keys, where datasets hare ensured to have
         the ``source_path`` attr.
     """
-    return DatasetMapping.loader(dataset_mappable)
+    return DatasetMapping.loader(dataset_mappable, **load_kwargs)
 
 
 @contextmanager
@@ -223,6 +239,45 @@ def chdir_context(folder_path: StrOrPath) -> Generator[Path, None, None]:
         os.chdir(original_dir)
 
 
+@contextmanager
+def atomic_write_path(file_path: StrOrPath) -> Generator[Path, None, None]:
+    """Context manager providing a temporary path which replaces ``file_path`` on exit.
+
+    The temporary path is in the same folder as ``file_path`` and keeps its suffix, so
+    other processes only ever see the previous or the completely written file.
+    Folders (e.g. zarr stores) are swapped with two renames, which makes them
+    disappear for a moment but never be incomplete. If an exception is raised the
+    temporary path is removed and ``file_path`` is left unchanged.
+
+    Parameters
+    ----------
+    file_path: StrOrPath
+        Path of the file or folder to write.
+
+    Yields
+    ------
+    Generator[Path, None, None]
+        Temporary path to write to.
+    """
+    file_path = Path(file_path)
+    token = f"{os.getpid()}-{threading.get_ident()}"
+    temporary_path = file_path.with_name(f".{file_path.stem}.{token}.tmp{file_path.suffix}")
+    try:
+        yield temporary_path
+        if temporary_path.is_dir() and file_path.is_dir():
+            previous_path = temporary_path.with_name(f"{temporary_path.name}.old")
+            os.replace(file_path, previous_path)
+            os.replace(temporary_path, file_path)
+            shutil.rmtree(previous_path)
+        else:
+            os.replace(temporary_path, file_path)
+    finally:
+        if temporary_path.is_dir():
+            shutil.rmtree(temporary_path)
+        else:
+            temporary_path.unlink(missing_ok=True)
+
+
 def relative_posix_path(source_path: StrOrPath, base_path: StrOrPath | None = None) -> str:
     """Ensure that ``source_path`` is a posix path, relative to ``base_path`` if defined.
 
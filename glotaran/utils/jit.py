@@ -0,0 +1,108 @@
+"""Module containing helpers for numba compiled kernels."""
+from __future__ import annotations
+
+import os
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numba as nb
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from numba.core.dispatcher import Dispatcher
+
+EAGER_JIT_ENV_VARIABLE = "GLOTARAN_EAGER_JIT"
+"""Environment variable which enables compilation of the kernel signatures at import time."""
+
+__KernelRegistry: dict[str, tuple[Dispatcher, tuple[str, ...]]] = {}
+
+
+def jit_kernel(
+    *signatures: str, parallel: bool = False, **jit_options: Any
+) -> Callable[[Callable], Dispatcher]:
+    """Compile a function in numba's nopython mode with on-disk caching.
+
+    The compiled kernel is registered, so all kernels can be compiled ahead of their
+    first call with :func:`precompile_kernels`.
+    If the environment variable ``GLOTARAN_EAGER_JIT`` is set, the ``signatures`` are
+    compiled when the kernel is defined.
+
+    Calls with argument types not covered by ``signatures`` are still compiled lazily.
+
+    Parameters
+    ----------
+    *signatures: str
+        Numba signatures of the typical calls of the kernel (e.g. ``"float64(float64)"``).
+    parallel: bool
+        Whether to enable numba's automatic parallelization. Defaults to False.
+    **jit_options: Any
+        Additional options passed on to :func:`numba.jit`.
+
+    Returns
+    -------
+    Callable[[Callable], Dispatcher]
+        Decorator compiling the function.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        @jit_kernel("void(float64[:, ::1], float64[::1])", parallel=True)
+        def kernel(matrix, axis):
+            ...
+    """
+
+    def decorator(function: Callable) -> Dispatcher:
+        """Compile and register ``function``.
+
+        Parameters
+        ----------
+        function: Callable
+            Python implementation of the kernel.
+
+        Returns
+        -------
+        Dispatcher
+            Compiled kernel.
+        """
+        kernel = nb.jit(nopython=True, cache=True, parallel=parallel, **jit_options)(function)
+        __KernelRegistry[f"{function.__module__}.{function.__qualname__}"] = (kernel, signatures)
+        if os.environ.get(EAGER_JIT_ENV_VARIABLE, "0") != "0":
+            for signature in signatures:
+                kernel.compile(signature)
+        return kernel
+
+    return decorator
+
+
+def registered_kernels() -> list[str]:
+    """Get the full names of all registered kernels.
+
+    Returns
+    -------
+    list[str]
+        Full names of the registered kernels.
+    """
+    return sorted(__KernelRegistry)
+
+
+def precompile_kernels() -> dict[str, float]:
+    """Compile all registered kernels for their signatures.
+
+    Kernels which are cached on disk are only loaded from the cache.
+
+    Returns
+    -------
+    dict[str, float]
+        Mapping of kernel names to the time in seconds it took to compile or load them.
+    """
+    timings = {}
+    for name in registered_kernels():
+        kernel, signatures = __KernelRegistry[name]
+        start = perf_counter()
+        for signature in signatures:
+            kernel.compile(signature)
+        timings[name] = perf_counter() - start
+    return timings
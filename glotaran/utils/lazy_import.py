@@ -0,0 +1,82 @@
+"""Helpers to lazily import module attributes following :pep:`562`.
+
+This module must only use the standard library, since it is used to avoid
+importing heavy dependencies at import time.
+"""
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_module_attributes(
+    module_name: str, attribute_modules: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Create ``__getattr__``, ``__dir__`` and ``__all__`` of a module with lazy attributes.
+
+    The attributes are imported from their module on first access and then
+    set on the module, so later accesses don't go through ``__getattr__``.
+
+    Parameters
+    ----------
+    module_name: str
+        Name of the module the attributes belong to, i.e. ``__name__``.
+    attribute_modules: Mapping[str, str]
+        Mapping of attribute names to the name of the module they are imported from.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]
+        Module ``__getattr__`` and ``__dir__`` functions and ``__all__``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        __getattr__, __dir__, __all__ = lazy_module_attributes(
+            __name__, {"Scheme": "glotaran.project.scheme"}
+        )
+    """
+
+    def __getattr__(attribute_name: str) -> Any:
+        if attribute_name not in attribute_modules:
+            raise AttributeError(f"module {module_name!r} has no attribute {attribute_name!r}")
+        value = getattr(import_module(attribute_modules[attribute_name]), attribute_name)
+        setattr(sys.modules[module_name], attribute_name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attribute_modules))
+
+    return __getattr__, __dir__, list(attribute_modules)
+
+
+def lazy_module_values(
+    module_name: str, value_factories: Mapping[str, Callable[[], Any]]
+) -> Callable[[str], Any]:
+    """Create ``__getattr__`` of a module with values which are created on first access.
+
+    Parameters
+    ----------
+    module_name: str
+        Name of the module the values belong to, i.e. ``__name__``.
+    value_factories: Mapping[str, Callable[[], Any]]
+        Mapping of attribute names to functions creating the value.
+
+    Returns
+    -------
+    Callable[[str], Any]
+        Module ``__getattr__`` function.
+    """
+
+    def __getattr__(attribute_name: str) -> Any:
+        if attribute_name not in value_factories:
+            raise AttributeError(f"module {module_name!r} has no attribute {attribute_name!r}")
+        value = value_factories[attribute_name]()
+        setattr(sys.modules[module_name], attribute_name, value)
+        return value
+
+    return __getattr__
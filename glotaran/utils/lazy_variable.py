@@ -0,0 +1,142 @@
+"""Variables of datasets which are calculated on first access."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+from xarray.backends import BackendArray
+from xarray.core import indexing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+    from collections.abc import Sequence
+    from typing import Any
+
+    from numpy.typing import DTypeLike
+
+
+class DerivedArray(BackendArray):
+    """Array whose values are calculated on first access and then kept in memory."""
+
+    def __init__(
+        self, calculate: Callable[[], np.ndarray], shape: tuple[int, ...], dtype: DTypeLike
+    ):
+        """Initialize a derived array.
+
+        Parameters
+        ----------
+        calculate: Callable[[], np.ndarray]
+            Function calculating the values of the array.
+        shape: tuple[int, ...]
+            Shape of the calculated values.
+        dtype: DTypeLike
+            Dtype of the calculated values.
+        """
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self._calculate: Callable[[], np.ndarray] | None = calculate
+        self._values: np.ndarray | None = None
+
+    @property
+    def is_calculated(self) -> bool:
+        """Whether the values have been calculated.
+
+        Returns
+        -------
+        bool
+        """
+        return self._values is not None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Calculate the values before pickling, since the calculation might not be picklable.
+
+        Returns
+        -------
+        dict[str, Any]
+            The state with the calculated values.
+        """
+        self._getitem(())
+        return self.__dict__.copy()
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> np.ndarray:
+        """Calculate the values if needed and index them.
+
+        Parameters
+        ----------
+        key: indexing.ExplicitIndexer
+            The index.
+
+        Returns
+        -------
+        np.ndarray
+            The indexed values.
+        """
+        return indexing.explicit_indexing_adapter(
+            key, self.shape, indexing.IndexingSupport.OUTER, self._getitem
+        )
+
+    def _getitem(self, key: tuple) -> np.ndarray:
+        """Index the calculated values with a basic or outer index."""
+        if self._values is None:
+            values = np.asarray(self._calculate(), dtype=self.dtype)  # type:ignore[misc]
+            if values.shape != self.shape:
+                raise ValueError(
+                    f"Calculated values have the shape {values.shape}, expected {self.shape}."
+                )
+            # The calculation might reference large arrays, which are not needed anymore
+            self._values, self._calculate = values, None
+        return self._values[key]
+
+
+def lazy_variable(
+    dims: Sequence[Hashable],
+    shape: tuple[int, ...],
+    dtype: DTypeLike,
+    calculate: Callable[[], np.ndarray],
+) -> xr.Variable:
+    """Create a variable whose values are calculated on first access.
+
+    The values are calculated when they are accessed (e.g. with ``.values``, in
+    arithmetic or when the dataset is saved or pickled) and then kept in memory.
+
+    Parameters
+    ----------
+    dims: Sequence[Hashable]
+        Dimensions of the variable.
+    shape: tuple[int, ...]
+        Shape of the calculated values.
+    dtype: DTypeLike
+        Dtype of the calculated values.
+    calculate: Callable[[], np.ndarray]
+        Function calculating the values.
+
+    Returns
+    -------
+    xr.Variable
+        The lazy variable.
+    """
+    return xr.Variable(
+        dims, indexing.LazilyIndexedArray(DerivedArray(calculate, tuple(shape), dtype))
+    )
+
+
+def is_lazy_variable(variable: xr.Variable | xr.DataArray) -> bool:
+    """Check if a variable was created with :func:`lazy_variable` and is not calculated yet.
+
+    Parameters
+    ----------
+    variable: xr.Variable | xr.DataArray
+        The variable to check.
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(variable, xr.DataArray):
+        variable = variable.variable
+    data = variable._data
+    while isinstance(data, (indexing.LazilyIndexedArray, indexing.MemoryCachedArray)):
+        data = data.array
+    return isinstance(data, DerivedArray) and not data.is_calculated
@@ -0,0 +1,124 @@
+"""Opt-in profiling of the stages of an optimization."""
+from __future__ import annotations
+
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+import pandas as pd
+
+from glotaran.utils.tracing import TraceHook
+from glotaran.utils.tracing import trace_hooks
+
+PROFILE_COLUMNS = ["stage", "dataset", "calls", "wall_time", "allocated_bytes"]
+"""Columns of the table created by :meth:`StageProfiler.to_dataframe`."""
+
+
+class StageProfiler(TraceHook):
+    """Record wall time, number of calls and allocated memory of named stages.
+
+    The records are aggregated by stage and the ``dataset`` attribute of the spans.
+    Stages are recorded with :func:`glotaran.utils.tracing.trace_span` while the profiler
+    is activated with :meth:`activate`.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        """Initialize a profiler.
+
+        Parameters
+        ----------
+        track_memory: bool
+            Whether to record the peak memory allocated in a stage with :mod:`tracemalloc`.
+            This slows down the calculation considerably. Defaults to False.
+        """
+        self.track_memory = track_memory
+        self._records: dict[tuple[str, str], list[float]] = {}
+        self._stack: list[list[float]] = []
+
+    @contextmanager
+    def activate(self) -> Iterator[StageProfiler]:
+        """Activate the profiler for the current context.
+
+        Yields
+        ------
+        StageProfiler
+            The activated profiler.
+        """
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            with trace_hooks(self):
+                yield self
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    def begin_span(self, name: str, attributes: dict[str, Any]):
+        """Start recording a stage.
+
+        Parameters
+        ----------
+        name: str
+            Name of the stage.
+        attributes: dict[str, Any]
+            Attributes of the stage.
+        """
+        current = 0
+        if self.track_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent[2] = max(parent[2], peak)
+            tracemalloc.reset_peak()
+        self._stack.append([perf_counter(), current, current])
+
+    def end_span(self, name: str, attributes: dict[str, Any]):
+        """Record a stage.
+
+        Parameters
+        ----------
+        name: str
+            Name of the stage.
+        attributes: dict[str, Any]
+            Attributes of the stage, the ``dataset`` attribute is used to group the records.
+        """
+        start, start_memory, child_peak = self._stack.pop()
+        wall_time = perf_counter() - start
+        allocated_bytes = 0
+        if self.track_memory and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], child_peak)
+            allocated_bytes = peak - start_memory
+            if self._stack:
+                parent = self._stack[-1]
+                parent[2] = max(parent[2], peak)
+        record = self._records.setdefault((name, attributes.get("dataset", "")), [0, 0.0, 0])
+        record[0] += 1
+        record[1] += wall_time
+        record[2] = max(record[2], allocated_bytes)
+
+    def reset(self):
+        """Remove all records."""
+        self._records.clear()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Create a table of the aggregated records.
+
+        The ``allocated_bytes`` column contains the maximum over all calls of the peak memory
+        allocated during a call of a stage.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with the columns ``stage``, ``dataset``, ``calls``, ``wall_time`` and
+            ``allocated_bytes``.
+        """
+        return pd.DataFrame(
+            [
+                [name, dataset, int(calls), wall_time, int(allocated_bytes)]
+                for (name, dataset), (calls, wall_time, allocated_bytes) in self._records.items()
+            ],
+            columns=PROFILE_COLUMNS,
+        )
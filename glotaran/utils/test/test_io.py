@@ -20,6 +20,7 @@ from glotaran.project.result import Result
 from glotaran.testing.simulated_data.sequential_spectral_decay import SCHEME
 from glotaran.testing.simulated_data.shared_decay import SPECTRAL_AXIS
 from glotaran.utils.io import DatasetMapping
+from glotaran.utils.io import atomic_write_path
 from glotaran.utils.io import chdir_context
 from glotaran.utils.io import create_clp_guide_dataset
 from glotaran.utils.io import load_datasets
@@ -164,6 +165,18 @@ def test_load_datasets_mapping(dummy_datasets: tuple[Path, xr.Dataset, xr.Datase
     assert result.source_path["ds2"] == (tmp_path / "ds2_file.nc").as_posix()
 
 
+def test_load_datasets_load_kwargs(dummy_datasets: tuple[Path, xr.Dataset, xr.Dataset]):
+    """Keyword arguments are passed to ``load_dataset``."""
+    tmp_path, ds1, _ = dummy_datasets
+
+    result = load_datasets({"ds1": tmp_path / "ds1_file.nc"}, lazy=True)
+
+    assert np.all(result["ds1"].data == ds1.data)
+    # Lazily loaded values are read from file on each access instead of being kept in memory
+    assert not np.shares_memory(result["ds1"].data.values, result["ds1"].data.values)
+    result["ds1"].close()
+
+
 def test_load_datasets_wrong_type():
     """Raise TypeError for not supported type"""
     with pytest.raises(
@@ -245,6 +258,39 @@ def test_chdir_context_exception(tmp_path: Path):
     )
 
 
+def test_atomic_write_path(tmp_path: Path):
+    """Files and folders are replaced when they are completely written."""
+    file_path = tmp_path / "result.csv"
+    file_path.write_text("old")
+    with atomic_write_path(file_path) as temporary_path:
+        assert temporary_path.parent == tmp_path
+        assert temporary_path.suffix == ".csv"
+        temporary_path.write_text("new")
+        assert file_path.read_text() == "old"
+    assert file_path.read_text() == "new"
+
+    folder_path = tmp_path / "dataset.zarr"
+    for content in ("old", "new"):
+        with atomic_write_path(folder_path) as temporary_path:
+            temporary_path.mkdir()
+            (temporary_path / "content").write_text(content)
+    assert (folder_path / "content").read_text() == "new"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["dataset.zarr", "result.csv"]
+
+
+def test_atomic_write_path_exception(tmp_path: Path):
+    """Temporary path is removed and the file is unchanged if writing fails."""
+    file_path = tmp_path / "result.csv"
+    file_path.write_text("old")
+    with pytest.raises(ValueError, match="failed"):
+        with atomic_write_path(file_path) as temporary_path:
+            temporary_path.write_text("partial")
+            raise ValueError("failed")
+
+    assert file_path.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
 @pytest.mark.skipif(not sys.platform.startswith("win32"), reason="Only needed for Windows")
 def test_relative_posix_path_windows_diff_drives():
     """os.path.relpath doesn't cause crash when files are on different drives."""
@@ -0,0 +1,44 @@
+"""Tests for ``glotaran.utils.jit``."""
+import numpy as np
+import pytest
+
+from glotaran.utils import jit
+from glotaran.utils.jit import EAGER_JIT_ENV_VARIABLE
+from glotaran.utils.jit import jit_kernel
+from glotaran.utils.jit import precompile_kernels
+from glotaran.utils.jit import registered_kernels
+
+
+@jit_kernel("float64(float64[::1])")
+def dummy_kernel(values):
+    """Sum up values."""
+    return np.sum(values)
+
+
+def test_jit_kernel():
+    """Kernel gets registered and compiles lazily for other types."""
+    assert f"{__name__}.dummy_kernel" in registered_kernels()
+    assert dummy_kernel(np.arange(4, dtype=np.float64)) == 6
+    assert dummy_kernel(np.arange(4)) == 6
+
+
+def test_precompile_kernels():
+    """Registered signatures are compiled."""
+    timings = precompile_kernels()
+
+    assert f"{__name__}.dummy_kernel" in timings
+    assert len(dummy_kernel.signatures) > 0
+
+
+def test_jit_kernel_eager(monkeypatch: pytest.MonkeyPatch):
+    """Signatures are compiled at definition if the environment variable is set."""
+    monkeypatch.setenv(EAGER_JIT_ENV_VARIABLE, "1")
+    # Keep the test kernel out of the registry used by later precompilations
+    monkeypatch.setattr(jit, "__KernelRegistry", {})
+
+    @jit_kernel("int64(int64)")
+    def eager_kernel(value):
+        return value + 1
+
+    assert len(eager_kernel.signatures) == 1
+    assert registered_kernels() == [f"{__name__}.{eager_kernel.__qualname__}"]
@@ -0,0 +1,88 @@
+"""Tests for glotaran/utils/lazy_import.py"""
+from __future__ import annotations
+
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+from glotaran.utils.lazy_import import lazy_module_attributes
+from glotaran.utils.lazy_import import lazy_module_values
+
+
+@pytest.fixture
+def lazy_module(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Module with a lazy attribute and a lazy value."""
+    module = ModuleType("lazy_test_module")
+    module.eager = 1
+    module.__getattr__, module.__dir__, module.__all__ = lazy_module_attributes(
+        module.__name__, {"OrderedDict": "collections"}
+    )
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+def test_lazy_module_attributes(lazy_module: ModuleType):
+    """Attributes are imported on first access and set on the module."""
+    from collections import OrderedDict
+
+    assert lazy_module.__all__ == ["OrderedDict"]
+    assert dir(lazy_module) == sorted([*vars(lazy_module), "OrderedDict"])
+    assert "OrderedDict" not in vars(lazy_module)
+
+    assert lazy_module.OrderedDict is OrderedDict
+    assert vars(lazy_module)["OrderedDict"] is OrderedDict
+
+    with pytest.raises(AttributeError, match="'lazy_test_module' has no attribute 'missing'"):
+        lazy_module.missing
+
+
+def test_lazy_module_values(lazy_module: ModuleType):
+    """Values are created once on first access."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    lazy_module.__getattr__ = lazy_module_values(lazy_module.__name__, {"VALUE": factory})
+
+    assert lazy_module.VALUE == "value"
+    assert lazy_module.VALUE == "value"
+    assert len(calls) == 1
+
+    with pytest.raises(AttributeError, match="'lazy_test_module' has no attribute 'missing'"):
+        lazy_module.missing
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ("import glotaran", "import glotaran.io", "import glotaran.project"),
+)
+def test_import_does_not_import_xarray(statement: str):
+    """Importing the entry points doesn't import the heavy dependencies."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print('xarray' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_export_does_not_shadow_submodule():
+    """Importing ``optimize`` from ``glotaran.optimization`` always gives the submodule."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from glotaran.optimization import optimize; print(type(optimize).__name__)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "module"
@@ -0,0 +1,62 @@
+"""Tests for glotaran/utils/lazy_variable.py"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from glotaran.utils.lazy_variable import is_lazy_variable
+from glotaran.utils.lazy_variable import lazy_variable
+
+
+@pytest.fixture
+def calls() -> list[int]:
+    """Record of the calculations."""
+    return []
+
+
+@pytest.fixture
+def dataset(calls: list[int]) -> xr.Dataset:
+    """Dataset with a lazy variable."""
+
+    def calculate():
+        calls.append(1)
+        return np.arange(12).reshape(3, 4)
+
+    dataset = xr.Dataset(coords={"x": [1, 2, 3], "y": [1, 2, 3, 4]})
+    dataset["lazy"] = lazy_variable(("x", "y"), (3, 4), np.float64, calculate)
+    return dataset
+
+
+def test_lazy_variable(dataset: xr.Dataset, calls: list[int]):
+    """Values are calculated once on first access."""
+    assert is_lazy_variable(dataset.lazy)
+    assert dataset.lazy.dtype == np.float64
+    assert "lazy" in repr(dataset)
+    assert calls == []
+
+    np.testing.assert_equal(dataset.lazy.isel(x=[0, 2], y=1).values, [1.0, 9.0])
+    assert not is_lazy_variable(dataset.lazy)
+    assert float((dataset.lazy * 2).sum()) == 132
+    assert calls == [1]
+
+
+def test_lazy_variable_save(dataset: xr.Dataset, calls: list[int], tmp_path: Path):
+    """Values are calculated on save."""
+    dataset.to_netcdf(tmp_path / "lazy.nc")
+
+    np.testing.assert_equal(
+        xr.load_dataset(tmp_path / "lazy.nc").lazy, np.arange(12).reshape(3, 4)
+    )
+    assert calls == [1]
+
+
+def test_lazy_variable_wrong_shape():
+    """Values with an unexpected shape raise."""
+    variable = lazy_variable(("x",), (3,), np.float64, lambda: np.ones(2))
+
+    with pytest.raises(ValueError, match=r"Calculated values have the shape \(2,\)"):
+        variable.values
+    assert not is_lazy_variable(xr.Variable(("x",), np.ones(2)))
@@ -0,0 +1,48 @@
+"""Tests for ``glotaran.utils.profiling``."""
+import numpy as np
+
+from glotaran.utils.profiling import PROFILE_COLUMNS
+from glotaran.utils.profiling import StageProfiler
+from glotaran.utils.tracing import trace_span
+
+
+def test_stage_profiler_records():
+    """Calls are aggregated by stage and dataset."""
+    profiler = StageProfiler()
+    with profiler.activate():
+        for _ in range(3):
+            with trace_span("outer"):
+                with trace_span("inner", dataset="dataset_1"):
+                    pass
+                with trace_span("inner", dataset="dataset_2"):
+                    pass
+    with trace_span("outer"):
+        pass
+
+    records = profiler.to_dataframe()
+    assert list(records.columns) == PROFILE_COLUMNS
+    assert records.shape == (3, 5)
+    records = records.set_index(["stage", "dataset"])
+    assert records.loc[("outer", ""), "calls"] == 3
+    assert records.loc[("inner", "dataset_1"), "calls"] == 3
+    assert (
+        records.loc[("outer", ""), "wall_time"] >= records.loc[("inner", "dataset_1"), "wall_time"]
+    )
+    assert (records["allocated_bytes"] == 0).all()
+
+    profiler.reset()
+    assert profiler.to_dataframe().empty
+
+
+def test_stage_profiler_track_memory():
+    """The peak allocation of nested stages is included in the outer stage."""
+    profiler = StageProfiler(track_memory=True)
+    with profiler.activate():
+        with trace_span("outer"):
+            with trace_span("inner"):
+                array = np.ones(100_000)
+            del array
+
+    records = profiler.to_dataframe().set_index("stage")
+    assert records.loc["inner", "allocated_bytes"] >= 800_000
+    assert records.loc["outer", "allocated_bytes"] >= records.loc["inner", "allocated_bytes"]
@@ -0,0 +1,100 @@
+"""Tests for ``glotaran.utils.tracing``."""
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from glotaran.optimization.optimize import optimize
+from glotaran.testing.simulated_data.sequential_spectral_decay import SCHEME
+from glotaran.utils.tracing import ChromeTraceWriter
+from glotaran.utils.tracing import TraceHook
+from glotaran.utils.tracing import trace_hooks
+from glotaran.utils.tracing import trace_span
+
+
+class RecordingHook(TraceHook):
+    def __init__(self, label: str, calls: list[tuple[str, str, str, dict[str, Any]]]):
+        self.label = label
+        self.calls = calls
+
+    def begin_span(self, name: str, attributes: dict[str, Any]):
+        self.calls.append((self.label, "begin", name, attributes))
+
+    def end_span(self, name: str, attributes: dict[str, Any]):
+        self.calls.append((self.label, "end", name, attributes))
+
+
+def test_trace_span_inactive():
+    """Without active hooks a shared no-op context manager is returned."""
+    assert trace_span("stage") is trace_span("other", dataset="dataset_1")
+
+
+def test_trace_hooks():
+    """Hooks are notified in order of activation and in reverse order at the end."""
+    calls: list[tuple[str, str, str, dict[str, Any]]] = []
+    with trace_hooks(RecordingHook("first", calls)):
+        with RecordingHook("second", calls).activate():
+            with trace_span("outer", dataset="dataset_1"):
+                with trace_span("inner"):
+                    pass
+        with trace_span("after"):
+            pass
+    with trace_span("inactive"):
+        pass
+
+    assert calls == [
+        ("first", "begin", "outer", {"dataset": "dataset_1"}),
+        ("second", "begin", "outer", {"dataset": "dataset_1"}),
+        ("first", "begin", "inner", {}),
+        ("second", "begin", "inner", {}),
+        ("second", "end", "inner", {}),
+        ("first", "end", "inner", {}),
+        ("second", "end", "outer", {"dataset": "dataset_1"}),
+        ("first", "end", "outer", {"dataset": "dataset_1"}),
+        ("first", "begin", "after", {}),
+        ("first", "end", "after", {}),
+    ]
+
+
+def test_chrome_trace_writer(tmp_path: Path):
+    """Events of a span are paired and numpy attributes are serialized."""
+    writer = ChromeTraceWriter()
+    with writer.activate():
+        with trace_span("stage", global_index_range=(np.int64(0), np.int64(10))):
+            pass
+    writer.save(tmp_path / "trace.json")
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [event["ph"] for event in events] == ["B", "E"]
+    assert events[0]["name"] == events[1]["name"] == "stage"
+    assert events[0]["args"] == {"global_index_range": [0, 10]}
+    assert events[0]["ts"] <= events[1]["ts"]
+
+
+def test_chrome_trace_writer_optimize():
+    """The trace of an optimization is properly nested."""
+    writer = ChromeTraceWriter()
+    with writer.activate():
+        optimize(replace(SCHEME, maximum_number_function_evaluations=1), raise_exception=True)
+
+    stack = []
+    for event in writer.events:
+        if event["ph"] == "B":
+            stack.append(event["name"])
+        else:
+            assert stack.pop() == event["name"]
+    assert not stack
+
+    names = {event["name"] for event in writer.events}
+    assert {
+        "Optimizer.optimize",
+        "Optimizer.objective_function",
+        "OptimizationGroup.calculate",
+        "MatrixProvider.calculate_dataset_matrix",
+        "EstimationProvider.estimate",
+        "Optimizer.create_result",
+    } <= names
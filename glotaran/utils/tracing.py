@@ -0,0 +1,221 @@
+"""Hooks to trace the stages of an optimization with external tools.
+
+The hot paths of the optimization are wrapped in spans with :func:`trace_span`.
+Every activated :class:`TraceHook` gets notified when a span begins and ends,
+which allows to attach profilers or trace writers without patching the code.
+
+Examples
+--------
+Writing a trace of an optimization, which can be viewed as flame chart in
+``chrome://tracing`` or https://ui.perfetto.dev:
+
+.. code-block:: python
+
+    writer = ChromeTraceWriter()
+    with writer.activate():
+        optimize(scheme)
+    writer.save("trace.json")
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from glotaran.typing import StrOrPath
+
+_NULL_CONTEXT = nullcontext()
+_ACTIVE_HOOKS: ContextVar[tuple[TraceHook, ...]] = ContextVar("active_trace_hooks", default=())
+
+
+class TraceHook:
+    """Base class of hooks which get notified about spans.
+
+    Subclasses override :meth:`begin_span` and :meth:`end_span`.
+    Spans are strictly nested, so they end in reverse order of their beginning.
+    """
+
+    def begin_span(self, name: str, attributes: dict[str, Any]):
+        """Notify the hook that a span begins.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        attributes: dict[str, Any]
+            Attributes of the span, e.g. the ``dataset`` label.
+        """
+
+    def end_span(self, name: str, attributes: dict[str, Any]):
+        """Notify the hook that a span ends.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        attributes: dict[str, Any]
+            Attributes of the span, e.g. the ``dataset`` label.
+        """
+
+    def activate(self) -> AbstractContextManager:
+        """Activate the hook for the current context.
+
+        Returns
+        -------
+        AbstractContextManager
+            Context manager in which the hook is active.
+        """
+        return trace_hooks(self)
+
+
+@contextmanager
+def trace_hooks(*hooks: TraceHook) -> Iterator[None]:
+    """Activate ``hooks`` in addition to the already active hooks.
+
+    Parameters
+    ----------
+    *hooks: TraceHook
+        Hooks to activate.
+
+    Yields
+    ------
+    None
+        Nothing, the hooks are deactivated when the context is left.
+    """
+    token = _ACTIVE_HOOKS.set(_ACTIVE_HOOKS.get() + hooks)
+    try:
+        yield
+    finally:
+        _ACTIVE_HOOKS.reset(token)
+
+
+class _Span:
+    """Context manager notifying hooks about the beginning and end of a span."""
+
+    __slots__ = ("hooks", "name", "attributes")
+
+    def __init__(self, hooks: tuple[TraceHook, ...], name: str, attributes: dict[str, Any]):
+        self.hooks = hooks
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        for hook in self.hooks:
+            hook.begin_span(self.name, self.attributes)
+
+    def __exit__(self, *exc_info):
+        for hook in reversed(self.hooks):
+            hook.end_span(self.name, self.attributes)
+
+
+def trace_span(name: str, **attributes: Any) -> AbstractContextManager:
+    """Wrap a stage in a span, which is reported to the active hooks.
+
+    If no hook is active this returns a shared no-op context manager,
+    so traced code has next to no overhead.
+
+    Parameters
+    ----------
+    name: str
+        Name of the span.
+    **attributes: Any
+        Attributes of the span, e.g. the ``dataset`` label.
+
+    Returns
+    -------
+    AbstractContextManager
+        Context manager wrapping the span.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with trace_span("MatrixProvider.calculate_dataset_matrix", dataset=label):
+            ...
+    """
+    hooks = _ACTIVE_HOOKS.get()
+    if not hooks:
+        return _NULL_CONTEXT
+    return _Span(hooks, name, attributes)
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy values and other objects to json serializable values."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class ChromeTraceWriter(TraceHook):
+    """Record spans as events in the chrome trace event format.
+
+    The saved file can be viewed as flame chart in ``chrome://tracing``
+    or https://ui.perfetto.dev.
+    """
+
+    def __init__(self):
+        """Initialize a writer without events."""
+        self.events: list[dict[str, Any]] = []
+        self._start = perf_counter_ns()
+
+    def _add_event(self, phase: str, name: str, attributes: dict[str, Any]):
+        self.events.append(
+            {
+                "name": name,
+                "cat": "glotaran",
+                "ph": phase,
+                "ts": (perf_counter_ns() - self._start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": attributes,
+            }
+        )
+
+    def begin_span(self, name: str, attributes: dict[str, Any]):
+        """Add a begin event.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        attributes: dict[str, Any]
+            Attributes of the span, which are added as ``args`` of the event.
+        """
+        self._add_event("B", name, attributes)
+
+    def end_span(self, name: str, attributes: dict[str, Any]):
+        """Add an end event.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        attributes: dict[str, Any]
+            Attributes of the span, which are added as ``args`` of the event.
+        """
+        self._add_event("E", name, attributes)
+
+    def save(self, path: StrOrPath):
+        """Save the recorded events as json file.
+
+        Parameters
+        ----------
+        path: StrOrPath
+            Path of the trace file.
+        """
+        with Path(path).open("w") as trace_file:
+            json.dump(
+                {"traceEvents": self.events, "displayTimeUnit": "ms"},
+                trace_file,
+                default=_json_default,
+            )